@@ -5,6 +5,33 @@ import socket
 from argparse import ArgumentParser
 
 from hamming_check.hamming import Hamming
+from hamming_check.stream import FramedSender
+
+
+class NoisySender(FramedSender):
+    """
+    Sends the hamming words with random noise, to simulate a noisy link.
+    """
+
+    def __init__(self, *args, double_noise: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.double_noise = double_noise
+
+    def encode(self, data: bytes) -> bytes:
+        encoded_data = bytearray(super().encode(data))
+        bytes_to_send = self._hamming.get_number_of_output_bytes()
+        for offset in range(0, len(encoded_data), bytes_to_send):
+            # 30% chance of sending the data with noise
+            if random() > 0.3:
+                print("Sending data with noise")
+                encoded_data[offset + randint(0, bytes_to_send - 1)] ^= (
+                    1 << randint(0, 7))
+            # if enabled, 50% of chance to add double noise to data
+            if self.double_noise and random() > 0.5:
+                print("Sending data with double noise")
+                encoded_data[offset + randint(0, bytes_to_send - 1)] ^= (
+                    1 << randint(0, 7))
+        return bytes(encoded_data)
 
 
 def main():
@@ -14,6 +41,8 @@ def main():
     parser.add_argument("-f", "--file", type=str)
     parser.add_argument("-b", "--bytes", type=int, default=4096)
     parser.add_argument("-d", "--double-noise", action="store_true")
+    parser.add_argument("-n", "--blocks", type=int, default=256)
+    parser.add_argument("-r", "--retransmit", action="store_true")
     args = parser.parse_args()
 
     # opens the socket connection and the file
@@ -23,23 +52,18 @@ def main():
 
     # Hamming check
     hamming = Hamming(args.bytes)
-    bytes_to_send = hamming.get_number_of_output_bytes()
-
-    # sends the encoded
-    while data := filetosend.read(args.bytes):
-        encoded_data = bytearray(hamming.encode(data))
-        # 30% chance of sending the data with noise
-        if random() > 0.3:
-            print("Sending data with noise")
-            encoded_data[randint(0, bytes_to_send)] ^= 1 << randint(0, 7)
-        # if enabled, 50% of chance to add double noise to data
-        if args.double_noise and random() > 0.5:
-            print("Sending data with double noise")
-            encoded_data[randint(0, bytes_to_send)] ^= 1 << randint(0, 7)
-        s.send(encoded_data)
+
+    # sends the encoded data in frames of many blocks, followed by an end
+    # frame, and then the blocks the server asks for again
+    sender = NoisySender(
+        s,
+        hamming,
+        frame_size=args.blocks * hamming.get_number_of_output_bytes(),
+        retransmit=args.retransmit,
+        double_noise=args.double_noise)
+    sender.send(filetosend)
 
     filetosend.close()
-    s.send(b"DONE")
     print("Done Sending.")
     s.shutdown(2)
     s.close()
@@ -2,7 +2,8 @@
 import socket
 from argparse import ArgumentParser
 
-from hamming_check.hamming import DecodeResult, DecodeStatus, Hamming
+from hamming_check.hamming import DecodeStatus, Hamming
+from hamming_check.stream import FramedReceiver
 from hamming_check.types.verbosity_types import VerbosityTypes
 
 
@@ -12,6 +13,8 @@ def main() -> None:
     parser.add_argument("-p", "--port", type=int, default=8080)
     parser.add_argument("-f", "--file", type=str)
     parser.add_argument("-b", "--bytes", type=int, default=4096)
+    parser.add_argument("-n", "--blocks", type=int, default=256)
+    parser.add_argument("-r", "--retransmit", action="store_true")
     args = parser.parse_args()
 
     # opens socket
@@ -23,30 +26,27 @@ def main() -> None:
 
     # Hamming check
     hamming = Hamming(args.bytes, VerbosityTypes.QUIET)
-    bytes_to_receive = hamming.get_number_of_output_bytes()
-
-    while True:
-        data = c.recv(bytes_to_receive, socket.MSG_WAITALL)
-
-        if data == b"DONE" or len(data) == 0:
-            print("Done Receiving.")
-            break
-
-        encoded_data = hamming.decode(data)
-
-        # if status is not DecodeStatus.NO_ERROR or
-        # DecodeStatus.SINGLE_ERROR_CORRECTED, then we have a problem
-        bytes_received, status = encoded_data.get_data(
-        ), encoded_data.get_status()
-
-        if status == DecodeStatus.SINGLE_ERROR_CORRECTED:
-            print("One error detected, and corrected")
-        elif status == DecodeStatus.DOUBLE_ERROR_DETECTED:
-            print("Two errors detected, your file is corrupted")
-
-        filetodown.write(bytes_received)
-        filetodown.flush()
 
+    # receives the frames up to the end frame, asking again for the blocks
+    # with a double error when --retransmit is given
+    receiver = FramedReceiver(
+        c,
+        hamming,
+        frame_size=args.blocks * hamming.get_number_of_output_bytes(),
+        retransmit=args.retransmit)
+    stats = receiver.receive(filetodown)
+
+    # if status is not DecodeStatus.NO_ERROR or
+    # DecodeStatus.SINGLE_ERROR_CORRECTED, then we have a problem
+    print(f"{stats.statuses[DecodeStatus.SINGLE_ERROR_CORRECTED]} errors "
+          f"detected, and corrected")
+    print(f"{stats.statuses[DecodeStatus.DOUBLE_ERROR_DETECTED]} double "
+          f"errors detected")
+    if receiver.get_double_error_blocks():
+        print(f"{len(receiver.get_double_error_blocks())} blocks are "
+              f"corrupted, your file is corrupted")
+
+    print("Done Receiving.")
     filetodown.close()
     c.shutdown(2)
     c.close()
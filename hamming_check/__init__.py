@@ -7,11 +7,16 @@ to be used as a library and command line tool for checking
 file integrity using the hamming code.
 """
 
-__all__ = ["Hamming", "DecodeResult", "DecodeStatus", "File", "Bytes"]
+__all__ = [
+    "Hamming", "DecodeResult", "DecodeResults", "DecodeStatus", "EncodedFile",
+    "Interleaver", "Tracer", "PrintTracer", "JsonTracer", "BitPacker", "File",
+    "Header", "MappedFile", "Bytes"
+]
 
 __author__ = "Pablo Alessandro Santos Hugen"
 __doc__ = "io package - Various classes for reading and writing data."
 # __import__ = ["Bytes", "File"]
 
-from .hamming import DecodeResult, DecodeStatus, Hamming
-from .io import Bytes, File
+from .hamming import (DecodeResult, DecodeResults, DecodeStatus, EncodedFile,
+                      Hamming, Interleaver, JsonTracer, PrintTracer, Tracer)
+from .io import BitPacker, Bytes, File, Header, MappedFile
@@ -0,0 +1,14 @@
+"""
+bench
+~~~~~~
+
+bench - Throughput benchmark module
+"""
+
+__all__ = ["Bench", "Simulation"]
+
+__author__ = "Pablo Alessandro Santos Hugen"
+__doc__ = "bench - Throughput benchmark module"
+
+from .bench import Bench
+from .simulation import Simulation
@@ -0,0 +1,14 @@
+"""
+bench
+~~~~~~~~~~~~~~
+
+Throughput benchmark of the hamming code.
+"""
+
+__title__ = 'bench'
+__description__ = 'bench module'
+__version__ = '0.1.0'
+__author__ = 'Pablo Alessandro Santos Hugen'
+__author_email__ = 'PabloASHugen@protonmail.com'
+__license__ = 'Apache 2.0'
+__url__ = 'https://github.com/tomcat-42/hamming_check'
@@ -0,0 +1,202 @@
+import json
+from argparse import ArgumentParser, FileType
+from math import ceil
+from platform import python_version
+from random import Random
+from sys import stdout
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from hamming_check.__version__ import __version__
+from hamming_check.hamming import Hamming
+from hamming_check.types import BackendTypes, VerbosityTypes
+
+# operations timed for every buffer size and backend
+OPERATIONS = ["encode", "decode", "decode_1_bit_errors", "decode_2_bit_errors"]
+
+
+class Bench(object):
+    """
+    This class is used to measure the throughput of the hamming code.
+    """
+
+    def __init__(self):
+        """
+        Initialize the benchmark and parse the arguments.
+        """
+        self.parser = ArgumentParser(
+            description="Measure the encoding/decoding throughput of the "
+            "hamming code.")
+        self.args = None
+        self._parse_args()
+
+    def _parse_args(self) -> None:
+
+        self.parser.add_argument(
+            "-b",
+            "--buffer-sizes",
+            type=int,
+            nargs="+",
+            default=[1, 4, 16, 64, 512, 4096],
+            help="buffer sizes (in bytes) to measure",
+        )
+
+        self.parser.add_argument(
+            "--backends",
+            nargs="+",
+            choices=[
+                backend.value for backend in BackendTypes
+                if backend != BackendTypes.AUTO
+            ],
+            default=None,
+            help="backends to measure (by default every available backend)",
+        )
+
+        self.parser.add_argument(
+            "-s",
+            "--size",
+            type=int,
+            default=1 << 20,
+            help="number of data bytes coded by each measure",
+        )
+
+        self.parser.add_argument(
+            "-r",
+            "--repeat",
+            type=int,
+            default=3,
+            help="number of times each measure is repeated, the best is kept",
+        )
+
+        self.parser.add_argument(
+            "-o",
+            "--output",
+            type=FileType("w"),
+            default=stdout,
+            help="file used for writing the JSON results. If not specified, "
+            "they are written to stdout.",
+        )
+
+        self.args = self.parser.parse_args()
+
+    def run(self) -> int:
+        """
+        Run every measure and write the results.
+        :return: int.
+        """
+        data = Random(0).randbytes(self.args.size)
+
+        results = []
+        for buffer_size in self.args.buffer_sizes:
+            for backend in self._get_backends(buffer_size):
+                results += self._measure(
+                    Hamming(buffer_size, VerbosityTypes.QUIET, backend), data)
+
+        json.dump(
+            {
+                "version": __version__,
+                "python": python_version(),
+                "size": self.args.size,
+                "results": results,
+            },
+            self.args.output,
+            indent=2)
+        self.args.output.write("\n")
+        if self.args.output is not stdout:
+            self._print_results(results)
+            self.args.output.close()
+
+        return 0
+
+    def _get_backends(self, buffer_size: int) -> List[BackendTypes]:
+        """
+        Get the backends to measure that can code a buffer size.
+        :return: List[BackendTypes].
+        """
+        backends = []
+        for backend in (self.args.backends or [
+                backend for backend in BackendTypes
+                if backend != BackendTypes.AUTO
+        ]):
+            try:
+                Hamming(buffer_size, VerbosityTypes.QUIET, backend)
+            except ValueError:
+                continue
+            backends.append(BackendTypes(backend))
+        return backends
+
+    @staticmethod
+    def _add_errors(hamming: Hamming, encoded_data: bytes,
+                    number_of_errors: int) -> bytes:
+        """
+        Flip number_of_errors adjacent bits in every hamming word.
+        :return: bytes.
+        """
+        number_of_output_bytes = hamming.get_number_of_output_bytes()
+        # the flipped bits are always inside the hamming word, never in the
+        # padding of its last byte
+        number_of_full_bytes = hamming.get_number_of_output_bits() // 8
+        mask = (1 << number_of_errors) - 1
+
+        corrupted = bytearray(encoded_data)
+        for (i, offset) in enumerate(
+                range(0, len(corrupted), number_of_output_bytes)):
+            corrupted[offset + i % number_of_full_bytes] ^= mask
+        return bytes(corrupted)
+
+    def _measure(self, hamming: Hamming, data: bytes) -> List[Dict]:
+        """
+        Measure every operation on a hamming code.
+        :return: List[Dict].
+        """
+        encoded_data = hamming.encode_many(data)
+        inputs = {
+            "encode": (hamming.encode_many, data),
+            "decode": (hamming.decode_many, encoded_data),
+            "decode_1_bit_errors": (hamming.decode_many,
+                                    self._add_errors(hamming, encoded_data,
+                                                     1)),
+            "decode_2_bit_errors": (hamming.decode_many,
+                                    self._add_errors(hamming, encoded_data,
+                                                     2)),
+        }
+
+        number_of_blocks = ceil(len(data) / hamming.get_buffer_size())
+        results = []
+        for operation in OPERATIONS:
+            (code, operation_data) = inputs[operation]
+            seconds = self._time(lambda: code(operation_data))
+            results.append({
+                "buffer_size": hamming.get_buffer_size(),
+                "backend": hamming.get_backend().value,
+                "operation": operation,
+                "seconds": seconds,
+                "mb_per_s": len(data) / seconds / 1e6,
+                "blocks_per_s": number_of_blocks / seconds,
+            })
+        return results
+
+    def _time(self, function: Callable[[], object]) -> float:
+        """
+        Get the best time of --repeat runs of a function.
+        :return: float.
+        """
+        best = float("inf")
+        for _ in range(self.args.repeat):
+            start = perf_counter()
+            function()
+            best = min(best, perf_counter() - start)
+        return best
+
+    @staticmethod
+    def _print_results(results: List[Dict]) -> None:
+        """
+        Print the results as a table.
+        :return: None.
+        """
+        print(f"{'buffer size':>11} {'backend':>8} {'operation':>20} "
+              f"{'MB/s':>10} {'blocks/s':>12}")
+        for result in results:
+            print(f"{result['buffer_size']:>11} {result['backend']:>8} "
+                  f"{result['operation']:>20} {result['mb_per_s']:>10.2f} "
+                  f"{result['blocks_per_s']:>12.0f}")
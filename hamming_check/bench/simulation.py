@@ -0,0 +1,331 @@
+import json
+from argparse import ArgumentParser, FileType
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from math import sqrt
+from os import cpu_count
+from platform import python_version
+from random import Random
+from statistics import NormalDist
+from sys import stdout
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from hamming_check.__version__ import __version__
+from hamming_check.hamming import DecodeStatus, Hamming
+from hamming_check.types import BackendTypes, LayoutTypes, VerbosityTypes
+from hamming_check.utils import ErrorInjector
+
+# approximate number of encoded bytes of the blocks of each task
+TASK_SIZE = 1 << 18
+
+# number of blocks compared at once to the original data
+BLOCKS_PER_RUN = 64
+
+# rates reported for every buffer size and bit error rate
+RATES = [
+    "no_error", "single_error_corrected", "double_error_detected",
+    "undetected_corruption"
+]
+
+# hamming codes of a worker process, by buffer size and backend
+_hamming_codes = {}
+
+
+def _simulate_task(buffer_size: int, backend: BackendTypes, channel: str,
+                   bit_error_rate: float, burst_length: int,
+                   number_of_blocks: int, seed: int) -> Dict[str, float]:
+    """
+    Send random blocks through the channel, and count the blocks by decode
+    status, and the blocks decoded with wrong data but no double error.
+    """
+    if (buffer_size, backend) not in _hamming_codes:
+        _hamming_codes[(buffer_size, backend)] = Hamming(
+            buffer_size, VerbosityTypes.QUIET, backend, LayoutTypes.PACKED)
+    hamming = _hamming_codes[(buffer_size, backend)]
+
+    data = Random(seed).randbytes(number_of_blocks * buffer_size)
+    start = perf_counter()
+    encoded_data = bytearray(hamming.encode_many(data))
+    code_time = perf_counter() - start
+
+    # the packed layout sends the hamming words bit after bit, so the
+    # channel only hits bits of the code
+    error_injector = ErrorInjector(seed)
+    if channel == "burst":
+        error_injector.inject_bursts(encoded_data,
+                                     bit_error_rate / burst_length,
+                                     burst_length)
+    else:
+        error_injector.inject_bsc(encoded_data, bit_error_rate)
+
+    start = perf_counter()
+    results = hamming.decode_many(encoded_data)
+    code_time += perf_counter() - start
+
+    # the decoded data is compared to the original data by runs of blocks,
+    # and only the runs that differ are compared block by block
+    (decoded_data, statuses) = results
+    undetected_corruption = 0
+    run_size = BLOCKS_PER_RUN * buffer_size
+    for run_start in range(0, len(data), run_size):
+        run_end = run_start + run_size
+        if decoded_data[run_start:run_end] == data[run_start:run_end]:
+            continue
+        for start in range(run_start, min(run_end, len(data)), buffer_size):
+            end = start + buffer_size
+            if (statuses[start // buffer_size] !=
+                    DecodeStatus.DOUBLE_ERROR_DETECTED
+                    and decoded_data[start:end] != data[start:end]):
+                undetected_corruption += 1
+
+    return {
+        "blocks": number_of_blocks,
+        "flipped_bits": len(error_injector.get_log()),
+        "no_error": results.count(DecodeStatus.NO_ERROR),
+        "single_error_corrected":
+        results.count(DecodeStatus.SINGLE_ERROR_CORRECTED),
+        "double_error_detected":
+        results.count(DecodeStatus.DOUBLE_ERROR_DETECTED),
+        "undetected_corruption": undetected_corruption,
+        "code_time": code_time,
+    }
+
+
+class Simulation(object):
+    """
+    This class is used to estimate the decode statuses rates of the hamming
+    code over a noisy channel by Monte Carlo simulation.
+    """
+
+    def __init__(self):
+        """
+        Initialize the simulation and parse the arguments.
+        """
+        self.parser = ArgumentParser(
+            description="Estimate the decode statuses rates and the "
+            "throughput of the hamming code over a noisy channel.")
+        self.args = None
+        self._parse_args()
+
+    def _parse_args(self) -> None:
+
+        self.parser.add_argument(
+            "-b",
+            "--buffer-sizes",
+            type=int,
+            nargs="+",
+            default=[1, 4, 16, 64],
+            help="buffer sizes (in bytes) to simulate",
+        )
+
+        self.parser.add_argument(
+            "--ber",
+            type=float,
+            nargs="+",
+            default=[1e-4, 1e-3],
+            help="bit error rates of the channel to simulate",
+        )
+
+        self.parser.add_argument(
+            "--channel",
+            choices=["bsc", "burst"],
+            default="bsc",
+            help="model of the channel: bsc flips every bit independently, "
+            "burst flips bursts of --burst-length bits (default bsc)",
+        )
+
+        self.parser.add_argument(
+            "--burst-length",
+            type=int,
+            default=4,
+            help="number of consecutive bits flipped by each burst",
+        )
+
+        self.parser.add_argument(
+            "-n",
+            "--blocks",
+            type=int,
+            default=100000,
+            help="number of blocks sent through the channel for every buffer "
+            "size and bit error rate",
+        )
+
+        self.parser.add_argument(
+            "--backend",
+            choices=[backend.value for backend in BackendTypes],
+            default=BackendTypes.AUTO.value,
+            help="backend used for encoding/decoding",
+        )
+
+        self.parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=cpu_count() or 1,
+            help="number of processes simulating the blocks (by default the "
+            "number of cpus)",
+        )
+
+        self.parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="seed of the blocks and errors, the results of a seed do not "
+            "depend on --jobs",
+        )
+
+        self.parser.add_argument(
+            "--confidence",
+            type=float,
+            default=0.95,
+            help="confidence level of the intervals of the rates",
+        )
+
+        self.parser.add_argument(
+            "-o",
+            "--output",
+            type=FileType("w"),
+            default=stdout,
+            help="file used for writing the JSON results. If not specified, "
+            "they are written to stdout.",
+        )
+
+        self.args = self.parser.parse_args()
+        if self.args.blocks < 1:
+            self.parser.error("--blocks must be at least 1")
+        if self.args.jobs < 1:
+            self.parser.error("--jobs must be at least 1")
+        if self.args.burst_length < 1:
+            self.parser.error("--burst-length must be at least 1")
+        if not 0 < self.args.confidence < 1:
+            self.parser.error("--confidence must be in (0, 1)")
+        if any(not 0 <= ber < 1 for ber in self.args.ber):
+            self.parser.error("--ber must be in [0, 1)")
+
+    def run(self) -> int:
+        """
+        Run every simulation and write the results.
+        :return: int.
+        """
+        z = NormalDist().inv_cdf((1 + self.args.confidence) / 2)
+
+        results = []
+        with ProcessPoolExecutor(self.args.jobs) as pool:
+            for buffer_size in self.args.buffer_sizes:
+                for bit_error_rate in self.args.ber:
+                    results.append(
+                        self._simulate(pool, buffer_size, bit_error_rate, z))
+
+        json.dump(
+            {
+                "version": __version__,
+                "python": python_version(),
+                "channel": self.args.channel,
+                "burst_length": self.args.burst_length,
+                "seed": self.args.seed,
+                "confidence": self.args.confidence,
+                "results": results,
+            },
+            self.args.output,
+            indent=2)
+        self.args.output.write("\n")
+        if self.args.output is not stdout:
+            self._print_results(results)
+            self.args.output.close()
+
+        return 0
+
+    def _get_tasks(self, buffer_size: int,
+                   bit_error_rate: float) -> List[Tuple]:
+        """
+        Split the blocks of a simulation into tasks, each with its own seed.
+        :return: List[Tuple].
+        """
+        number_of_output_bytes = Hamming(
+            buffer_size, VerbosityTypes.QUIET,
+            self.args.backend).get_number_of_output_bytes()
+        blocks_per_task = max(1, TASK_SIZE // number_of_output_bytes)
+
+        tasks = []
+        for (i, first) in enumerate(
+                range(0, self.args.blocks, blocks_per_task)):
+            seed = int.from_bytes(sha256(
+                f"{self.args.seed}-{buffer_size}-{bit_error_rate}-{i}".encode(
+                )).digest()[:8],
+                                  byteorder="little")
+            tasks.append(
+                (buffer_size, BackendTypes(self.args.backend),
+                 self.args.channel, bit_error_rate, self.args.burst_length,
+                 min(blocks_per_task, self.args.blocks - first), seed))
+        return tasks
+
+    def _simulate(self, pool: ProcessPoolExecutor, buffer_size: int,
+                  bit_error_rate: float, z: float) -> Dict:
+        """
+        Simulate a buffer size at a bit error rate.
+        :return: Dict.
+        """
+        start = perf_counter()
+        tasks = self._get_tasks(buffer_size, bit_error_rate)
+        counts = {}
+        for task_counts in pool.map(_simulate_task, *zip(*tasks)):
+            for (name, count) in task_counts.items():
+                counts[name] = counts.get(name, 0) + count
+        seconds = perf_counter() - start
+
+        result = {
+            "buffer_size": buffer_size,
+            "ber": bit_error_rate,
+            "blocks": counts["blocks"],
+            "flipped_bits": counts["flipped_bits"],
+        }
+        for rate in RATES:
+            (low, high) = self._wilson_interval(counts[rate],
+                                                counts["blocks"], z)
+            result[rate] = {
+                "count": counts[rate],
+                "rate": counts[rate] / counts["blocks"],
+                "low": low,
+                "high": high,
+            }
+        result.update({
+            "seconds": seconds,
+            "mb_per_s": counts["blocks"] * buffer_size / seconds / 1e6,
+            "blocks_per_s": counts["blocks"] / seconds,
+            "code_mb_per_s": (counts["blocks"] * buffer_size /
+                              max(counts["code_time"], 1e-9) / 1e6),
+        })
+        return result
+
+    @staticmethod
+    def _wilson_interval(successes: int, trials: int,
+                         z: float) -> Tuple[float, float]:
+        """
+        Get the Wilson score interval of a binomial proportion, that holds
+        for rates near 0 too.
+        :return: Tuple[float, float].
+        """
+        rate = successes / trials
+        denominator = 1 + z * z / trials
+        center = (rate + z * z / (2 * trials)) / denominator
+        half_width = z * sqrt(rate * (1 - rate) / trials + z * z /
+                              (4 * trials * trials)) / denominator
+        return max(0.0, center - half_width), min(1.0, center + half_width)
+
+    @staticmethod
+    def _print_results(results: List[Dict]) -> None:
+        """
+        Print the results as a table.
+        :return: None.
+        """
+        print(f"{'buffer size':>11} {'ber':>8} {'single':>10} "
+              f"{'double':>10} {'undetected':>10} {'upper bound':>11} "
+              f"{'MB/s':>8}")
+        for result in results:
+            print(f"{result['buffer_size']:>11} {result['ber']:>8.1e} "
+                  f"{result['single_error_corrected']['rate']:>10.2e} "
+                  f"{result['double_error_detected']['rate']:>10.2e} "
+                  f"{result['undetected_corruption']['rate']:>10.2e} "
+                  f"{result['undetected_corruption']['high']:>11.2e} "
+                  f"{result['mb_per_s']:>8.2f}")
@@ -1,11 +1,49 @@
 import builtins as exceptions
+import os
 from argparse import ArgumentParser, FileType
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from copy import Error
+from io import BufferedReader
+from math import ceil
 from sys import stderr, stdin, stdout
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 
-from hamming_check.hamming import DecodeResult, DecodeStatus, Hamming
-from hamming_check.io import File
-from hamming_check.types import VerbosityTypes
+from hamming_check.hamming import (DecodeResult, DecodeStatus, EncodedFile,
+                                   Hamming, Interleaver, JsonTracer,
+                                   PrintTracer)
+from hamming_check.io import (BitPacker, File, Header, MappedFile,
+                              PrefixedReader)
+from hamming_check.types import BackendTypes, LayoutTypes, VerbosityTypes
+from hamming_check.utils import Stats
+
+# approximate number of bytes handed to the hamming code per call
+CHUNK_SIZE = 1 << 20
+
+# hamming code of each --jobs worker process
+_worker_hamming = None
+
+
+def _init_worker(buffer_size: int, backend: BackendTypes, layout: LayoutTypes,
+                 interleave_depth: int, cache_dir: Optional[str]) -> None:
+    """
+    Build the hamming code of a worker process.
+    """
+    global _worker_hamming
+    _worker_hamming = Hamming(buffer_size,
+                              VerbosityTypes.QUIET,
+                              backend,
+                              layout,
+                              interleave_depth,
+                              cache_dir=cache_dir)
+
+
+def _run_in_worker(method: str, data: bytes) -> Any:
+    """
+    Run a hamming code method in a worker process.
+    """
+    return getattr(_worker_hamming, method)(data)
 
 
 class Cli(object):
@@ -54,6 +92,21 @@ class Cli(object):
             action="store_true",
             help="decode a hamming-encoded file into a file",
         )
+        group.add_argument(
+            "--verify",
+            action="store_true",
+            help="check a hamming-encoded file for damaged blocks without "
+            "decoding it or writing anything, exiting with 2 when a block "
+            "has a double error and with 3 when blocks only have single "
+            "errors",
+        )
+        group.add_argument(
+            "--repair",
+            action="store_true",
+            help="check a hamming-encoded file for damaged blocks, and flip "
+            "back the bad bit of the blocks with a single error in place, "
+            "exiting with 2 when a block has a double error",
+        )
 
         self.parser.add_argument(
             "-v",
@@ -71,16 +124,173 @@ class Cli(object):
             help="change the buffer size (in bytes) used for encoding/decoding",
         )
 
+        self.parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="number of processes used for encoding/decoding",
+        )
+
+        self.parser.add_argument(
+            "--backend",
+            choices=[backend.value for backend in BackendTypes],
+            default=BackendTypes.AUTO.value,
+            help="change the backend used for encoding/decoding many blocks "
+            "at once (by default table for buffer sizes up to 15 bytes, "
+            "else numpy when installed)",
+        )
+
+        self.parser.add_argument(
+            "--layout",
+            choices=[layout.value for layout in LayoutTypes],
+            default=LayoutTypes.PADDED.value,
+            help="change the layout of the encoded data: padded rounds every "
+            "hamming word up to whole bytes, packed concatenates them bit "
+            "after bit for a smaller encoded file",
+        )
+
+        self.parser.add_argument(
+            "-i",
+            "--interleave",
+            type=int,
+            default=1,
+            help="interleave the bits of this number of hamming words, so "
+            "burst errors shorter than it are corrected (needs the padded "
+            "layout)",
+        )
+
+        self.parser.add_argument(
+            "--header",
+            action="store_true",
+            help="write a header describing the encoded data, so it is "
+            "decoded without the --buffer-size and --layout options and "
+            "without the padding of the last block",
+        )
+
+        self.parser.add_argument(
+            "--offset",
+            type=int,
+            default=0,
+            help="decode only the original data from this byte offset, "
+            "seeking straight to the blocks covering it",
+        )
+
+        self.parser.add_argument(
+            "--length",
+            type=int,
+            default=None,
+            help="decode only this number of bytes of the original data",
+        )
+
+        self.parser.add_argument(
+            "--stats",
+            nargs="?",
+            const="text",
+            choices=["json", "text"],
+            help="print the number of blocks by decode status, the bytes in "
+            "and out, and the time spent reading, coding and writing to "
+            "stderr, as text (default) or json",
+        )
+
+        self.parser.add_argument(
+            "--trace",
+            type=FileType("w"),
+            default=None,
+            help="file used for writing the steps taken to encode/decode "
+            "each block, one JSON object per line",
+        )
+
+        self.parser.add_argument(
+            "--trace-every",
+            type=int,
+            default=1,
+            help="trace only 1 in this number of blocks, with --trace or "
+            "-vvv",
+        )
+
+        self.parser.add_argument(
+            "--cache-dir",
+            default=os.environ.get("HAMMING_CHECK_CACHE_DIR"),
+            help="directory used for caching the tables of the hamming code, "
+            "so they are loaded instead of built on the next runs (by "
+            "default $HAMMING_CHECK_CACHE_DIR, if set)",
+        )
+
         self.args = self.parser.parse_args()
-        self.hamming = Hamming(self.args.buffer_size, self.args.verbose)
+        self.stats = Stats()
+        if not self.args.decode and (self.args.offset
+                                     or self.args.length is not None):
+            self.parser.error("--offset and --length can only be used "
+                              "with --decode")
+        if ((self.args.verify or self.args.repair)
+                and self.args.output_file is not stdout.buffer):
+            self.parser.error("--verify and --repair write no output file")
+        if self.args.interleave < 1:
+            self.parser.error("--interleave must be at least 1")
+        if (self.args.interleave > 1
+                and self.args.layout == LayoutTypes.PACKED.value):
+            self.parser.error("--interleave needs the padded layout")
+        if self.args.trace_every < 1:
+            self.parser.error("--trace-every must be at least 1")
+
+        # a single tracer, so the sampling goes on when the header rebuilds
+        # the hamming code. The -vvv steps are printed block by block along
+        # with the results, so they are not traced by the hamming code
+        self.tracer = None
+        self.steps_tracer = None
+        if self.args.trace:
+            self.tracer = JsonTracer(self.args.trace, self.args.trace_every)
+        elif self.args.verbose >= VerbosityTypes.HAMMING_STEPS:
+            self.steps_tracer = PrintTracer(self.args.trace_every)
+        self._set_hamming(self.args.buffer_size, self.args.layout,
+                          self.args.interleave)
+
+    def _set_hamming(self, buffer_size: int, layout: LayoutTypes,
+                     interleave_depth: int) -> None:
+        """
+        Build the hamming code and the size of the chunks of blocks.
+        :return: None.
+        """
+        self.buffer_size = buffer_size
+        self.hamming = Hamming(buffer_size, self.args.verbose,
+                               self.args.backend, layout, interleave_depth,
+                               cache_dir=self.args.cache_dir).set_tracer(
+                                   self.tracer)
         self.number_of_output_bytes = self.hamming.get_number_of_output_bytes()
+        # chunks hold a multiple of 8 blocks, so packed chunks always end
+        # on a byte boundary, and of the interleave depth, so no group of
+        # interleaved blocks is split
+        blocks_per_group = 8 * interleave_depth
+        self.blocks_per_chunk = max(
+            blocks_per_group, CHUNK_SIZE // self.number_of_output_bytes //
+            blocks_per_group * blocks_per_group)
+        self.packer = (BitPacker(self.hamming.get_number_of_output_bits(),
+                                 self.number_of_output_bytes)
+                       if self.hamming.get_layout() == LayoutTypes.PACKED
+                       else None)
+        self.interleaver = (Interleaver(interleave_depth,
+                                        self.number_of_output_bytes)
+                            if interleave_depth > 1 else None)
 
     def run(self) -> int:
         """
         Run the command line interface.
         :return: int.
         """
-        return self.decode() if self.args.decode else self.encode()
+        if self.args.verify or self.args.repair:
+            exit_value = self.verify()
+        else:
+            exit_value = self.decode() if self.args.decode else self.encode()
+        if self.args.trace:
+            self.args.trace.close()
+
+        if self.args.stats == "json":
+            stderr.write(self.stats.to_json() + "\n")
+        elif self.args.stats:
+            stderr.write(self.stats.to_text() + "\n")
+
+        return exit_value
 
     def encode(self) -> None:
         """
@@ -88,33 +298,53 @@ class Cli(object):
         :return: None.
         """
         exit_value = 0
+        header_size = Header.SIZE if self.args.header else 0
 
-        input_file = File(self.args.input_file, self.args.buffer_size)
-        output_file = File(self.args.output_file)
+        try:
+            (input_file, output_file) = self._open_files(
+                self.blocks_per_chunk * self.buffer_size,
+                lambda size: header_size + self.hamming.get_encoded_size(size))
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error opening the files: {e}!\n")
+            self.args.input_file.close()
+            self.args.output_file.close()
+            return 1
 
         try:
-            for (index, data) in enumerate(input_file):
-                encoded_data = self.hamming.encode(data)
+            header = None
+            if self.args.header:
+                # the length of a stream is only known once it is read
+                header = Header(
+                    self.buffer_size, self.hamming.get_layout(),
+                    input_file.get_size()
+                    if isinstance(input_file, MappedFile) else None,
+                    self.hamming.get_interleave_depth())
+                self._write(output_file, header.to_bytes())
+
+            for (index, (data, encoded_data)) in enumerate(
+                    self._map_chunks("encode_many", input_file)):
                 if self.args.verbose >= VerbosityTypes.DECODE_ENCODE_RESULTS:
-                    print(f"{index}: Encoded {data} -> {encoded_data}")
-                output_file.write(encoded_data)
-        except KeyboardInterrupt as e:
-            print(f"\n\nBye!")
-        except FileReadError as e:
-            stderr.write(f"Error Reading file!\n")
-            exit_value = 1
-        except FileWriteError as e:
-            stderr.write(f"Error Writing file!\n")
-            exit_value = 1
+                    self._print_encoded(index * self.blocks_per_chunk, data,
+                                        encoded_data)
+                self.stats.blocks += ceil(len(data) / self.buffer_size)
+                self._write(output_file, encoded_data)
+
+            if header and header.length is None and output_file.seekable():
+                output_file.write_at(
+                    Header.LENGTH_OFFSET,
+                    Header.length_to_bytes(self.stats.bytes_in))
         except KeyboardInterrupt:
-            print("\nInterrupted by user, bye!")
+            print("\n\nBye!")
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error encoding data: {e}!\n")
+            exit_value = 1
         except Error:
             stderr.write(f"Error encoding data!\nCheck the --buffer-size "
                          f"option and the i/o files!\n")
             exit_value = 1
         finally:
-            self.args.input_file.close()
-            self.args.output_file.close()
+            input_file.close()
+            output_file.close()
 
         return exit_value
 
@@ -123,39 +353,388 @@ class Cli(object):
         Decode the input stream to the output stream.
         :return: None.
         """
+        if self.args.offset or self.args.length is not None:
+            return self._decode_range()
+
         exit_value = 0
+
+        # a header overrides the --buffer-size and --layout options
+        try:
+            header = self._read_header()
+        except ValueError as e:
+            stderr.write(f"Error reading the header: {e}!\n")
+            self.args.input_file.close()
+            self.args.output_file.close()
+            return 1
+        if header:
+            self._set_hamming(header.buffer_size, header.layout,
+                              header.depth)
+        remaining = header.length if header else None
+
+        def get_output_size(size: int) -> int:
+            decoded_size = self.hamming.get_decoded_size(size)
+            return (decoded_size
+                    if remaining is None else min(decoded_size, remaining))
+
         try:
-            input_file = File(self.args.input_file,
-                              self.number_of_output_bytes)
-            output_file = File(self.args.output_file)
+            (input_file, output_file) = self._open_files(
+                self.hamming.get_encoded_size(self.blocks_per_chunk *
+                                              self.buffer_size),
+                get_output_size)
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error opening the files: {e}!\n")
+            self.args.input_file.close()
+            self.args.output_file.close()
+            return 1
 
-            for (index, data) in enumerate(input_file):
-                decoded_result = self.hamming.decode(data)
-                decoded_data, decoded_result = (
-                    decoded_result.get_data(),
-                    decoded_result.get_status(),
-                )
+        try:
+            for (index, (data, (decoded_data, decoded_results))) in enumerate(
+                    self._map_chunks("decode_many", input_file)):
 
-                if self.args.verbose >= VerbosityTypes.DECODE_ENCODE_RESULTS:
-                    print(f"{index}: Decoded {data} -> {decoded_data}",
-                          end=", ")
-                    if decoded_result == DecodeStatus.NO_ERROR:
-                        print("No Errors Detected")
-                    elif decoded_result == DecodeStatus.SINGLE_ERROR_CORRECTED:
-                        print("Single Error Corrected")
-                if (self.args.verbose >= VerbosityTypes.ONLY_ERRORS and
-                        decoded_result == DecodeStatus.DOUBLE_ERROR_DETECTED):
-                    print(f"{index}: Decoded {data} -> {decoded_data}, "
-                          f"Double Error Detected")
+                if self.args.verbose >= VerbosityTypes.ONLY_ERRORS:
+                    self._print_decoded(index * self.blocks_per_chunk, data,
+                                        decoded_data, decoded_results)
+                if DecodeStatus.DOUBLE_ERROR_DETECTED in decoded_results:
                     exit_value = 2
+                self.stats.add_statuses(decoded_results)
 
-                output_file.write(decoded_data)
+                # the padding of the last block is trimmed away
+                if remaining is not None:
+                    decoded_data = decoded_data[:remaining]
+                    remaining -= len(decoded_data)
+                self._write(output_file, decoded_data)
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error decoding data: {e}!\n")
+            exit_value = 1
         except Error:
             stderr.write(f"Error decoding data!\nCheck the --buffer-size "
                          f"option and the i/o files!\n")
             exit_value = 1
         finally:
+            input_file.close()
+            output_file.close()
+
+        return exit_value
+
+    def verify(self) -> int:
+        """
+        Check the input stream for damaged blocks, computing only the
+        syndrome and the global parity of each block, and write a summary
+        to stderr. With --repair, the input file is mapped read-write and
+        the bad bit of every block with a single error is flipped back in
+        place, so only the pages of the damaged blocks are written.
+        :return: int.
+        """
+        exit_value = 0
+
+        # a header overrides the --buffer-size and --layout options
+        try:
+            header = self._read_header()
+        except ValueError as e:
+            stderr.write(f"Error reading the header: {e}!\n")
             self.args.input_file.close()
-            self.args.output_file.close()
+            return 1
+        if header:
+            self._set_hamming(header.buffer_size, header.layout,
+                              header.depth)
+
+        bytes_per_read = self.hamming.get_encoded_size(self.blocks_per_chunk *
+                                                       self.buffer_size)
+        if self.args.repair and not MappedFile.can_map(self.args.input_file):
+            stderr.write("Error repairing data: the input must be a regular "
+                         "file!\n")
+            self.args.input_file.close()
+            return 1
+        input_file = (MappedFile(self.args.input_file,
+                                 bytes_per_read,
+                                 writable=self.args.repair)
+                      if MappedFile.can_map(self.args.input_file) else File(
+                          self.args.input_file, bytes_per_read))
+
+        try:
+            for (index, (_, results)) in enumerate(
+                    self._map_chunks("verify_many", input_file)):
+                self.stats.add_statuses(results.get_statuses())
+                first_block = index * self.blocks_per_chunk
+                if self.args.repair:
+                    for (i, bit) in results.get_corrected_bits():
+                        input_file.flip_bit(
+                            index * bytes_per_read * 8 +
+                            self.hamming.get_bit_offset(
+                                i, bit, results.get_number_of_blocks()))
+                if self.args.verbose >= VerbosityTypes.DECODE_ENCODE_RESULTS:
+                    for (i, bit) in results.get_corrected_bits():
+                        print(f"{first_block + i}: Single Error in bit {bit}")
+                if self.args.verbose >= VerbosityTypes.ONLY_ERRORS:
+                    for i in results.double_error_indexes():
+                        print(f"{first_block + i}: Double Error Detected")
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error verifying data: {e}!\n")
+            exit_value = 1
+        finally:
+            input_file.close()
+
+        single_errors = self.stats.statuses[
+            DecodeStatus.SINGLE_ERROR_CORRECTED]
+        double_errors = self.stats.statuses[DecodeStatus.DOUBLE_ERROR_DETECTED]
+        if self.args.repair:
+            if not exit_value:
+                exit_value = 2 if double_errors else 0
+            if not self.args.stats:
+                stderr.write(f"Repaired {single_errors} of "
+                             f"{self.stats.blocks} blocks, "
+                             f"{double_errors} with a double error could "
+                             f"not be repaired\n")
+            return exit_value
 
+        if not exit_value:
+            exit_value = 2 if double_errors else 3 if single_errors else 0
+        if not self.args.stats:
+            stderr.write(f"Verified {self.stats.blocks} blocks: "
+                         f"{single_errors} with a single error, "
+                         f"{double_errors} with a double error\n")
         return exit_value
+
+    def _decode_range(self) -> int:
+        """
+        Decode only the --offset/--length byte range of the original data,
+        reading just the blocks covering it.
+        :return: int.
+        """
+        exit_value = 0
+        output_file = File(self.args.output_file)
+
+        try:
+            encoded_file = EncodedFile(self.args.input_file,
+                                       self.args.buffer_size,
+                                       self.args.layout, self.args.backend,
+                                       self.args.interleave,
+                                       self.args.cache_dir)
+            buffer_size = encoded_file.get_buffer_size()
+            end = encoded_file.get_size()
+            if self.args.length is not None:
+                end = min(end, self.args.offset + self.args.length)
+
+            # chunks end on whole groups of blocks, so no block is read twice
+            blocks_per_group = encoded_file.get_blocks_per_group()
+            chunk_size = max(
+                blocks_per_group, CHUNK_SIZE // buffer_size //
+                blocks_per_group * blocks_per_group) * buffer_size
+            offset = self.args.offset
+            while offset < end:
+                chunk_end = min(end, (offset // chunk_size + 1) * chunk_size)
+                start = perf_counter()
+                results = encoded_file.decode_range(offset,
+                                                    chunk_end - offset)
+                # reading and decoding the range are timed together
+                self.stats.code_time += perf_counter() - start
+                self.stats.add_statuses(results.get_statuses())
+
+                double_error_indexes = results.double_error_indexes()
+                if double_error_indexes:
+                    exit_value = 2
+                if self.args.verbose >= VerbosityTypes.ONLY_ERRORS:
+                    for i in double_error_indexes:
+                        print(f"{offset // buffer_size + i}: "
+                              f"Double Error Detected")
+
+                self._write(output_file, results.get_data())
+                offset = chunk_end
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error decoding data: {e}!\n")
+            exit_value = 1
+        finally:
+            self.args.input_file.close()
+            output_file.close()
+
+        return exit_value
+
+    def _write(self, output_file: Union[File, MappedFile],
+               data: bytes) -> None:
+        """
+        Write data to the output file, counting its bytes and write time.
+        :return: None.
+        """
+        start = perf_counter()
+        output_file.write(data)
+        self.stats.write_time += perf_counter() - start
+        self.stats.bytes_out += len(data)
+
+    def _read_chunks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Iterate the chunks, counting their bytes and read time.
+        :return: Iterator[bytes].
+        """
+        chunks = iter(chunks)
+        while True:
+            start = perf_counter()
+            data = next(chunks, None)
+            self.stats.read_time += perf_counter() - start
+            if data is None:
+                return
+            self.stats.bytes_in += len(data)
+            yield data
+
+    def _read_header(self) -> Optional[Header]:
+        """
+        Read the header of the input file, if it starts with one.
+        :return: Optional[Header].
+        """
+        input_file = self.args.input_file
+        data = input_file.peek(Header.SIZE)[:Header.SIZE]
+        magic = bytes(data[:len(Header.MAGIC)])
+
+        # a pipe may hold only the first bytes of the header for now, so
+        # when they could start one the whole header is read, and the bytes
+        # read past it are put back in front of the input
+        if (len(data) < Header.SIZE and data
+                and Header.MAGIC.startswith(magic)):
+            data = input_file.read(Header.SIZE)
+            header = (Header.from_bytes(data)
+                      if Header.is_header(data) else None)
+            rest = data[header.get_size():] if header else data
+            if rest:
+                self.args.input_file = BufferedReader(
+                    PrefixedReader(rest, input_file))
+            return header
+
+        if not Header.is_header(data):
+            return None
+        header = Header.from_bytes(data)
+        input_file.read(header.get_size())
+        return header
+
+    def _open_files(
+        self, bytes_per_read: int, get_output_size: Callable[[int], int]
+    ) -> Tuple[Union[File, MappedFile], Union[File, MappedFile]]:
+        """
+        Open the input and output files for reading and writing chunks of
+        blocks. Regular files are memory mapped, with the output mapped to
+        the exact size of the coded input, and anything else is streamed.
+        :return: Tuple[Union[File, MappedFile], Union[File, MappedFile]].
+        """
+        if (MappedFile.can_map(self.args.input_file)
+                and MappedFile.can_map(self.args.output_file)):
+            input_file = MappedFile(self.args.input_file, bytes_per_read)
+            output_file = MappedFile(
+                self.args.output_file,
+                size=get_output_size(input_file.get_size()))
+            return input_file, output_file
+
+        return (File(self.args.input_file, bytes_per_read),
+                File(self.args.output_file))
+
+    def _map_chunks(self, method: str,
+                    chunks: Iterable[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        """
+        Run a hamming code method on every chunk, in a pool of --jobs
+        processes when asked to. The results are yielded in input order,
+        with at most two chunks per process in flight. The time handing
+        the chunks to the pool and waiting for it is counted as coding
+        time.
+        :return: Iterator[Tuple[bytes, Any]].
+        """
+        chunks = self._read_chunks(chunks)
+
+        # the blocks are traced in order by this process
+        if self.args.jobs <= 1 or self.tracer is not None:
+            code = getattr(self.hamming, method)
+            for data in chunks:
+                start = perf_counter()
+                result = code(data)
+                self.stats.code_time += perf_counter() - start
+                yield data, result
+            return
+
+        initargs = (self.buffer_size, self.hamming.get_backend(),
+                    self.hamming.get_layout(),
+                    self.hamming.get_interleave_depth(), self.args.cache_dir)
+        with ProcessPoolExecutor(self.args.jobs,
+                                 initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            pending = deque()
+            for data in chunks:
+                start = perf_counter()
+                data = bytes(data)
+                pending.append((data, pool.submit(_run_in_worker, method,
+                                                  data)))
+                self.stats.code_time += perf_counter() - start
+                if len(pending) >= 2 * self.args.jobs:
+                    yield self._wait(*pending.popleft())
+            while pending:
+                yield self._wait(*pending.popleft())
+
+    def _wait(self, data: bytes, result: Future) -> Tuple[bytes, Any]:
+        """
+        Wait for the result of a chunk coded in the pool.
+        :return: Tuple[bytes, Any].
+        """
+        start = perf_counter()
+        result = result.result()
+        self.stats.code_time += perf_counter() - start
+        return data, result
+
+    def _print_encoded(self, first_index: int, data: bytes,
+                       encoded_data: bytes) -> None:
+        """
+        Print the result of encoding each block of a chunk.
+        :return: None.
+        """
+        if self.packer:
+            encoded_data = self.packer.unpack(encoded_data)
+        if self.interleaver:
+            encoded_data = self.interleaver.deinterleave(encoded_data)
+        buffer_size = self.buffer_size
+        for i in range(len(encoded_data) // self.number_of_output_bytes):
+            block = bytes(data[i * buffer_size:(i + 1) * buffer_size])
+            encoded_block = encoded_data[i * self.number_of_output_bytes:(
+                i + 1) * self.number_of_output_bytes]
+            if self.steps_tracer is not None:
+                self._print_steps("encode", block)
+            print(f"{first_index + i}: Encoded {block} -> {encoded_block}")
+
+    def _print_steps(self, method: str, block: bytes) -> None:
+        """
+        Print the steps taken to encode/decode a block, coding it again on
+        its own, so they come right before the result of the block.
+        :return: None.
+        """
+        self.hamming.set_tracer(self.steps_tracer)
+        try:
+            getattr(self.hamming, method)(block)
+        finally:
+            self.hamming.set_tracer(None)
+
+    def _print_decoded(self, first_index: int, data: bytes,
+                       decoded_data: bytes, decoded_results) -> None:
+        """
+        Print the result of decoding each block of a chunk.
+        :return: None.
+        """
+        if self.packer:
+            data = self.packer.unpack(data)
+        if self.interleaver:
+            data = self.interleaver.deinterleave(data)
+        buffer_size = self.buffer_size
+        for (i, decoded_result) in enumerate(decoded_results):
+            block = bytes(data[i * self.number_of_output_bytes:(i + 1) *
+                               self.number_of_output_bytes])
+            decoded_block = decoded_data[i * buffer_size:(i + 1) *
+                                         buffer_size]
+
+            if self.steps_tracer is not None:
+                self._print_steps("decode", block)
+            if self.args.verbose >= VerbosityTypes.DECODE_ENCODE_RESULTS:
+                print(f"{first_index + i}: Decoded {block} -> "
+                      f"{decoded_block}",
+                      end=", ")
+                if decoded_result == DecodeStatus.NO_ERROR:
+                    print("No Errors Detected")
+                elif decoded_result == DecodeStatus.SINGLE_ERROR_CORRECTED:
+                    print("Single Error Corrected")
+            if decoded_result == DecodeStatus.DOUBLE_ERROR_DETECTED:
+                if self.args.verbose >= VerbosityTypes.DECODE_ENCODE_RESULTS:
+                    print("Double Error Detected")
+                else:
+                    print(f"{first_index + i}: Decoded {block} -> "
+                          f"{decoded_block}, Double Error Detected")
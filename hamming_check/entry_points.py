@@ -6,10 +6,17 @@ This module contains the entry-point functions for the hamming_check module,
 that are referenced in setup.py.
 """
 
-from argparse import ArgumentParser
+from argparse import ArgumentParser, FileType
+from mmap import ACCESS_WRITE, mmap
+from os import fstat, urandom
 from sys import argv
 
+from hamming_check.bench import Bench, Simulation
 from hamming_check.cli import Cli
+from hamming_check.hamming import Hamming
+from hamming_check.io import Header
+from hamming_check.types import LayoutTypes
+from hamming_check.utils import ErrorInjector
 
 
 def cli() -> int:
@@ -27,36 +34,142 @@ def cli() -> int:
     return result
 
 
-def flip_a_bit_in_file() -> None:
-    """Flip a bit in a file."""
+def bench() -> int:
+    """Throughput benchmark entry point.
+
+    Measures the encoding/decoding speed and writes it as JSON.
+    """
+    return Bench().run()
+
+
+def simulate() -> int:
+    """Monte Carlo channel simulation entry point.
+
+    Estimates the decode statuses rates over a noisy channel and writes
+    them as JSON.
+    """
+    return Simulation().run()
+
+
+def flip_a_bit_in_file() -> int:
+    """Flip bits in a file.
+
+    Flips the given bits, and errors drawn in bulk by an ErrorInjector over
+    a memory map of the file.
+    """
     parser = ArgumentParser(
-        description="Flip a bit in a file.",
+        description="Flip bits in a file.",
         epilog="""
-        This function is used to flip a bit in a file.
+        The bits given are flipped first, then the errors of each option
+        given, all seeded so they are reproducible. The errors are drawn
+        after the header of an encoded file, whose buffer size overrides
+        --buffer-size.
         """,
     )
     parser.add_argument(
         "file",
-        help="The file to flip a bit in.",
+        help="The file to flip bits in.",
         type=str,
     )
     parser.add_argument(
         "bit",
-        help="The bit to flip.",
+        help="The bits to flip.",
+        type=int,
+        nargs="*",
+    )
+    parser.add_argument(
+        "--ber",
+        help="Flip every bit with this probability, like a binary "
+        "symmetric channel.",
+        type=float,
+    )
+    parser.add_argument(
+        "--bursts",
+        help="Flip bursts of LENGTH consecutive bits, starting on every bit "
+        "with a probability of RATE.",
+        type=float,
+        nargs=2,
+        metavar=("RATE", "LENGTH"),
+    )
+    parser.add_argument(
+        "--per-codeword",
+        help="Flip exactly this number of bits of every hamming word.",
+        type=int,
+    )
+    parser.add_argument(
+        "-b",
+        "--buffer-size",
+        help="The buffer size of the hamming words, for --per-codeword.",
         type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--seed",
+        help="The seed of the errors, random by default and printed.",
+        type=int,
+    )
+    parser.add_argument(
+        "--log",
+        help="The file used for writing the index of every flipped bit, one "
+        "per line.",
+        type=FileType("w"),
     )
     args = parser.parse_args()
-    fname = args.file
-    bitpos = args.bit
-    nbytes, nbits = divmod(bitpos, 8)
+    seed = (args.seed if args.seed is not None else int.from_bytes(
+        urandom(4), byteorder="little"))
+
+    # the given bits are flipped anywhere in the file, and the drawn errors
+    # after the header, so each injector logs its own bits
+    bit_injector = ErrorInjector()
+    error_injector = ErrorInjector(seed)
+    with open(args.file, "r+b") as file:
+        size = fstat(file.fileno()).st_size
+        header_bytes = file.read(Header.SIZE)
+        (offset, buffer_size, layout, depth) = (0, args.buffer_size,
+                                                LayoutTypes.PADDED, 1)
+        if Header.is_header(header_bytes):
+            try:
+                header = Header.from_bytes(header_bytes)
+            except ValueError as e:
+                parser.error(f"Error reading the header: {e}")
+            (offset, buffer_size, layout,
+             depth) = (header.get_size(), header.buffer_size, header.layout,
+                       header.depth)
+        if args.per_codeword and (layout != LayoutTypes.PADDED or depth > 1):
+            parser.error("--per-codeword needs the padded layout without "
+                         "interleaving")
+        if any(not 0 <= bit < 8 * size for bit in args.bit):
+            parser.error(f"The bits must be in [0, {8 * size})")
+        if not size:
+            return 0
 
-    fp = open(fname, "r+b")
-    fp.seek(nbytes, 0)
-    c = fp.read(1)
+        with (mmap(file.fileno(), size, access=ACCESS_WRITE) as file_map,
+              memoryview(file_map) as view, view[offset:] as data):
+            try:
+                bit_injector.flip_bits(view, args.bit)
+                if args.ber:
+                    error_injector.inject_bsc(data, args.ber)
+                if args.bursts:
+                    error_injector.inject_bursts(data, args.bursts[0],
+                                                 int(args.bursts[1]))
+                if args.per_codeword:
+                    hamming = Hamming(buffer_size)
+                    error_injector.inject_per_codeword(
+                        data, hamming.get_number_of_output_bytes(),
+                        args.per_codeword,
+                        hamming.get_number_of_output_bits())
+            except ValueError as e:
+                parser.error(str(e))
 
-    toggled = bytes([ord(c) ^ (1 << nbits)])
+    if args.log:
+        bit_injector.write_log(args.log)
+        error_injector.write_log(args.log, 8 * offset)
+        args.log.close()
 
-    fp.seek(-1, 1)
-    fp.write(toggled)
-    fp.close()
-    print(f"Flipped bit {bitpos} in {fname}")
+    if len(args.bit) == 1 and not error_injector.get_log():
+        print(f"Flipped bit {args.bit[0]} in {args.file}")
+    else:
+        print(f"Flipped "
+              f"{len(bit_injector.get_log()) + len(error_injector.get_log())} "
+              f"bits in {args.file} (seed {seed})")
+    return 0
@@ -5,12 +5,19 @@ hamming
 hamming package - Various classes for reading and writing data.
 """
 
-__all__ = ["Hamming", "DecodeResult", "DecodeStatus"]
+__all__ = [
+    "Hamming", "DecodeResult", "DecodeResults", "DecodeStatus", "EncodedFile",
+    "Interleaver", "Tracer", "PrintTracer", "JsonTracer"
+]
 
 __author__ = "Pablo Alessandro Santos Hugen"
 __doc__ = "io package - Various classes for reading and writing data."
 # __import__ = ["Bytes", "File"]
 
 from .decode_result import DecodeResult
+from .decode_results import DecodeResults
 from .decode_status import DecodeStatus
 from .hamming import Hamming
+from .encoded_file import EncodedFile
+from .interleaver import Interleaver
+from .tracer import JsonTracer, PrintTracer, Tracer
@@ -0,0 +1,240 @@
+import json
+import os
+from array import array
+from functools import lru_cache
+from math import ceil, log2
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ._table_backend import _TableBackend
+
+# number of buffer sizes whose tables are kept in memory
+MAX_CACHED_TABLES = 32
+# bumped whenever the persisted tables change, so stale files are rebuilt
+TABLES_FORMAT = 2
+# the backends that only depend on the buffer size and are slow to build,
+# so they are worth persisting to a cache directory
+PERSISTENT_BACKENDS = {_TableBackend.__name__: _TableBackend}
+
+
+class _HammingTables(object):
+    """
+    The tables of the hamming code of a buffer size, built once and shared
+    by every Hamming object of that buffer size.
+
+    Each parity mask is built from a periodic byte pattern, and the data
+    bits are described by their runs between the parity bits, so building
+    the tables is linear in the size of a hamming word, and they hold k
+    masks and an array('I') of indexes instead of k lists of indexes.
+
+    The backends that only depend on the buffer size are shared through
+    the tables too, and the tables can be persisted to a cache directory
+    along with the persistent backends, so short-lived processes load them
+    instead of building them. They are stored as JSON, checked when loaded.
+    """
+
+    __slots__ = ("number_of_input_bits", "number_of_parity_bits",
+                 "number_of_output_bits", "number_of_output_bytes",
+                 "parity_bits_indexes", "data_runs", "data_bits_indexes",
+                 "parity_masks", "check_masks", "output_mask", "backends")
+
+    def __init__(self, buffer_size: int):
+        self._set_sizes(buffer_size)
+
+        # one integer mask per parity bit, so the parity bit C(2**i) is the
+        # parity of the hamming word masked by the i-th mask
+        powers_of_two_mask = sum(
+            1 << (2**i)
+            for i in range(self.number_of_output_bits.bit_length()))
+        self._set_parity_masks([
+            self._get_periodic_mask(i, self.number_of_output_bytes)
+            & self.output_mask & ~powers_of_two_mask
+            for i in range(self.number_of_parity_bits)
+        ])
+
+    def _set_sizes(self, buffer_size: int) -> None:
+        """
+        Set the sizes of the hamming code of a buffer size, and the indexes
+        of its bits.
+        """
+        self.number_of_input_bits = buffer_size * 8
+
+        # k = 0
+        # while 2**k - 1 < m + k:
+        #     k += 1
+        self.number_of_parity_bits = int(log2(self.number_of_input_bits) + 1)
+        self.number_of_output_bits = (self.number_of_input_bits +
+                                      self.number_of_parity_bits + 1)
+        self.number_of_output_bytes = ceil(self.number_of_output_bits / 8)
+        self.output_mask = (1 << self.number_of_output_bits) - 1
+
+        self.parity_bits_indexes = array(
+            "I", (2**i for i in range(self.number_of_parity_bits)))
+
+        # the data bits are laid out in contiguous runs between the powers
+        # of two, so they can be copied a whole run at a time. Each run is
+        # a (input bit index, output bit index, run mask) tuple
+        self.data_runs = self._get_data_runs(self.number_of_output_bits)
+        self.data_bits_indexes = array("I")
+        for (_, output_index, run_mask) in self.data_runs:
+            self.data_bits_indexes.extend(
+                range(output_index, output_index + run_mask.bit_length()))
+
+        self.backends = {}
+
+    def _set_parity_masks(self, parity_masks: List[int]) -> None:
+        """
+        Set the parity masks, and the parity-check masks that also cover
+        the parity bit itself, so the syndrome can be computed straight
+        from a received hamming word.
+        """
+        self.parity_masks = parity_masks
+        self.check_masks = [
+            mask | (1 << (2**i)) for (i, mask) in enumerate(self.parity_masks)
+        ]
+
+    @staticmethod
+    def _get_data_runs(
+            number_of_output_bits: int) -> List[Tuple[int, int, int]]:
+        """
+        Get the runs of the bit indexes of a hamming word that are neither
+        0 nor a power of two.
+        """
+        runs = []
+        input_index = 0
+        for i in range(1, number_of_output_bits.bit_length()):
+            start = 2**i + 1
+            end = min(2**(i + 1), number_of_output_bits)
+            if start < end:
+                runs.append((input_index, start, (1 << (end - start)) - 1))
+                input_index += end - start
+        return runs
+
+    @staticmethod
+    def _get_periodic_mask(i: int, number_of_bytes: int) -> int:
+        """
+        Get an integer with every bit j such that j & 2**i set, made of
+        the repeated byte pattern of that period.
+        """
+        if 2**i < 8:
+            pattern = bytes(
+                [sum(1 << bit for bit in range(8) if bit & (2**i))])
+        else:
+            half = 2**i // 8
+            pattern = bytes(half) + b"\xff" * half
+        pattern *= ceil(number_of_bytes / len(pattern))
+        return int.from_bytes(pattern[:number_of_bytes], byteorder="little")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the parity masks, as hexadecimal strings, and the persistent
+        backends as JSON values. The rest is quick to build again.
+        """
+        return {
+            "format": TABLES_FORMAT,
+            "buffer_size": self.number_of_input_bits // 8,
+            "parity_masks": [format(mask, "x") for mask in self.parity_masks],
+            "backends": {
+                backend_class.__name__: backend.to_dict()
+                for (backend_class, backend) in self.backends.items()
+                if backend_class.__name__ in PERSISTENT_BACKENDS
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "_HammingTables":
+        """
+        Rebuild the tables and their persistent backends from to_dict,
+        raising ValueError if they are not well formed.
+        """
+        try:
+            buffer_size = state["buffer_size"]
+            if (state["format"] != TABLES_FORMAT
+                    or not isinstance(buffer_size, int) or buffer_size < 1):
+                raise ValueError("Unsupported hamming tables")
+
+            tables = cls.__new__(cls)
+            tables._set_sizes(buffer_size)
+            parity_masks = [int(mask, 16) for mask in state["parity_masks"]]
+            if (len(parity_masks) != tables.number_of_parity_bits or any(
+                    mask & ~tables.output_mask for mask in parity_masks)):
+                raise ValueError("Corrupted parity masks")
+            tables._set_parity_masks(parity_masks)
+
+            for (name, backend_state) in state["backends"].items():
+                backend = PERSISTENT_BACKENDS[name].from_dict(backend_state)
+                if (backend._buffer_size != buffer_size
+                        or backend._number_of_output_bytes !=
+                        tables.number_of_output_bytes):
+                    raise ValueError(f"Mismatched {name} sizes")
+                tables.backends[PERSISTENT_BACKENDS[name]] = backend
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Corrupted hamming tables: {e}") from e
+        return tables
+
+    def get_backend(self,
+                    backend_class: type,
+                    build: Callable[[], Any],
+                    cache_dir: Optional[str] = None) -> Any:
+        """
+        Get the shared backend of a class, building it the first time, and
+        persisting it to the cache directory when given and the backend is
+        persistent.
+        """
+        if backend_class not in self.backends:
+            self.backends[backend_class] = build()
+            if (cache_dir is not None
+                    and backend_class.__name__ in PERSISTENT_BACKENDS):
+                self.save(cache_dir)
+        return self.backends[backend_class]
+
+    @classmethod
+    @lru_cache(maxsize=MAX_CACHED_TABLES)
+    def get(cls,
+            buffer_size: int,
+            cache_dir: Optional[str] = None) -> "_HammingTables":
+        """
+        Get the tables of a buffer size, from the cache when recently used,
+        else from the cache directory when given.
+        """
+        if cache_dir is None:
+            return cls(buffer_size)
+
+        path = cls._get_path(buffer_size, cache_dir)
+        try:
+            with open(path, "rb") as file:
+                tables = cls.from_dict(json.load(file))
+            if tables.number_of_input_bits == buffer_size * 8:
+                return tables
+        except (OSError, ValueError):
+            pass
+        tables = cls(buffer_size)
+        tables.save(cache_dir)
+        return tables
+
+    def save(self, cache_dir: str) -> None:
+        """
+        Persist the tables and their persistent backends to the cache
+        directory. The file is replaced atomically, so concurrent processes
+        never load a partial file, and failing to write it is not an error.
+        """
+        path = self._get_path(self.number_of_input_bits // 8, cache_dir)
+        temporary_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp",
+                                    delete=False) as file:
+                temporary_path = file.name
+                json.dump(self.to_dict(), file)
+            os.replace(temporary_path, path)
+        except OSError:
+            if temporary_path is not None:
+                try:
+                    os.unlink(temporary_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _get_path(buffer_size: int, cache_dir: str) -> str:
+        return os.path.join(
+            cache_dir, f"hamming-tables-v{TABLES_FORMAT}-{buffer_size}.json")
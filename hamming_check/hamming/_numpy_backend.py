@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from array import array
+from math import ceil
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import numpy as np
+
+from hamming_check.types import Buffer
+
+from .decode_results import DecodeResults
+from .decode_status import DecodeStatus
+
+if TYPE_CHECKING:
+    from .hamming import Hamming
+
+# maximum number of unpacked bits held in memory per step
+_BITS_PER_STEP = 1 << 23
+
+
+class _NumpyBackend(object):
+    """
+    Codes many blocks at once as a bit matrix, with one GF(2) matrix
+    product for all the parity bits of all the blocks
+    """
+
+    def __init__(self, hamming: Hamming) -> None:
+        self._buffer_size = hamming._buffer_size
+        self._number_of_output_bits = hamming._number_of_output_bits
+        self._number_of_output_bytes = hamming._number_of_output_bytes
+        self._data_bits_indexes = np.frombuffer(
+            hamming._data_bits_indexes, dtype=np.uint32).astype(np.intp)
+        self._parity_bits_indexes = np.frombuffer(
+            hamming._parity_bits_indexes, dtype=np.uint32).astype(np.intp)
+
+        # floats make the products run on BLAS, and are exact while the
+        # sums stay below 2**24
+        self._dtype = (np.float32
+                       if self._number_of_output_bits < 2**24 else np.float64)
+
+        # parity-check matrix (n x k), row j is the syndrome of a single
+        # error on the bit j, and generator matrix (m x k), that is the
+        # parity-check matrix restricted to the data bits
+        self._parity_check_matrix = np.stack(
+            [self._mask_to_bits(mask) for mask in hamming._check_masks],
+            axis=1).astype(self._dtype)
+        self._generator_matrix = self._parity_check_matrix[
+            self._data_bits_indexes]
+        self._syndrome_weights = 2**np.arange(len(hamming._check_masks),
+                                              dtype=np.int64)
+
+        # copying the data bits run by run with slices is much faster than
+        # fancy indexing with the data bits indexes
+        self._data_runs = [
+            (slice(input_index, input_index + run_mask.bit_length()),
+             slice(output_index, output_index + run_mask.bit_length()))
+            for (input_index, output_index, run_mask) in hamming._data_runs
+        ]
+
+        # parity of every byte value, for the global parity bit
+        self._last_byte_mask = (hamming._output_mask >>
+                                (self._number_of_output_bytes - 1) * 8)
+        self._byte_parity = np.array([bin(i).count("1") & 1
+                                      for i in range(256)],
+                                     dtype=np.uint8)
+
+    def _mask_to_bits(self, mask: int) -> np.ndarray:
+        return np.unpackbits(np.frombuffer(mask.to_bytes(
+            self._number_of_output_bytes, byteorder="little"),
+                                           dtype=np.uint8),
+                             bitorder="little")[:self._number_of_output_bits]
+
+    def _get_parity(self, blocks: np.ndarray) -> np.ndarray:
+        """
+        Get the parity of each hamming word of a (blocks x bytes) matrix,
+        ignoring the padding bits of the last byte.
+        """
+        return self._byte_parity[np.bitwise_xor.reduce(blocks[:, :-1], axis=1)
+                                 ^ (blocks[:, -1] & self._last_byte_mask)]
+
+    def _to_blocks(self, input_bytes: Buffer, block_size: int) -> np.ndarray:
+        """
+        View a buffer as a (blocks x block_size) matrix, zero padding the
+        last block when needed.
+        """
+        input_array = np.frombuffer(input_bytes, dtype=np.uint8)
+        number_of_blocks = ceil(len(input_array) / block_size)
+
+        if len(input_array) != number_of_blocks * block_size:
+            padded = np.zeros(number_of_blocks * block_size, dtype=np.uint8)
+            padded[:len(input_array)] = input_array
+            input_array = padded
+
+        return input_array.reshape(number_of_blocks, block_size)
+
+    def _steps(self, blocks: np.ndarray):
+        """
+        Yield the index of the first block and the blocks of each step.
+        """
+        step = max(1, _BITS_PER_STEP // (blocks.shape[1] * 8))
+        for i in range(0, len(blocks), step):
+            yield i, blocks[i:i + step]
+
+    def _check(
+        self, blocks: np.ndarray, statuses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Write the DecodeStatus of each hamming word of a (blocks x bytes)
+        matrix to statuses, and get the bit matrix of the hamming words,
+        their syndromes and the mask of the ones with a single error.
+        """
+        hamming_words = np.unpackbits(
+            blocks, axis=1, bitorder="little")[:, :self._number_of_output_bits]
+
+        syndrome_bits = (hamming_words.astype(self._dtype) @
+                         self._parity_check_matrix).astype(np.int64) & 1
+        syndromes = syndrome_bits @ self._syndrome_weights
+        g = self._get_parity(blocks)
+
+        statuses[:] = DecodeStatus.DOUBLE_ERROR_DETECTED
+        statuses[(syndromes == 0) & (g == 0)] = DecodeStatus.NO_ERROR
+        single = (g == 1) & (syndromes < self._number_of_output_bits)
+        statuses[single] = DecodeStatus.SINGLE_ERROR_CORRECTED
+        return hamming_words, syndromes, single
+
+    def encode_many(self, input_bytes: Buffer) -> bytes:
+        input_view = memoryview(input_bytes).cast("B")
+        output = bytearray(
+            ceil(len(input_view) / self._buffer_size) *
+            self._number_of_output_bytes)
+        self.encode_into(input_view, memoryview(output))
+        return bytes(output)
+
+    def encode_into(self, input_view: memoryview,
+                    output_view: memoryview) -> None:
+        output = np.frombuffer(output_view, dtype=np.uint8).reshape(
+            -1, self._number_of_output_bytes)
+
+        for (i, blocks) in self._steps(
+                self._to_blocks(input_view, self._buffer_size)):
+            data_bits = np.unpackbits(
+                blocks, axis=1,
+                bitorder="little")[:, :len(self._data_bits_indexes)]
+            parity_bits = (data_bits.astype(self._dtype) @
+                           self._generator_matrix).astype(np.uint8) & 1
+
+            hamming_words = np.zeros(
+                (len(blocks), self._number_of_output_bytes * 8),
+                dtype=np.uint8)
+            for (data_slice, hamming_slice) in self._data_runs:
+                hamming_words[:, hamming_slice] = data_bits[:, data_slice]
+            hamming_words[:, self._parity_bits_indexes] = parity_bits
+
+            packed_words = output[i:i + len(blocks)]
+            packed_words[:] = np.packbits(hamming_words,
+                                          axis=1,
+                                          bitorder="little")
+            packed_words[:, 0] |= self._get_parity(packed_words)
+
+    def decode_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        input_view = memoryview(hamming_words_bytes).cast("B")
+        number_of_blocks = ceil(
+            len(input_view) / self._number_of_output_bytes)
+        output = bytearray(number_of_blocks * self._buffer_size)
+        statuses = array("B", bytes(number_of_blocks))
+        syndromes = array("I", [0]) * number_of_blocks
+        self.decode_into(input_view, memoryview(output), memoryview(statuses),
+                         memoryview(syndromes))
+        return DecodeResults(bytes(output), statuses, syndromes)
+
+    def verify_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        blocks = self._to_blocks(hamming_words_bytes,
+                                 self._number_of_output_bytes)
+        statuses = np.zeros(len(blocks), dtype=np.uint8)
+        syndromes = np.zeros(len(blocks), dtype=np.uint32)
+        for (i, step_blocks) in self._steps(blocks):
+            (_, syndromes[i:i + len(step_blocks)],
+             _) = self._check(step_blocks, statuses[i:i + len(step_blocks)])
+        return DecodeResults(b"", array("B", statuses.tobytes()),
+                             array("I", syndromes.tobytes()))
+
+    def decode_into(self,
+                    input_view: memoryview,
+                    output_view: memoryview,
+                    status_view: memoryview,
+                    syndrome_view: Optional[memoryview] = None) -> None:
+        output = np.frombuffer(output_view, dtype=np.uint8).reshape(
+            -1, self._buffer_size)
+        statuses = np.frombuffer(status_view, dtype=np.uint8)
+        syndrome_array = (None if syndrome_view is None else np.frombuffer(
+            syndrome_view, dtype=np.uint32))
+
+        for (i, blocks) in self._steps(
+                self._to_blocks(input_view, self._number_of_output_bytes)):
+            (hamming_words, syndromes,
+             single) = self._check(blocks, statuses[i:i + len(blocks)])
+            if syndrome_array is not None:
+                syndrome_array[i:i + len(blocks)] = syndromes
+
+            # flip the bad bit of every single error block at once
+            rows = np.nonzero(single)[0]
+            hamming_words[rows, syndromes[rows]] ^= 1
+
+            data_bits = np.zeros((len(blocks), self._buffer_size * 8),
+                                 dtype=np.uint8)
+            for (data_slice, hamming_slice) in self._data_runs:
+                data_bits[:, data_slice] = hamming_words[:, hamming_slice]
+
+            output[i:i + len(blocks)] = np.packbits(data_bits,
+                                                    axis=1,
+                                                    bitorder="little")
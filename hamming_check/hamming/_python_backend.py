@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from array import array
+from math import ceil
+from typing import TYPE_CHECKING, Optional
+
+from hamming_check.types import Buffer
+
+from .decode_results import DecodeResults
+from .decode_status import DecodeStatus
+
+if TYPE_CHECKING:
+    from .hamming import Hamming
+
+
+class _PythonBackend(object):
+    """
+    Codes many blocks one hamming word at a time, using python integers
+    """
+
+    def __init__(self, hamming: Hamming) -> None:
+        self._hamming = hamming
+
+    def encode_many(self, input_bytes: Buffer) -> bytes:
+        input_view = memoryview(input_bytes).cast("B")
+        output = bytearray(
+            ceil(len(input_view) / self._hamming._buffer_size) *
+            self._hamming._number_of_output_bytes)
+        self.encode_into(input_view, memoryview(output))
+        return bytes(output)
+
+    def encode_into(self, input_view: memoryview,
+                    output_view: memoryview) -> None:
+        buffer_size = self._hamming._buffer_size
+        number_of_output_bytes = self._hamming._number_of_output_bytes
+        encode_word = self._hamming._encode_word
+
+        for (i, offset) in enumerate(range(0, len(input_view), buffer_size)):
+            output_view[i * number_of_output_bytes:(i + 1) *
+                        number_of_output_bytes] = encode_word(
+                            int.from_bytes(
+                                input_view[offset:offset + buffer_size],
+                                byteorder="little")).to_bytes(
+                                    number_of_output_bytes,
+                                    byteorder="little")
+
+    def decode_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        input_view = memoryview(hamming_words_bytes).cast("B")
+        number_of_blocks = ceil(
+            len(input_view) / self._hamming._number_of_output_bytes)
+        output = bytearray(number_of_blocks * self._hamming._buffer_size)
+        statuses = array("B", bytes(number_of_blocks))
+        syndromes = array("I", [0]) * number_of_blocks
+        self.decode_into(input_view, memoryview(output), memoryview(statuses),
+                         memoryview(syndromes))
+        return DecodeResults(bytes(output), statuses, syndromes)
+
+    def verify_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        input_view = memoryview(hamming_words_bytes).cast("B")
+        number_of_output_bytes = self._hamming._number_of_output_bytes
+        output_mask = self._hamming._output_mask
+        get_syndrome = self._hamming._get_syndrome
+        get_status = self._hamming._get_status
+
+        statuses = array("B")
+        syndromes = array("I")
+        for offset in range(0, len(input_view), number_of_output_bytes):
+            hamming_word = (int.from_bytes(
+                input_view[offset:offset + number_of_output_bytes],
+                byteorder="little") & output_mask)
+            syndrome = get_syndrome(hamming_word)
+            g = hamming_word.bit_count() & 1
+            statuses.append(
+                get_status(syndrome, g) if syndrome or g else DecodeStatus.
+                NO_ERROR)
+            syndromes.append(syndrome)
+        return DecodeResults(b"", statuses, syndromes)
+
+    def decode_into(self,
+                    input_view: memoryview,
+                    output_view: memoryview,
+                    status_view: memoryview,
+                    syndrome_view: Optional[memoryview] = None) -> None:
+        buffer_size = self._hamming._buffer_size
+        number_of_output_bytes = self._hamming._number_of_output_bytes
+        output_mask = self._hamming._output_mask
+        get_syndrome = self._hamming._get_syndrome
+        get_status = self._hamming._get_status
+        get_data_word = self._hamming._get_data_word
+
+        for (i, offset) in enumerate(
+                range(0, len(input_view), number_of_output_bytes)):
+            hamming_word = (int.from_bytes(
+                input_view[offset:offset + number_of_output_bytes],
+                byteorder="little") & output_mask)
+            syndrome = get_syndrome(hamming_word)
+            g = hamming_word.bit_count() & 1
+
+            # only the blocks with errors need a status and a correction
+            status = DecodeStatus.NO_ERROR
+            if syndrome or g:
+                status = get_status(syndrome, g)
+                if status == DecodeStatus.SINGLE_ERROR_CORRECTED:
+                    hamming_word ^= 1 << syndrome
+            status_view[i] = status
+            if syndrome_view is not None:
+                syndrome_view[i] = syndrome
+
+            output_view[i * buffer_size:(i + 1) *
+                        buffer_size] = get_data_word(hamming_word).to_bytes(
+                            buffer_size, byteorder="little")
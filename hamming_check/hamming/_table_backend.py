@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from hamming_check.types import Buffer
+from hamming_check.utils import Utils
+
+from .decode_results import DecodeResults
+from .decode_status import DecodeStatus
+
+if TYPE_CHECKING:
+    from .hamming import Hamming
+
+
+class _TableBackend(object):
+    """
+    Codes many blocks at once with lookup tables applied by bytes.translate.
+
+    The hamming code is linear, so the exhaustive table of every data word
+    (or received word) factors into one 256 entries table per pair of byte
+    lanes: each output byte is the xor of the tables of the input bytes.
+    Every table is applied to a whole lane of a chunk with a single
+    bytes.translate call, so the cost per block is a few memcpy-like passes.
+    """
+
+    # the syndrome and the global parity bit must fit in a check byte
+    MAX_NUMBER_OF_PARITY_BITS = 7
+
+    @classmethod
+    def supports(cls, hamming: Hamming) -> bool:
+        return (hamming._number_of_parity_bits <=
+                cls.MAX_NUMBER_OF_PARITY_BITS)
+
+    def __init__(self, hamming: Hamming) -> None:
+        if not self.supports(hamming):
+            raise ValueError(f"The table backend does not support a "
+                             f"{hamming._buffer_size} bytes hamming code")
+
+        self._buffer_size = hamming._buffer_size
+        self._number_of_output_bytes = hamming._number_of_output_bytes
+
+        input_lanes = range(self._buffer_size)
+        output_lanes = range(self._number_of_output_bytes)
+        number_of_parity_bits = hamming._number_of_parity_bits
+
+        # encode: output lane j is the xor of the tables of the input lanes
+        encoded = [[
+            hamming._encode_word(value << (8 * i)) for value in range(256)
+        ] for i in input_lanes]
+        self._encode_tables = self._get_lane_tables(encoded, output_lanes)
+
+        # decode: the check byte (syndrome | G << k) and the raw data bits
+        # are also the xor of the tables of the received lanes
+        received = [[(value << (8 * j)) & hamming._output_mask
+                     for value in range(256)] for j in output_lanes]
+        self._check_tables = self._get_lane_tables(
+            [[
+                hamming._get_syndrome(word) |
+                ((word.bit_count() & 1) << number_of_parity_bits)
+                for word in words
+            ] for words in received], range(1))
+        self._data_tables = self._get_lane_tables(
+            [[hamming._get_data_word(word) for word in words]
+             for words in received], input_lanes)
+
+        # every possible check byte gives the status and the data bits to
+        # flip for a single error on that block
+        statuses = []
+        fixes = []
+        for check in range(256):
+            syndrome = check & ((1 << number_of_parity_bits) - 1)
+            status = hamming._get_status(syndrome,
+                                         check >> number_of_parity_bits)
+            statuses.append(status)
+            fixes.append(
+                hamming._get_data_word(1 << syndrome) if status ==
+                DecodeStatus.SINGLE_ERROR_CORRECTED else 0)
+        self._status_table = bytes(statuses)
+        self._syndrome_table = bytes(check & ((1 << number_of_parity_bits) - 1)
+                                     for check in range(256))
+        self._fix_tables = self._get_lane_tables([fixes], input_lanes)
+
+    @staticmethod
+    def _get_lane_tables(words: List[List[int]],
+                         output_lanes: range) -> Dict[int, List[Tuple]]:
+        """
+        Split the words of each input lane into one translate table per
+        output lane, dropping the tables that are all zeros.
+        """
+        lane_tables = {}
+        for j in output_lanes:
+            lane_tables[j] = []
+            for (i, lane_words) in enumerate(words):
+                table = bytes((word >> (8 * j)) & 0xFF for word in lane_words)
+                if any(table):
+                    lane_tables[j].append((i, table))
+        return lane_tables
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the lookup tables as JSON values, the tables as hexadecimal
+        strings.
+        """
+        return {
+            "buffer_size": self._buffer_size,
+            "number_of_output_bytes": self._number_of_output_bytes,
+            **{
+                name: [[[i, table.hex()] for (i, table) in tables]
+                       for tables in getattr(self, f"_{name}").values()]
+                for name in ("encode_tables", "check_tables", "data_tables",
+                             "fix_tables")
+            },
+            "status_table": self._status_table.hex(),
+            "syndrome_table": self._syndrome_table.hex(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> _TableBackend:
+        """
+        Rebuild a backend from the lookup tables of to_dict, raising
+        ValueError if they are not well formed.
+        """
+        try:
+            backend = cls.__new__(cls)
+            backend._buffer_size = state["buffer_size"]
+            backend._number_of_output_bytes = state["number_of_output_bytes"]
+            if not (isinstance(backend._buffer_size, int)
+                    and isinstance(backend._number_of_output_bytes, int)):
+                raise ValueError("Corrupted table backend sizes")
+
+            input_lanes = range(backend._buffer_size)
+            output_lanes = range(backend._number_of_output_bytes)
+            backend._encode_tables = cls._get_lane_tables_from_dict(
+                state["encode_tables"], input_lanes, output_lanes)
+            backend._check_tables = cls._get_lane_tables_from_dict(
+                state["check_tables"], output_lanes, range(1))
+            backend._data_tables = cls._get_lane_tables_from_dict(
+                state["data_tables"], output_lanes, input_lanes)
+            backend._fix_tables = cls._get_lane_tables_from_dict(
+                state["fix_tables"], range(1), input_lanes)
+
+            backend._status_table = bytes.fromhex(state["status_table"])
+            backend._syndrome_table = bytes.fromhex(state["syndrome_table"])
+            if (len(backend._status_table) != 256
+                    or len(backend._syndrome_table) != 256
+                    or max(backend._status_table) >
+                    DecodeStatus.DOUBLE_ERROR_DETECTED):
+                raise ValueError("Corrupted table backend status tables")
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Corrupted table backend: {e}") from e
+        return backend
+
+    @staticmethod
+    def _get_lane_tables_from_dict(
+            lane_tables: List[List[List]], input_lanes: range,
+            output_lanes: range) -> Dict[int, List[Tuple]]:
+        """
+        Get the translate tables of each output lane from their JSON
+        values, raising ValueError if they are not well formed.
+        """
+        if len(lane_tables) != len(output_lanes):
+            raise ValueError("Wrong number of output lanes")
+
+        tables = {}
+        for (j, json_tables) in zip(output_lanes, lane_tables):
+            tables[j] = []
+            for (i, table) in json_tables:
+                table = bytes.fromhex(table)
+                if (not isinstance(i, int) or i not in input_lanes
+                        or len(table) != 256):
+                    raise ValueError("Corrupted translate table")
+                tables[j].append((i, table))
+        return tables
+
+    def _encode_lanes(self, input_bytes: Buffer) -> Tuple[List[bytes], int]:
+        """
+        Get the output lanes of the encoded blocks, and their number.
+        """
+        lanes = Utils.split_lanes(input_bytes, self._buffer_size)
+        number_of_blocks = len(lanes[0])
+
+        return [
+            Utils.xor_lanes(
+                [lanes[i].translate(table) for (i, table) in tables],
+                number_of_blocks)
+            for tables in self._encode_tables.values()
+        ], number_of_blocks
+
+    def encode_many(self, input_bytes: Buffer) -> bytes:
+        (output_lanes, number_of_blocks) = self._encode_lanes(input_bytes)
+        return Utils.join_lanes(output_lanes, self._number_of_output_bytes,
+                                number_of_blocks)
+
+    def encode_into(self, input_view: memoryview,
+                    output_view: memoryview) -> None:
+        (output_lanes, number_of_blocks) = self._encode_lanes(input_view)
+        Utils.join_lanes_into(output_lanes, self._number_of_output_bytes,
+                              number_of_blocks, output_view)
+
+    def _get_checks(self, lanes: List[bytes], number_of_blocks: int) -> bytes:
+        """
+        Get the check byte (syndrome | G << k) of each block.
+        """
+        return Utils.xor_lanes([
+            lanes[j].translate(table) for (j, table) in self._check_tables[0]
+        ], number_of_blocks)
+
+    def _get_syndromes(self, checks: bytes) -> array:
+        """
+        Get the syndrome of each block as an array('I'), like the other
+        backends, widening the syndrome bytes with a strided copy.
+        """
+        syndromes = array("I")
+        widened = bytearray(syndromes.itemsize * len(checks))
+        first = 0 if sys.byteorder == "little" else syndromes.itemsize - 1
+        widened[first::syndromes.itemsize] = checks.translate(
+            self._syndrome_table)
+        syndromes.frombytes(widened)
+        return syndromes
+
+    def _decode_lanes(
+            self,
+            hamming_words_bytes: Buffer) -> Tuple[List[bytes], bytes, bytes]:
+        """
+        Get the data lanes of the decoded blocks, their statuses and their
+        check bytes.
+        """
+        lanes = Utils.split_lanes(hamming_words_bytes,
+                                  self._number_of_output_bytes)
+        number_of_blocks = len(lanes[0])
+
+        checks = self._get_checks(lanes, number_of_blocks)
+        statuses = checks.translate(self._status_table)
+        # only blocks with a single error have bits to fix, so the clean
+        # path skips the correction entirely
+        has_single_errors = DecodeStatus.SINGLE_ERROR_CORRECTED in statuses
+
+        data_lanes = []
+        for (i, tables) in self._data_tables.items():
+            data_lane = [lanes[j].translate(table) for (j, table) in tables]
+            if has_single_errors:
+                data_lane += [
+                    checks.translate(table)
+                    for (_, table) in self._fix_tables[i]
+                ]
+            data_lanes.append(Utils.xor_lanes(data_lane, number_of_blocks))
+
+        return data_lanes, statuses, checks
+
+    def decode_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        (data_lanes, statuses,
+         checks) = self._decode_lanes(hamming_words_bytes)
+        return DecodeResults(
+            Utils.join_lanes(data_lanes, self._buffer_size, len(statuses)),
+            array("B", statuses),
+            self._get_syndromes(checks))
+
+    def verify_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        lanes = Utils.split_lanes(hamming_words_bytes,
+                                  self._number_of_output_bytes)
+        checks = self._get_checks(lanes, len(lanes[0]))
+        return DecodeResults(
+            b"", array("B", checks.translate(self._status_table)),
+            self._get_syndromes(checks))
+
+    def decode_into(self,
+                    input_view: memoryview,
+                    output_view: memoryview,
+                    status_view: memoryview,
+                    syndrome_view: Optional[memoryview] = None) -> None:
+        (data_lanes, statuses, checks) = self._decode_lanes(input_view)
+        Utils.join_lanes_into(data_lanes, self._buffer_size, len(statuses),
+                              output_view)
+        status_view[:len(statuses)] = statuses
+        if syndrome_view is not None:
+            syndrome_view[:len(statuses)] = self._get_syndromes(checks)
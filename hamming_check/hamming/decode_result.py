@@ -1,27 +1,45 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from .decode_status import DecodeStatus
 
 
 class DecodeResult(object):
     """Result of a decode operation"""
 
+    # no instance dict, decoding a block allocates a single small object
+    __slots__ = ("_data", "_status", "_corrected_bit")
+
     def __init__(self,
                  data: bytes = 0,
-                 status: DecodeStatus = DecodeStatus.NO_ERROR):
-        self.__data = data
-        self.__status = status
+                 status: DecodeStatus = DecodeStatus.NO_ERROR,
+                 corrected_bit: Optional[int] = None):
+        self._data = data
+        self._status = status
+        self._corrected_bit = corrected_bit
 
     def set_data(self, data) -> DecodeResult:
-        setattr(self, "__data", data)
+        self._data = data
         return self
 
     def get_data(self) -> bytes:
-        return getattr(self, "__data")
+        return self._data
 
     def set_status(self, status: DecodeStatus) -> DecodeResult:
-        setattr(self, "__status", status)
+        self._status = status
         return self
 
     def get_status(self) -> DecodeStatus:
-        return getattr(self, "__status")
+        return self._status
+
+    def set_corrected_bit(self, corrected_bit: Optional[int]) -> DecodeResult:
+        self._corrected_bit = corrected_bit
+        return self
+
+    def get_corrected_bit(self) -> Optional[int]:
+        """
+        Get the index of the corrected bit in the hamming word, or None
+        when no single error was corrected.
+        """
+        return self._corrected_bit
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+from .decode_status import DecodeStatus
+
+
+class DecodeResults(object):
+    """
+    Columnar result of decoding many blocks: one contiguous buffer with
+    the data of every block, a byte array with the DecodeStatus of each
+    block, and an array('I') with the syndrome of each block, the
+    index of the corrected bit in the hamming word of the blocks with a
+    single error.
+
+    The results unpack, and index, as a (data, statuses) pair, so
+    data, statuses = hamming.decode_many(...) keeps working.
+    """
+
+    __slots__ = ("_data", "_statuses", "_syndromes")
+
+    def __init__(self, data: bytes, statuses: array, syndromes: array):
+        self._data = data
+        self._statuses = statuses
+        self._syndromes = syndromes
+
+    def __iter__(self) -> Iterator[Union[bytes, array]]:
+        return iter((self._data, self._statuses))
+
+    def __getitem__(self, index: int) -> Union[bytes, array]:
+        return (self._data, self._statuses)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DecodeResults):
+            return (self._data == other._data
+                    and self._statuses == other._statuses)
+        return tuple(self) == other
+
+    def get_data(self) -> bytes:
+        return self._data
+
+    def get_statuses(self) -> array:
+        """
+        Get the DecodeStatus of each block, one byte per block.
+        """
+        return self._statuses
+
+    def get_syndromes(self) -> array:
+        """
+        Get the syndrome of each block, meaningful for the blocks with a
+        single error only.
+        """
+        return self._syndromes
+
+    def get_number_of_blocks(self) -> int:
+        return len(self._statuses)
+
+    def count(self, status: DecodeStatus) -> int:
+        return self._statuses.count(status)
+
+    def _get_indexes(self, status: DecodeStatus) -> List[int]:
+        """
+        Get the indexes of the blocks with a status, searching the status
+        byte with bytes.find, which is fast while they are sparse.
+        """
+        statuses = self._statuses.tobytes()
+        indexes = []
+        i = statuses.find(status)
+        while i != -1:
+            indexes.append(i)
+            i = statuses.find(status, i + 1)
+        return indexes
+
+    def double_error_indexes(self) -> List[int]:
+        """
+        Get the indexes of the blocks with a double error detected.
+        """
+        return self._get_indexes(DecodeStatus.DOUBLE_ERROR_DETECTED)
+
+    def single_error_indexes(self) -> List[int]:
+        """
+        Get the indexes of the blocks with a single error corrected.
+        """
+        return self._get_indexes(DecodeStatus.SINGLE_ERROR_CORRECTED)
+
+    def get_corrected_bits(self) -> List[Tuple[int, int]]:
+        """
+        Get the (block index, index of the corrected bit in its hamming
+        word) pair of every block with a single error corrected.
+        """
+        return [(i, self._syndromes[i]) for i in self.single_error_indexes()]
+
+    def slice(self, first_block: int, last_block: int) -> DecodeResults:
+        """
+        Get the results of the blocks from first_block up to last_block.
+        """
+        buffer_size = len(self._data) // max(1, len(self._statuses))
+        return DecodeResults(
+            self._data[first_block * buffer_size:last_block * buffer_size],
+            self._statuses[first_block:last_block],
+            self._syndromes[first_block:last_block])
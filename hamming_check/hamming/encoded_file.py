@@ -0,0 +1,122 @@
+from array import array
+from io import SEEK_END, BufferedIOBase
+from math import ceil
+from typing import Optional
+
+from hamming_check.io import Header
+from hamming_check.types.backend_types import BackendTypes
+from hamming_check.types.layout_types import LayoutTypes
+from hamming_check.types.verbosity_types import VerbosityTypes
+
+from .decode_results import DecodeResults
+from .hamming import Hamming
+
+
+class EncodedFile(object):
+    """
+    Random access to the original data of a seekable encoded file.
+
+    Every block is coded into a fixed number of bytes (every 8 blocks
+    with the packed layout, and every interleave depth blocks when
+    interleaved), so a byte range of the original data is decoded by
+    seeking straight to the blocks covering it. The buffer size, layout,
+    interleave depth and original length are taken from the header of
+    the file when it has one.
+    """
+
+    def __init__(self,
+                 file_descriptor: BufferedIOBase,
+                 buffer_size: int = 1,
+                 layout: LayoutTypes = LayoutTypes.PADDED,
+                 backend: BackendTypes = BackendTypes.AUTO,
+                 interleave_depth: int = 1,
+                 cache_dir: Optional[str] = None):
+        self._file_descriptor = file_descriptor
+        if not file_descriptor.seekable():
+            raise ValueError("Random access needs a seekable encoded file")
+
+        file_descriptor.seek(0)
+        header_bytes = file_descriptor.read(Header.SIZE)
+        header = (Header.from_bytes(header_bytes)
+                  if Header.is_header(header_bytes) else None)
+        length = None
+        self._data_offset = 0
+        if header:
+            (buffer_size, layout, length,
+             interleave_depth) = (header.buffer_size, header.layout,
+                                  header.length, header.depth)
+            self._data_offset = header.get_size()
+
+        self._hamming = Hamming(buffer_size,
+                                VerbosityTypes.QUIET,
+                                backend,
+                                layout,
+                                interleave_depth,
+                                cache_dir=cache_dir)
+        self._buffer_size = buffer_size
+
+        # the smallest run of blocks starting on a byte boundary
+        if self._hamming.get_layout() == LayoutTypes.PACKED:
+            self._blocks_per_group = 8
+            self._bytes_per_group = self._hamming.get_number_of_output_bits()
+        else:
+            self._blocks_per_group = self._hamming.get_interleave_depth()
+            self._bytes_per_group = (
+                self._blocks_per_group *
+                self._hamming.get_number_of_output_bytes())
+
+        encoded_size = (file_descriptor.seek(0, SEEK_END) -
+                        self._data_offset)
+        decoded_size = self._hamming.get_decoded_size(encoded_size)
+        self._size = (decoded_size
+                      if length is None else min(length, decoded_size))
+
+    def get_buffer_size(self) -> int:
+        return self._buffer_size
+
+    def get_blocks_per_group(self) -> int:
+        """
+        Get the number of blocks of the smallest run of blocks that can be
+        read on its own.
+        """
+        return self._blocks_per_group
+
+    def get_size(self) -> int:
+        """
+        Get the length of the original data.
+        """
+        return self._size
+
+    def decode_range(self,
+                     offset: int,
+                     length: Optional[int] = None) -> DecodeResults:
+        """
+        Decode length bytes of the original data starting at offset, or up
+        to the end when length is None. Returns the DecodeResults of the
+        blocks covering them, holding only the decoded bytes of the range.
+        """
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("The offset and length can not be negative")
+
+        end = self._size if length is None else min(offset + length,
+                                                    self._size)
+        if offset >= end:
+            return DecodeResults(b"", array("B"), array("I"))
+
+        first_block = offset // self._buffer_size
+        last_block = ceil(end / self._buffer_size)
+        first_group = first_block // self._blocks_per_group
+        last_group = ceil(last_block / self._blocks_per_group)
+
+        self._file_descriptor.seek(self._data_offset +
+                                   first_group * self._bytes_per_group)
+        encoded_data = self._file_descriptor.read(
+            (last_group - first_group) * self._bytes_per_group)
+        first_group_block = first_group * self._blocks_per_group
+        results = self._hamming.decode_many(encoded_data).slice(
+            first_block - first_group_block, last_block - first_group_block)
+
+        data_offset = first_block * self._buffer_size
+        return DecodeResults(
+            results.get_data()[offset - data_offset:end - data_offset],
+            results.get_statuses(), results.get_syndromes())
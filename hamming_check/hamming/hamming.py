@@ -1,55 +1,156 @@
+from array import array
 from enum import Enum
-from math import ceil, log2
-from typing import List
-
-from hamming_check.hamming import DecodeResult, DecodeStatus
-from hamming_check.io import Bytes
+from math import ceil
+from typing import Optional
+
+from hamming_check.hamming import DecodeResult, DecodeResults, DecodeStatus
+from hamming_check.io import BitPacker, Bytes
+from hamming_check.types.backend_types import BackendTypes
+from hamming_check.types.buffer_types import Buffer, WritableBuffer
+from hamming_check.types.layout_types import LayoutTypes
 from hamming_check.types.verbosity_types import VerbosityTypes
-from hamming_check.utils import Utils
+
+from ._hamming_tables import _HammingTables
+from ._python_backend import _PythonBackend
+from .interleaver import Interleaver
+from ._table_backend import _TableBackend
+from .tracer import PrintTracer, Tracer
+
+try:
+    from ._numpy_backend import _NumpyBackend
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 
 class Hamming(object):
 
-    def __init__(self, buffer_size: int = 1, verbose: VerbosityTypes = 0):
+    def __init__(self,
+                 buffer_size: int = 1,
+                 verbose: VerbosityTypes = 0,
+                 backend: BackendTypes = BackendTypes.AUTO,
+                 layout: LayoutTypes = LayoutTypes.PADDED,
+                 interleave_depth: int = 1,
+                 tracer: Optional[Tracer] = None,
+                 cache_dir: Optional[str] = None):
         self._buffer_size = buffer_size
-        self._verbose = verbose
-
-        self._number_of_input_bits = buffer_size * 8
-
-        # k = 0
-        # while 2**k - 1 < m + k:
-        #     k += 1
-        self._number_of_parity_bits = int(log2(self._number_of_input_bits) + 1)
-        self._number_of_output_bits = (self._number_of_input_bits +
-                                       self._number_of_parity_bits + 1)
-        self._number_of_output_bytes = ceil((self._number_of_output_bits) / 8)
-
-        # pre calculate the syndromes bits index, parity bits indexes
-        # and data bit indexes
-        self._syndrome_bits_indexes = [[
-            j for j in range(3, self._number_of_output_bits)
-            if (j & (2**i)) and not Utils.is_power_of_two(j)
-        ] for i in range(self._number_of_parity_bits)]
-        self._parity_bits_indexes = [
-            2**i for i in range(self._number_of_parity_bits)
-        ]
-        self._data_bits_indexes = [
-            j for j in range(self._number_of_output_bits)
-            if j and not Utils.is_power_of_two(j)
-        ]
+        self._layout = LayoutTypes(layout)
+
+        # the code tables only depend on the buffer size, so they are
+        # shared by every Hamming object of that buffer size, and loaded
+        # from the cache directory when given
+        self._cache_dir = cache_dir
+        self._tables = tables = _HammingTables.get(buffer_size, cache_dir)
+        self._number_of_input_bits = tables.number_of_input_bits
+        self._number_of_parity_bits = tables.number_of_parity_bits
+        self._number_of_output_bits = tables.number_of_output_bits
+        self._number_of_output_bytes = tables.number_of_output_bytes
+        self._parity_bits_indexes = tables.parity_bits_indexes
+        self._data_bits_indexes = tables.data_bits_indexes
+        self._data_runs = tables.data_runs
+        self._parity_masks = tables.parity_masks
+        self._check_masks = tables.check_masks
+        self._output_mask = tables.output_mask
+
+        # the packed layout drops the padding bits of every hamming word
+        self._packer = (BitPacker(self._number_of_output_bits,
+                                  self._number_of_output_bytes)
+                        if self._layout == LayoutTypes.PACKED else None)
+
+        # the interleaver spreads burst errors over interleave_depth words
+        self._interleaver = None
+        if interleave_depth > 1:
+            if self._packer:
+                raise ValueError("Interleaving needs the padded layout")
+            self._interleaver = Interleaver(interleave_depth,
+                                            self._number_of_output_bytes)
+
+        self.set_backend(backend)
+        self.set_verbosity(verbose)
+        if tracer is not None:
+            self.set_tracer(tracer)
 
     def set_verbosity(self, verbosity: VerbosityTypes):
         """
-        Set the verbosity of the hamming code.
+        Set the verbosity of the hamming code. The hamming steps verbosity
+        prints the steps of every block through a PrintTracer.
         """
-        setattr(self, "_verbose", verbosity)
+        self._verbose = verbosity
+        self._tracer = (PrintTracer()
+                        if verbosity >= VerbosityTypes.HAMMING_STEPS else None)
         return self
 
     def get_verbosity(self):
         """
-        Set the verbosity of the hamming code.
+        Get the verbosity of the hamming code.
+        """
+        return self._verbose
+
+    def set_tracer(self, tracer: Optional[Tracer]):
+        """
+        Set the tracer receiving the steps taken to encode/decode each
+        block, or None to disable tracing.
+        """
+        self._tracer = tracer
+        return self
+
+    def get_tracer(self) -> Optional[Tracer]:
+        return self._tracer
+
+    def set_backend(self, backend: BackendTypes):
+        """
+        Set the backend used for encoding/decoding many blocks at once.
+        """
+        backend = BackendTypes(backend)
+
+        if backend == BackendTypes.AUTO:
+            if _TableBackend.supports(self):
+                backend = BackendTypes.TABLE
+            elif HAS_NUMPY:
+                backend = BackendTypes.NUMPY
+            else:
+                backend = BackendTypes.PYTHON
+
+        # the table and numpy backends only depend on the buffer size, so
+        # they are shared through the code tables
+        if backend == BackendTypes.TABLE:
+            self._backend = self._tables.get_backend(
+                _TableBackend, lambda: _TableBackend(self), self._cache_dir)
+        elif backend == BackendTypes.NUMPY:
+            if not HAS_NUMPY:
+                raise ValueError("The numpy backend requires numpy, "
+                                 "install it with: pip install numpy")
+            self._backend = self._tables.get_backend(
+                _NumpyBackend, lambda: _NumpyBackend(self))
+        else:
+            self._backend = _PythonBackend(self)
+
+        setattr(self, "_backend_type", backend)
+        return self
+
+    def get_backend(self) -> BackendTypes:
+        """
+        Get the backend used for encoding/decoding many blocks at once.
+        """
+        return getattr(self, "_backend_type")
+
+    def get_buffer_size(self) -> int:
+        """
+        Get the number of data bytes of a block.
         """
-        return getattr(self, "_verbose")
+        return self._buffer_size
+
+    def get_layout(self) -> LayoutTypes:
+        """
+        Get the layout of the hamming words coded many blocks at once.
+        """
+        return self._layout
+
+    def get_interleave_depth(self) -> int:
+        """
+        Get the number of hamming words interleaved together.
+        """
+        return self._interleaver.get_depth() if self._interleaver else 1
 
     def get_number_of_output_bytes(self) -> int:
         """
@@ -57,23 +158,59 @@ class Hamming(object):
         """
         return self._number_of_output_bytes
 
-    def _get_syndromes(self, hamming_word: Bytes) -> List[Bytes]:
+    def get_number_of_output_bits(self) -> int:
         """
-        Get the syndromes of a hamming word.
+        Get the number of bits of a hamming word.
         """
-        return [
-            Bytes(
-                (hamming_word[j] for j in self._syndrome_bits_indexes[i]),
-                endian="little",
-            ) for i in range(self._number_of_parity_bits)
-        ]
+        return self._number_of_output_bits
 
-    def _get_parity_bits(self, hamming_word: Bytes) -> List[Bytes]:
+    def get_encoded_size(self, number_of_bytes: int) -> int:
         """
-        Get the syndromes of a hamming word.
+        Get the size of number_of_bytes bytes encoded by encode_many.
         """
-        return Bytes((hamming_word[i] for i in self._parity_bits_indexes),
-                     endian="little")
+        number_of_blocks = ceil(number_of_bytes / self._buffer_size)
+        if self._packer:
+            return self._packer.get_packed_size(number_of_blocks)
+        return number_of_blocks * self._number_of_output_bytes
+
+    def get_decoded_size(self, number_of_bytes: int) -> int:
+        """
+        Get the size of number_of_bytes bytes decoded by decode_many.
+        """
+        if self._packer:
+            number_of_blocks = self._packer.get_number_of_words(
+                number_of_bytes)
+        else:
+            number_of_blocks = ceil(number_of_bytes /
+                                    self._number_of_output_bytes)
+        return number_of_blocks * self._buffer_size
+
+    def get_bit_offset(self, block: int, bit: int,
+                       number_of_blocks: int) -> int:
+        """
+        Get the offset of the bit of the hamming word of a block in a buffer
+        of number_of_blocks blocks encoded by encode_many, following the
+        layout and the interleaving of the buffer.
+        """
+        if self._packer:
+            return block * self._number_of_output_bits + bit
+
+        number_of_word_bits = 8 * self._number_of_output_bytes
+        depth = self.get_interleave_depth()
+        if depth == 1:
+            return block * number_of_word_bits + bit
+
+        # the last group of the buffer may be interleaved with less words
+        (group, word) = divmod(block, depth)
+        group_depth = min(depth, number_of_blocks - group * depth)
+        return group * depth * number_of_word_bits + bit * group_depth + word
+
+    def _to_bits(self, word: int, size: int) -> Bytes:
+        """
+        Get the first size bits of an integer as a Bytes object.
+        """
+        return Bytes(endian="little").from_bytes(
+            word.to_bytes(ceil(size / 8), byteorder="little"))[:size]
 
     def get_data(self, hamming_word: Bytes) -> Bytes:
         """
@@ -82,119 +219,287 @@ class Hamming(object):
         return Bytes((hamming_word[i] for i in self._data_bits_indexes),
                      endian="little")
 
+    def _encode_word(self, input_word: int) -> int:
+        """
+        Encode the data bits of an integer into a hamming word.
+        """
+
+        # copy the m bits to the output, one run at a time
+        output_word = 0
+        for (input_index, output_index, run_mask) in self._data_runs:
+            output_word |= (
+                (input_word >> input_index) & run_mask) << output_index
+
+        # the parity bits are the parity of the masked syndrome words
+        for (i, mask) in enumerate(self._parity_masks):
+            output_word |= ((output_word & mask).bit_count() & 1) << (1 << i)
+
+        # calculate the global g parity bit
+        return output_word | (output_word.bit_count() & 1)
+
+    def _bits_string(self, word: int, size: int) -> str:
+        """
+        Get the first size bits of an integer as a string of 0 and 1.
+        """
+        return self._to_bits(word, size).to01()
+
+    @staticmethod
+    def _masked_bits_string(word: int, mask: int) -> str:
+        """
+        Get the bits of an integer covered by a mask, in index order, as a
+        string of 0 and 1.
+        """
+        return "".join(str((word >> j) & 1)
+                       for j in range(mask.bit_length()) if (mask >> j) & 1)
+
+    def _trace_encode_steps(self, input_bytes: bytes, input_word: int,
+                            output_word: int) -> None:
+        """
+        Send the steps taken to encode a hamming word to the tracer.
+        """
+        parity_bits_mask = sum(1 << (2**i)
+                               for i in range(self._number_of_parity_bits))
+
+        data_word = output_word & ~parity_bits_mask & ~1
+
+        self._tracer.trace(
+            "encode",
+            input=bytes(input_bytes),
+            input_bits=self._bits_string(input_word,
+                                         self._number_of_input_bits),
+            data_bits=self._bits_string(data_word,
+                                        self._number_of_output_bits),
+            parity=[(2**i, self._masked_bits_string(output_word, mask),
+                     (output_word >> (2**i)) & 1)
+                    for (i, mask) in enumerate(self._parity_masks)],
+            global_parity=output_word & 1,
+            output_bits=self._bits_string(output_word,
+                                          self._number_of_output_bits))
+
     def encode(self, input_bytes: bytes) -> bytes:
         """
         Encode a byte array using the hamming code.
         """
 
-        input_bits = (Bytes(
-            endian="little").from_bytes(input_bytes).pad_to_size(
-                self._number_of_input_bits))
+        if len(input_bytes) > self._buffer_size:
+            raise ValueError(f"Can not encode {len(input_bytes)} bytes with a "
+                             f"{self._buffer_size} bytes hamming code")
 
-        output_bits = Bytes(endian="little", ).from_size(
-            self._number_of_output_bits)
+        input_word = int.from_bytes(input_bytes, byteorder="little")
+        output_word = self._encode_word(input_word)
 
-        # copy the m bits to the output
-        j = 0
-        for i in range(1, self._number_of_output_bits):
-            if not Utils.is_power_of_two(i):
-                output_bits[i] = input_bits[j]
-                j += 1
+        if self._tracer is not None and self._tracer.sample():
+            self._trace_encode_steps(input_bytes, input_word, output_word)
 
-        if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-            print(
-                f"\n\tEncoding {input_bytes} -> {input_bits}\n",
-                f"\tCopied the M bits to the output hamming word -> {output_bits}",
-            )
+        return output_word.to_bytes(self._number_of_output_bytes,
+                                    byteorder="little")
 
-        # syndrome words for the input bits
-        parity_words = self._get_syndromes(output_bits)
+    def encode_many(self, input_bytes: Buffer) -> bytes:
+        """
+        Encode a buffer holding many blocks of buffer_size bytes into one
+        contiguous buffer of hamming words. The last block is zero padded.
+        With the packed layout the hamming words are concatenated bit
+        after bit, and every 8 blocks give exactly n bytes. With an
+        interleave depth D the bits of every D hamming words are
+        interleaved, and the last group may hold less than D words.
+        """
 
-        for i in range(self._number_of_parity_bits):
-            output_bits[2**i] = parity_words[i].get_parity()
+        if self._tracer is not None:
+            input_view = memoryview(input_bytes).cast("B")
+            encoded = b"".join(
+                self.encode(bytes(input_view[i:i + self._buffer_size]))
+                for i in range(0, len(input_view), self._buffer_size))
+        else:
+            encoded = self._backend.encode_many(input_bytes)
 
-        # calculate the global g parity bit
-        output_bits[0] = output_bits.get_parity()
+        if self._packer:
+            return self._packer.pack(encoded)
+        if self._interleaver:
+            return self._interleaver.interleave(encoded)
+        return encoded
 
-        if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-            print("\tExtracted the parity words from the M bits: ")
-            for i, word in enumerate(parity_words):
-                print(f"\t\tC{2**i} -> {word} -> {word.get_parity()}")
-            print(f"\tCalculated the global parity bit -> {output_bits[0]}\n"
-                  f"\tHamming word generated -> {output_bits}")
+    @staticmethod
+    def _get_output_view(output_buffer: WritableBuffer,
+                         size: int) -> memoryview:
+        """
+        Get a byte view of the first size bytes of a writable buffer.
+        """
+        output_view = memoryview(output_buffer).cast("B")
+        if output_view.readonly:
+            raise ValueError("Can not write to a read-only buffer")
+        if len(output_view) < size:
+            raise ValueError(f"Can not write {size} bytes to a "
+                             f"{len(output_view)} bytes buffer")
+        return output_view[:size]
+
+    def encode_into(self, input_buffer: Buffer,
+                    output_buffer: WritableBuffer) -> int:
+        """
+        Encode a buffer holding many blocks of buffer_size bytes into a
+        preallocated writable buffer, as encode_many does, and get the
+        number of bytes written. Both buffers can be any object supporting
+        the buffer protocol (bytes, bytearray, memoryview, mmap, numpy
+        arrays). With the padded layout and no interleaving the hamming
+        words are written straight to the output buffer.
+        """
+        input_view = memoryview(input_buffer).cast("B")
+        size = self.get_encoded_size(len(input_view))
+        output_view = self._get_output_view(output_buffer, size)
+
+        if self._tracer is not None or self._packer or self._interleaver:
+            output_view[:] = self.encode_many(input_view)
+        else:
+            self._backend.encode_into(input_view, output_view)
+        return size
 
-        return output_bits.tobytes()
+    def _get_data_word(self, hamming_word: int) -> int:
+        """
+        Get the data bits from a hamming word as an integer.
+        """
+        data_word = 0
+        for (input_index, output_index, run_mask) in self._data_runs:
+            data_word |= (
+                (hamming_word >> output_index) & run_mask) << input_index
+        return data_word
+
+    def _get_syndrome(self, hamming_word: int) -> int:
+        """
+        Get the syndrome of a hamming word, that is the index of the
+        flipped bit for a single error.
+        """
+        syndrome = 0
+        for (i, mask) in enumerate(self._check_masks):
+            syndrome |= ((hamming_word & mask).bit_count() & 1) << i
+        return syndrome
 
-    def decode(self, hamming_word_bytes) -> DecodeResult:
+    def _get_status(self, syndrome: int, g: int) -> DecodeStatus:
+        """
+        Get the decode status from the syndrome and global parity of a
+        hamming word.
+        """
+        if not syndrome and not g:
+            return DecodeStatus.NO_ERROR
+        # an odd number of flipped bits pointing inside the hamming word
+        # is a single error, on the global parity bit when syndrome = 0
+        if g and syndrome < self._number_of_output_bits:
+            return DecodeStatus.SINGLE_ERROR_CORRECTED
+        return DecodeStatus.DOUBLE_ERROR_DETECTED
+
+    def decode(self, hamming_word_bytes: bytes) -> DecodeResult:
         """
         Decode a byte array using the hamming code.
         """
 
-        hamming_word = (Bytes(
-            endian="little").from_bytes(hamming_word_bytes).pad_to_size(
-                self._number_of_output_bytes *
-                8)[:self._number_of_output_bits])
-        data_bits = self.get_data(hamming_word)
-
-        old_verbose = self.get_verbosity()
-        self.set_verbosity(VerbosityTypes.QUIET)
-
-        # re-hammify the input bits for checking
-        hamming_word_prime = Bytes(endian="little").from_bytes(
-            self.encode(data_bits.tobytes()))[:self._number_of_output_bits]
-
-        self.set_verbosity(old_verbose)
-
-        # extract the hamming word syndrome
-        hamming_word_parity = self._get_parity_bits(hamming_word)
-
-        # extract the newly generated hamming word syndrome
-        hamming_word_prime_parity = Bytes(
-            [b.get_parity() for b in self._get_syndromes(hamming_word_prime)],
-            endian="little",
-        )
-
-        syndrome_bits = hamming_word_parity ^ hamming_word_prime_parity
-        syndrome = int.from_bytes(syndrome_bits.tobytes(), byteorder="little")
-
-        if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-            print(
-                f"\n\tDecoding {hamming_word_bytes} -> {hamming_word}\n",
-                f"\tExtracted the M bits from the hamming word-> {data_bits}\n"
-                f"\tRe-hammified the input bits for checking -> {hamming_word_prime}\n"
-                f"\tExtracted the parity bits from the hamming word -> {hamming_word_parity}\n"
-                f"\tExtracted the parity bits from the re-hammified word -> {hamming_word_prime_parity}\n"
-                f"\tCalculated the syndrome word -> {hamming_word_parity } ^ {hamming_word_prime_parity} -> {syndrome_bits} -> {syndrome}",
-            )
-
-        result = DecodeResult()
-
-        if not syndrome:
-            result.set_status(DecodeStatus.NO_ERROR)
-            if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-                print("\tsyndrome = 0 -> No error detected")
-        elif syndrome <= self._number_of_output_bits:
-            result.set_status(DecodeStatus.SINGLE_ERROR_CORRECTED)
-            hamming_word_prime[syndrome] ^= 1
-            if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-                print(
-                    f"\tSyndrome = {syndrome} -> Corrected the single error on index {syndrome} -> {hamming_word_prime}"
-                )
-
-        g = hamming_word.get_parity()
-        g_prime = hamming_word_prime.get_parity()
-
-        if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-            print(f"\tCalculated the new G' parity bit -> {g_prime}")
-
-        if g ^ g_prime:
-            result.set_status(DecodeStatus.DOUBLE_ERROR_DETECTED)
-            if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-                print(f"\tG = {g} != G' = {g_prime} -> Double error detected")
-        else:
-            if self._verbose >= VerbosityTypes.HAMMING_STEPS:
-                print(
-                    f"\tG = {g} == G' = {g_prime} -> The hamming word is correct"
-                )
+        if len(hamming_word_bytes) > self._number_of_output_bytes:
+            raise ValueError(f"Can not decode {len(hamming_word_bytes)} bytes "
+                             f"with a {self._number_of_output_bytes} bytes "
+                             f"hamming word")
+
+        hamming_word = (int.from_bytes(hamming_word_bytes, byteorder="little")
+                        & self._output_mask)
+
+        syndrome = self._get_syndrome(hamming_word)
+        g = hamming_word.bit_count() & 1
+        status = self._get_status(syndrome, g)
+
+        received_word = hamming_word
+        if status == DecodeStatus.SINGLE_ERROR_CORRECTED:
+            hamming_word ^= 1 << syndrome
+
+        if self._tracer is not None and self._tracer.sample():
+            self._tracer.trace(
+                "decode",
+                input=bytes(hamming_word_bytes),
+                input_bits=self._bits_string(received_word,
+                                             self._number_of_output_bits),
+                syndrome=syndrome,
+                syndrome_bits=self._bits_string(
+                    syndrome, self._number_of_parity_bits),
+                g=g,
+                status=status.name,
+                output_bits=self._bits_string(hamming_word,
+                                              self._number_of_output_bits))
+
+        return DecodeResult(
+            self._get_data_word(hamming_word).to_bytes(self._buffer_size,
+                                                       byteorder="little"),
+            status, syndrome
+            if status == DecodeStatus.SINGLE_ERROR_CORRECTED else None)
+
+    def decode_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        """
+        Decode a buffer holding many hamming words into DecodeResults: one
+        contiguous buffer of data blocks, an array with the DecodeStatus of
+        each block and the corrected bits, unpacking as a (data, statuses)
+        pair. A truncated last hamming word is zero padded, but with the
+        packed layout the trailing bits too short for a word are ignored.
+        """
 
-        return result.set_data(self.get_data(hamming_word_prime).tobytes())
+        if self._packer:
+            hamming_words_bytes = self._packer.unpack(hamming_words_bytes)
+        if self._interleaver:
+            hamming_words_bytes = self._interleaver.deinterleave(
+                hamming_words_bytes)
+
+        if self._tracer is not None:
+            input_view = memoryview(hamming_words_bytes).cast("B")
+            results = [
+                self.decode(
+                    bytes(input_view[i:i + self._number_of_output_bytes]))
+                for i in range(0, len(input_view),
+                               self._number_of_output_bytes)
+            ]
+            return DecodeResults(
+                b"".join(r.get_data() for r in results),
+                array("B", (r.get_status() for r in results)),
+                array("I", (r.get_corrected_bit() or 0 for r in results)))
+
+        return self._backend.decode_many(hamming_words_bytes)
+
+    def verify_many(self, hamming_words_bytes: Buffer) -> DecodeResults:
+        """
+        Check a buffer holding many hamming words without decoding it: only
+        the syndrome and the global parity of each block are computed, so
+        the DecodeResults hold the statuses and the syndromes of the blocks,
+        and no data. The blocks are not traced.
+        """
+        if self._packer:
+            hamming_words_bytes = self._packer.unpack(hamming_words_bytes)
+        if self._interleaver:
+            hamming_words_bytes = self._interleaver.deinterleave(
+                hamming_words_bytes)
+
+        return self._backend.verify_many(hamming_words_bytes)
+
+    def decode_into(self,
+                    input_buffer: Buffer,
+                    output_buffer: WritableBuffer,
+                    status_out: Optional[WritableBuffer] = None) -> int:
+        """
+        Decode a buffer holding many hamming words into a preallocated
+        writable buffer, as decode_many does, and get the number of bytes
+        written. The DecodeStatus of each block is written to status_out,
+        a writable buffer of at least one byte per block, when given. The
+        buffers can be any object supporting the buffer protocol (bytes,
+        bytearray, memoryview, mmap, numpy arrays). The data blocks are
+        written straight to the output buffer.
+        """
+        input_view = memoryview(input_buffer).cast("B")
+        size = self.get_decoded_size(len(input_view))
+        number_of_blocks = size // self._buffer_size
+        output_view = self._get_output_view(output_buffer, size)
+        status_view = (self._get_output_view(status_out, number_of_blocks)
+                       if status_out is not None else memoryview(
+                           bytearray(number_of_blocks)))
+
+        if self._tracer is not None:
+            (output_view[:], status_view[:]) = self.decode_many(input_view)
+            return size
+
+        if self._packer:
+            input_view = memoryview(self._packer.unpack(input_view))
+        if self._interleaver:
+            input_view = memoryview(
+                self._interleaver.deinterleave(input_view))
+        self._backend.decode_into(input_view, output_view, status_view)
+        return size
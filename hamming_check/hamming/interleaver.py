@@ -0,0 +1,134 @@
+from math import ceil
+from typing import Callable, Dict, List, Tuple
+
+from hamming_check.types import Buffer
+from hamming_check.utils import Utils
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Interleaver(object):
+    """
+    Interleaves the bits of groups of depth hamming words, so the bit j of
+    the word d of a group is sent at position j * depth + d of the group.
+
+    A burst of up to depth flipped bits then hits every hamming word of
+    the group at most once, leaving single errors that are corrected.
+    Interleaving is a bit permutation inside each group, applied to whole
+    chunks with one translate table per (input byte lane, output byte
+    lane) pair, or as a numpy bit matrix transpose for big groups when
+    numpy is installed. A last group shorter than depth words is
+    interleaved with a smaller depth, so the size of the data never
+    changes.
+    """
+
+    # bigger groups need too many tables, each applied to too short lanes
+    MAX_NUMBER_OF_TABLE_BYTES = 256
+
+    def __init__(self, depth: int, number_of_bytes: int):
+        if depth < 1:
+            raise ValueError(f"The interleaving depth must be at least 1, "
+                             f"not {depth}")
+
+        self._depth = depth
+        self._number_of_bytes = number_of_bytes
+        # translate tables of each depth, for interleaving and back
+        self._tables = {}
+
+    def get_depth(self) -> int:
+        return self._depth
+
+    def _get_permutation_tables(
+            self, number_of_bytes: int,
+            permutation: Callable[[int], int]) -> Dict[int, List[Tuple]]:
+        """
+        Get the translate tables moving every bit i of a group of
+        number_of_bytes bytes to the bit permutation(i).
+        """
+        moves = {}
+        for i in range(number_of_bytes):
+            for bit in range(8):
+                (j, shift) = divmod(permutation(8 * i + bit), 8)
+                moves.setdefault((j, i), []).append((bit, shift))
+
+        # most lanes move their bits the same way, so the tables are shared
+        tables = {}
+        lane_tables = {j: [] for j in range(number_of_bytes)}
+        for ((j, i), bit_moves) in moves.items():
+            bit_moves = tuple(bit_moves)
+            if bit_moves not in tables:
+                tables[bit_moves] = bytes(
+                    sum(((value >> bit) & 1) << shift
+                        for (bit, shift) in bit_moves)
+                    for value in range(256))
+            lane_tables[j].append((i, tables[bit_moves]))
+        return lane_tables
+
+    def _get_tables(self, depth: int) -> Tuple[Dict[int, List[Tuple]], ...]:
+        if depth not in self._tables:
+            number_of_bits = 8 * self._number_of_bytes
+            self._tables[depth] = (
+                self._get_permutation_tables(
+                    depth * self._number_of_bytes,
+                    lambda i: (i % number_of_bits) * depth +
+                    i // number_of_bits),
+                self._get_permutation_tables(
+                    depth * self._number_of_bytes,
+                    lambda i: (i % depth) * number_of_bits + i // depth))
+        return self._tables[depth]
+
+    def _permute_groups(self, words: Buffer, depth: int,
+                        inverse: bool) -> bytes:
+        """
+        Interleave, or deinterleave, whole groups of depth words.
+        """
+        group_size = depth * self._number_of_bytes
+        if np is not None and group_size > self.MAX_NUMBER_OF_TABLE_BYTES:
+            shape = (-1, depth, 8 * self._number_of_bytes)
+            if inverse:
+                shape = (-1, 8 * self._number_of_bytes, depth)
+            bits = np.unpackbits(np.frombuffer(words, dtype=np.uint8),
+                                 bitorder="little").reshape(shape)
+            return np.packbits(bits.transpose(0, 2, 1),
+                               bitorder="little").tobytes()
+
+        return Utils.translate_lanes(Utils.split_lanes(words, group_size),
+                                     self._get_tables(depth)[inverse],
+                                     group_size)
+
+    def _permute(self, words: Buffer, inverse: bool) -> bytes:
+        group_size = self._depth * self._number_of_bytes
+        number_of_words = ceil(len(words) / self._number_of_bytes)
+        if self._depth == 1 or not number_of_words:
+            return bytes(words)
+
+        words = bytes(words) + bytes(number_of_words * self._number_of_bytes -
+                                     len(words))
+        full_size = len(words) // group_size * group_size
+
+        permuted = []
+        if full_size:
+            permuted.append(
+                self._permute_groups(words[:full_size], self._depth, inverse))
+        if full_size < len(words):
+            permuted.append(
+                self._permute_groups(
+                    words[full_size:],
+                    (len(words) - full_size) // self._number_of_bytes,
+                    inverse))
+        return b"".join(permuted)
+
+    def interleave(self, words: Buffer) -> bytes:
+        """
+        Interleave a buffer of hamming words, zero padding the last one.
+        """
+        return self._permute(words, False)
+
+    def deinterleave(self, words: Buffer) -> bytes:
+        """
+        Deinterleave a buffer of interleaved hamming words.
+        """
+        return self._permute(words, True)
@@ -0,0 +1,105 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Optional, TextIO
+
+
+class Tracer(ABC):
+    """
+    Receives the steps taken to encode/decode each hamming word as
+    structured events.
+
+    A hamming code without a tracer does a single None check per block,
+    so tracing costs nothing when disabled. With every = N only 1 in N
+    blocks is traced, the others pay one counter increment.
+    """
+
+    def __init__(self, every: int = 1):
+        if every < 1:
+            raise ValueError(f"Can not trace 1 in {every} blocks")
+
+        self._every = every
+        self._block = -1
+
+    def sample(self) -> bool:
+        """
+        Count a block, and tell whether it is traced.
+        """
+        self._block += 1
+        return self._block % self._every == 0
+
+    @abstractmethod
+    def trace(self, event: str, **fields: Any) -> None:
+        """
+        Handle an event of the block just sampled.
+        """
+
+
+class PrintTracer(Tracer):
+    """
+    Prints the steps taken to encode/decode each hamming word as text.
+    """
+
+    def __init__(self, every: int = 1, file: Optional[TextIO] = None):
+        super().__init__(every)
+        self._file = file
+
+    def trace(self, event: str, **fields: Any) -> None:
+        # resolved on every call, so a replaced sys.stdout is honored
+        file = self._file or sys.stdout
+        if event == "encode":
+            print(
+                f"\n\tEncoding {fields['input']} -> {fields['input_bits']}\n",
+                f"\tCopied the M bits to the output hamming word -> "
+                f"{fields['data_bits']}",
+                file=file)
+            print("\tExtracted the parity words from the M bits: ", file=file)
+            for (index, masked_bits, bit) in fields["parity"]:
+                print(f"\t\tC{index} -> {masked_bits} -> {bit}", file=file)
+            print(
+                f"\tCalculated the global parity bit -> "
+                f"{fields['global_parity']}\n"
+                f"\tHamming word generated -> {fields['output_bits']}",
+                file=file)
+        elif event == "decode":
+            (syndrome, g) = (fields["syndrome"], fields["g"])
+            print(
+                f"\n\tDecoding {fields['input']} -> {fields['input_bits']}\n",
+                f"\tCalculated the syndrome word -> "
+                f"{fields['syndrome_bits']} -> {syndrome}\n"
+                f"\tCalculated the global G parity bit -> {g}",
+                file=file)
+            if fields["status"] == "NO_ERROR":
+                print("\tsyndrome = 0 and G = 0 -> No error detected",
+                      file=file)
+            elif fields["status"] == "SINGLE_ERROR_CORRECTED":
+                print(
+                    f"\tSyndrome = {syndrome} and G = 1 -> Corrected the "
+                    f"single error on index {syndrome} -> "
+                    f"{fields['output_bits']}",
+                    file=file)
+            else:
+                print(
+                    f"\tSyndrome = {syndrome} and G = {g} -> "
+                    f"Double error detected",
+                    file=file)
+
+
+class JsonTracer(Tracer):
+    """
+    Writes the steps taken to encode/decode each hamming word to a file,
+    one JSON object per line. Bytes are written as hex strings.
+    """
+
+    def __init__(self, file: TextIO, every: int = 1):
+        super().__init__(every)
+        self._file = file
+
+    def trace(self, event: str, **fields: Any) -> None:
+        self._file.write(
+            json.dumps({
+                "event": event,
+                "block": self._block,
+                **fields
+            },
+                       default=bytes.hex) + "\n")
@@ -5,9 +5,15 @@ io
 io package - Various classes for reading and writing data.
 """
 
-__all__ = ["Bytes", "File"]
+__all__ = [
+    "BitPacker", "Bytes", "File", "Header", "MappedFile", "PrefixedReader"
+]
 __author__ = "Pablo Alessandro Santos Hugen"
 __doc__ = "io package - Various classes for reading and writing data."
 
+from .bit_packer import BitPacker
 from .bytes import Bytes
 from .file import File
+from .header import Header
+from .mapped_file import MappedFile
+from .prefixed_reader import PrefixedReader
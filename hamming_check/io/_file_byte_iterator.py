@@ -1,34 +1,71 @@
 from io import BufferedReader
 from typing import Generator, Iterator
 
+# default number of bytes read from the file at once
+DEFAULT_CHUNK_SIZE = 4 << 20
+
 
 class _FileByteIterator(object):
     """
-    Reads the file and returns a iterator over the bytes
+    Reads the file in big chunks and returns a iterator over its blocks
     """
 
     def __init__(self,
                  file_descriptor: BufferedReader,
-                 bytes_per_read: int = 1):
+                 bytes_per_read: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
         self._file_descriptor = file_descriptor
         self._bytes_per_read = bytes_per_read
 
+        # the chunk is reused for every read, and holds a whole number of
+        # blocks so a block never spans two chunks
+        self._chunk = bytearray(
+            max(1, chunk_size // bytes_per_read) * bytes_per_read)
+        self._chunk_view = memoryview(self._chunk)
+        self._chunk_offset = 0
+        self._chunk_size = 0
+        self._end_of_file = False
+
     def _is_closed(self) -> bool:
         return self._file.closed
 
+    def _read_chunk(self) -> None:
+        """
+        Read the next chunk, retrying the short reads of pipes and sockets
+        until the chunk is full or the file ends.
+        """
+        self._chunk_offset = 0
+        self._chunk_size = 0
+
+        while self._chunk_size < len(self._chunk):
+            read = self._file_descriptor.readinto(
+                self._chunk_view[self._chunk_size:])
+            if not read:
+                self._end_of_file = True
+                break
+            self._chunk_size += read
+
     # Iterator implementation,
-    # For reading bytes on Demand
+    # For reading blocks on Demand. The blocks are views of the reused
+    # chunk, so they are only valid until the next block is read
 
-    def __iter__(self) -> Iterator[bytes]:
+    def __iter__(self) -> Iterator[memoryview]:
         return self
 
-    def __next__(self) -> bytearray:
+    def __next__(self) -> memoryview:
+
+        if self._chunk_offset >= self._chunk_size:
+            if self._end_of_file:
+                raise StopIteration
+            self._read_chunk()
+            if not self._chunk_size:
+                raise StopIteration
 
-        self.byte = self._file_descriptor.read(self._bytes_per_read)
-        if self.byte:
-            return bytes(self.byte)
-        else:
-            raise StopIteration
+        block_end = min(self._chunk_offset + self._bytes_per_read,
+                        self._chunk_size)
+        self.byte = self._chunk_view[self._chunk_offset:block_end]
+        self._chunk_offset = block_end
+        return self.byte
 
     # Generator implementation
     # For reading all the bytes in one shot
@@ -0,0 +1,131 @@
+from math import ceil
+from typing import Dict, List, Tuple
+
+from hamming_check.types import Buffer
+from hamming_check.utils import Utils
+
+from .bytes import Bytes
+
+
+class BitPacker(object):
+    """
+    Packs words of number_of_bits bits, each stored in number_of_bytes
+    bytes, into a stream without the padding bits of each word, and
+    unpacks them back.
+
+    Every 8 words pack into exactly number_of_bits bytes, so chunks
+    holding a multiple of 8 words can be packed and unpacked on their own.
+    """
+
+    # words up to this size are packed a group of 8 words at a time with
+    # translate tables, bigger ones are copied one slice per word
+    MAX_NUMBER_OF_TABLE_BYTES = 16
+
+    def __init__(self, number_of_bits: int, number_of_bytes: int):
+        self._number_of_bits = number_of_bits
+        self._number_of_bytes = number_of_bytes
+        self._number_of_word_bits = number_of_bytes * 8
+
+        self._pack_tables = None
+        self._unpack_tables = None
+        if number_of_bytes <= self.MAX_NUMBER_OF_TABLE_BYTES:
+            (self._pack_tables,
+             self._unpack_tables) = self._get_group_tables()
+
+    def _get_group_tables(self) -> Tuple[Dict[int, List[Tuple]], ...]:
+        """
+        Get the translate tables moving the bits of each byte lane of a
+        group of 8 padded words to the byte lanes of its packed form, and
+        back. The bits of a padded byte are contiguous once packed, so
+        each one lands in at most two packed bytes.
+        """
+        pack_tables = {j: [] for j in range(self._number_of_bits)}
+        unpack_tables = {i: [] for i in range(8 * self._number_of_bytes)}
+
+        for i in range(8 * self._number_of_bytes):
+            (word, byte) = divmod(i, self._number_of_bytes)
+            mask = (1 << min(8, self._number_of_bits - 8 * byte)) - 1
+            (j, shift) = divmod(word * self._number_of_bits + 8 * byte, 8)
+
+            pack_tables[j].append(
+                (i, bytes(((value & mask) << shift) & 0xFF
+                          for value in range(256))))
+            unpack_tables[i].append(
+                (j, bytes((value >> shift) & mask for value in range(256))))
+            if shift and mask >> (8 - shift):
+                pack_tables[j + 1].append(
+                    (i, bytes((value & mask) >> (8 - shift)
+                              for value in range(256))))
+                unpack_tables[i].append(
+                    (j + 1, bytes((value << (8 - shift)) & mask
+                                  for value in range(256))))
+
+        return pack_tables, unpack_tables
+
+    def get_packed_size(self, number_of_words: int) -> int:
+        """
+        Get the number of bytes of number_of_words packed words.
+        """
+        return ceil(number_of_words * self._number_of_bits / 8)
+
+    def get_number_of_words(self, packed_size: int) -> int:
+        """
+        Get the number of words packed in packed_size bytes. The padding
+        of the last byte is always smaller than a word.
+        """
+        return packed_size * 8 // self._number_of_bits
+
+    def _copy_bits(self, source: Bytes, source_step: int,
+                   destination: Bytes, destination_step: int,
+                   number_of_words: int) -> None:
+        """
+        Copy the first number_of_bits bits of every word, one slice per word.
+        """
+        for i in range(number_of_words):
+            destination[i * destination_step:i * destination_step +
+                        self._number_of_bits] = source[
+                            i * source_step:i * source_step +
+                            self._number_of_bits]
+
+    def pack(self, words: Buffer) -> bytes:
+        """
+        Pack a buffer of padded words into a bit stream.
+        """
+        number_of_words = ceil(len(words) / self._number_of_bytes)
+        if not number_of_words:
+            return b""
+
+        if self._pack_tables is not None:
+            lanes = Utils.split_lanes(words, 8 * self._number_of_bytes)
+            packed = Utils.translate_lanes(lanes, self._pack_tables,
+                                           self._number_of_bits)
+            return packed[:self.get_packed_size(number_of_words)]
+
+        unpacked = Bytes(endian="little").from_bytes(words).pad_to_size(
+            number_of_words * self._number_of_word_bits)
+        packed = Bytes(endian="little").from_size(number_of_words *
+                                                  self._number_of_bits)
+        self._copy_bits(unpacked, self._number_of_word_bits, packed,
+                        self._number_of_bits, number_of_words)
+        return packed.tobytes()
+
+    def unpack(self, packed_words: Buffer) -> bytes:
+        """
+        Unpack a bit stream into a buffer of padded words.
+        """
+        number_of_words = self.get_number_of_words(len(packed_words))
+        if not number_of_words:
+            return b""
+
+        if self._unpack_tables is not None:
+            lanes = Utils.split_lanes(packed_words, self._number_of_bits)
+            unpacked = Utils.translate_lanes(lanes, self._unpack_tables,
+                                             8 * self._number_of_bytes)
+            return unpacked[:number_of_words * self._number_of_bytes]
+
+        packed = Bytes(endian="little").from_bytes(packed_words)
+        unpacked = Bytes(endian="little").from_size(
+            number_of_words * self._number_of_word_bits)
+        self._copy_bits(packed, self._number_of_bits, unpacked,
+                        self._number_of_word_bits, number_of_words)
+        return unpacked.tobytes()
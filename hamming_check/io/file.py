@@ -1,25 +1,46 @@
 from io import BufferedIOBase
 from typing import Generator, Iterable
 
-from ._file_byte_iterator import _FileByteIterator
+from hamming_check.types import Buffer
+
+from ._file_byte_iterator import DEFAULT_CHUNK_SIZE, _FileByteIterator
 
 
 class File(object):
     """
     Abstraction for managing a file and its bytes.
+
+    Iterating a File reads chunk_size bytes at once into a reused buffer,
+    and yields memoryview slices of bytes_per_read bytes that are only
+    valid until the next one is read.
     """
 
     def __init__(self,
                  file_descriptor: BufferedIOBase,
-                 bytes_per_read: int = 1):
+                 bytes_per_read: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.__bytes_per_read = bytes_per_read
+        self.__chunk_size = chunk_size
         self.__file_descriptor = file_descriptor
 
-    def __iter__(self) -> Iterable[int]:
-        return _FileByteIterator(self.__file_descriptor, self.__bytes_per_read)
+    def __iter__(self) -> Iterable[memoryview]:
+        return _FileByteIterator(self.__file_descriptor, self.__bytes_per_read,
+                                 self.__chunk_size)
+
+    def write(self, bytes_to_write: Buffer) -> None:
+        self.__file_descriptor.write(bytes_to_write)
+
+    def seekable(self) -> bool:
+        return self.__file_descriptor.seekable()
 
-    def write(self, bytes_to_write: bytearray) -> None:
+    def write_at(self, offset: int, bytes_to_write: bytes) -> None:
+        """
+        Overwrite bytes already written at offset, keeping the position.
+        """
+        position = self.__file_descriptor.tell()
+        self.__file_descriptor.seek(offset)
         self.__file_descriptor.write(bytes_to_write)
+        self.__file_descriptor.seek(position)
 
     def get_bytes(self, number_of_bytes: int) -> Generator[int, int, bytes]:
         for i in range(number_of_bytes):
@@ -0,0 +1,97 @@
+from struct import Struct
+from typing import Optional
+
+from hamming_check.types.layout_types import LayoutTypes
+
+
+class Header(object):
+    """
+    Versioned header of a self-describing encoded file, holding everything
+    needed to decode it: the buffer size, the layout, the interleaving
+    depth and the length of the original data.
+
+    The header is a fixed size little-endian record:
+    magic (4 bytes), version (1 byte), layout (1 byte), buffer size
+    (4 bytes), original length (8 bytes, all ones when unknown) and, since
+    version 2, interleaving depth (4 bytes).
+    """
+
+    MAGIC = b"\x89HAM"
+    VERSION = 2
+
+    # length written when the original length is not known up front,
+    # for example when encoding from a pipe into a pipe
+    UNKNOWN_LENGTH = (1 << 64) - 1
+
+    _STRUCTS = {1: Struct("<4sBBIQ"), 2: Struct("<4sBBIQI")}
+    SIZE = _STRUCTS[VERSION].size
+    # offset of the original length, patched once it is known
+    LENGTH_OFFSET = 10
+
+    _LAYOUTS = [LayoutTypes.PADDED, LayoutTypes.PACKED]
+
+    def __init__(self,
+                 buffer_size: int = 1,
+                 layout: LayoutTypes = LayoutTypes.PADDED,
+                 length: Optional[int] = None,
+                 depth: int = 1,
+                 version: int = VERSION):
+        self.buffer_size = buffer_size
+        self.layout = LayoutTypes(layout)
+        self.length = length
+        self.depth = depth
+        self.version = version
+
+    def get_size(self) -> int:
+        """
+        Get the number of bytes of the header, which depends on its version.
+        """
+        return self._STRUCTS[self.version].size
+
+    @classmethod
+    def is_header(cls, data: bytes) -> bool:
+        """
+        Check if data starts with the magic of a header.
+        """
+        return bytes(data[:len(cls.MAGIC)]) == cls.MAGIC
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Header":
+        """
+        Parse a header of any known version, raising ValueError if it is
+        not a valid header.
+        """
+        if len(data) <= len(cls.MAGIC) or not cls.is_header(data):
+            raise ValueError("Not a hamming_check header")
+
+        version = data[len(cls.MAGIC)]
+        if version not in cls._STRUCTS:
+            raise ValueError(f"Unsupported header version {version}")
+        if len(data) < cls._STRUCTS[version].size:
+            raise ValueError("Truncated hamming_check header")
+
+        (_, _, layout, buffer_size, length,
+         *depth) = cls._STRUCTS[version].unpack_from(data)
+        depth = depth[0] if depth else 1
+        if layout >= len(cls._LAYOUTS) or not buffer_size or not depth:
+            raise ValueError("Corrupted hamming_check header")
+
+        return cls(buffer_size, cls._LAYOUTS[layout],
+                   None if length == cls.UNKNOWN_LENGTH else length, depth,
+                   version)
+
+    @classmethod
+    def length_to_bytes(cls, length: Optional[int]) -> bytes:
+        """
+        Get the bytes of the original length field.
+        """
+        return (cls.UNKNOWN_LENGTH if length is None else length).to_bytes(
+            8, byteorder="little")
+
+    def to_bytes(self) -> bytes:
+        fields = (self.MAGIC, self.version, self._LAYOUTS.index(self.layout),
+                  self.buffer_size, self.UNKNOWN_LENGTH
+                  if self.length is None else self.length)
+        if self.version >= 2:
+            fields += (self.depth, )
+        return self._STRUCTS[self.version].pack(*fields)
@@ -0,0 +1,106 @@
+from io import BufferedIOBase
+from mmap import ACCESS_READ, ACCESS_WRITE, mmap
+from os import fstat, stat
+from os.path import samestat
+from stat import S_ISREG
+from typing import Iterator, Optional
+
+
+class MappedFile(object):
+    """
+    Abstraction for managing a regular file through a memory map.
+
+    A MappedFile opened without a size maps the whole file for reading
+    from its current position, and one opened with a size is resized and
+    mapped for writing, so reading and writing many bytes costs no
+    read/write syscalls. A writable MappedFile opened without a size maps
+    the whole file for reading and for flipping bits in place, and only
+    the pages holding flipped bits are written back.
+    """
+
+    def __init__(self,
+                 file_descriptor: BufferedIOBase,
+                 bytes_per_read: int = 1,
+                 size: Optional[int] = None,
+                 writable: bool = False):
+        self.__bytes_per_read = bytes_per_read
+        self.__file_descriptor = file_descriptor
+        self.__map_file_descriptor = None
+        self.__offset = 0
+
+        if size is None:
+            size = fstat(file_descriptor.fileno()).st_size
+            access = ACCESS_READ
+            # bytes already read from the file, like a header, are skipped
+            self.__offset = min(file_descriptor.tell(), size)
+            if writable:
+                self.__map_file_descriptor = open(file_descriptor.name,
+                                                  "r+b")
+                file_descriptor = self.__map_file_descriptor
+                access = ACCESS_WRITE
+        else:
+            # a file opened only for writing can not be mapped,
+            # so it is opened again for reading and writing
+            self.__map_file_descriptor = open(file_descriptor.name, "r+b")
+            self.__map_file_descriptor.truncate(size)
+            file_descriptor = self.__map_file_descriptor
+            access = ACCESS_WRITE
+
+        # empty files can not be mapped
+        self.__map = (mmap(file_descriptor.fileno(), size, access=access)
+                      if size else bytearray())
+
+    @staticmethod
+    def can_map(file_descriptor: BufferedIOBase) -> bool:
+        """
+        Check if a file is a regular file that can be opened again by its
+        name and mapped, and not a pipe, socket, terminal or a redirected
+        standard stream.
+        """
+        try:
+            file_stat = fstat(file_descriptor.fileno())
+            return (S_ISREG(file_stat.st_mode)
+                    and samestat(file_stat, stat(file_descriptor.name)))
+        except (AttributeError, OSError, TypeError, ValueError):
+            return False
+
+    def get_size(self) -> int:
+        """
+        Get the number of bytes left to read, or to write.
+        """
+        return len(self.__map) - self.__offset
+
+    def __iter__(self) -> Iterator[bytes]:
+        for offset in range(self.__offset, len(self.__map),
+                            self.__bytes_per_read):
+            yield self.__map[offset:offset + self.__bytes_per_read]
+
+    def write(self, bytes_to_write: bytes) -> None:
+        end = self.__offset + len(bytes_to_write)
+        if end > len(self.__map):
+            raise ValueError(f"Can not write past the end of a "
+                             f"{len(self.__map)} bytes mapped file")
+
+        self.__map[self.__offset:end] = bytes_to_write
+        self.__offset = end
+
+    def flip_bit(self, bit: int) -> None:
+        """
+        Flip a bit of a writable mapped file, counted from the position the
+        file was opened at.
+        """
+        (byte, shift) = divmod(self.__offset * 8 + bit, 8)
+        if byte >= len(self.__map):
+            raise ValueError(f"Can not flip a bit past the end of a "
+                             f"{len(self.__map)} bytes mapped file")
+        self.__map[byte] ^= 1 << shift
+
+    def close(self) -> None:
+        if isinstance(self.__map, mmap):
+            if self.__map_file_descriptor:
+                self.__map.flush()
+            self.__map.close()
+        if self.__map_file_descriptor:
+            self.__map_file_descriptor.close()
+        self.__file_descriptor.close()
+        return self
@@ -0,0 +1,35 @@
+from io import BufferedIOBase, RawIOBase
+
+
+class PrefixedReader(RawIOBase):
+    """
+    A raw stream reading some bytes, already read from a file, before the
+    rest of the file, so they are put back in front of it.
+
+    Wrapped in a BufferedReader, it stands for a stream whose first bytes
+    had to be read to tell what they are, like a header on a pipe.
+    """
+
+    def __init__(self, prefix: bytes, file_descriptor: BufferedIOBase):
+        super().__init__()
+        self._prefix = memoryview(bytes(prefix))
+        self._file_descriptor = file_descriptor
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        return self._file_descriptor.readinto(buffer)
+
+    def fileno(self) -> int:
+        return self._file_descriptor.fileno()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file_descriptor.close()
+        super().close()
@@ -0,0 +1,20 @@
+"""
+stream
+~~~~~~
+
+stream - Coding of streams and sockets
+"""
+
+__all__ = [
+    "AsyncCodec", "FramedReceiver", "FramedSender", "decode_stream",
+    "encode_stream", "noise_stream", "read_stream", "rechunk", "stats_stream",
+    "write_stream"
+]
+
+__author__ = "Pablo Alessandro Santos Hugen"
+__doc__ = "stream - Coding of streams and sockets"
+
+from .async_codec import AsyncCodec
+from .pipeline import (decode_stream, encode_stream, noise_stream, read_stream,
+                       rechunk, stats_stream, write_stream)
+from .transport import FramedReceiver, FramedSender
@@ -0,0 +1,118 @@
+import asyncio
+from asyncio import IncompleteReadError, StreamReader, StreamWriter
+from concurrent.futures import Executor
+from math import ceil
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from hamming_check.hamming import Hamming
+from hamming_check.utils import Stats
+
+
+class AsyncCodec(object):
+    """
+    Encodes/decodes an asyncio stream into another.
+
+    The reader is read a batch of whole blocks, or hamming words, at a
+    time with readexactly, every batch is coded by a single call to the
+    hamming code and written to the writer, waiting for it to drain, so a
+    slow peer holds the reading back. When an executor is given, batches
+    of at least executor_threshold bytes are coded in it, so the event
+    loop keeps serving other tasks meanwhile.
+    """
+
+    # approximate number of encoded bytes of each batch
+    BATCH_SIZE = 1 << 16
+    # smaller batches are coded faster than they are handed to an executor
+    EXECUTOR_THRESHOLD = 1 << 16
+
+    def __init__(self,
+                 hamming: Hamming,
+                 batch_size: int = BATCH_SIZE,
+                 executor: Optional[Executor] = None,
+                 executor_threshold: int = EXECUTOR_THRESHOLD):
+        self._hamming = hamming
+        self._executor = executor
+        self._executor_threshold = executor_threshold
+
+        # batches hold a multiple of 8 blocks and of the interleave depth,
+        # so a batch never ends inside a packed byte or an interleaved group
+        blocks_per_group = 8 * hamming.get_interleave_depth()
+        self._blocks_per_batch = max(
+            blocks_per_group, batch_size //
+            hamming.get_number_of_output_bytes() // blocks_per_group *
+            blocks_per_group)
+
+    def get_blocks_per_batch(self) -> int:
+        return self._blocks_per_batch
+
+    async def encode(self, reader: StreamReader,
+                     writer: StreamWriter) -> Stats:
+        """
+        Encode the reader into the writer up to the end of the reader. The
+        last block is zero padded. The writer is left open.
+        """
+        stats = Stats()
+        buffer_size = self._hamming.get_buffer_size()
+
+        while data := await self._read(reader,
+                                       self._blocks_per_batch * buffer_size,
+                                       stats):
+            stats.blocks += ceil(len(data) / buffer_size)
+            encoded_data = await self._code(self._hamming.encode_many, data,
+                                            stats)
+            await self._write(writer, encoded_data, stats)
+        return stats
+
+    async def decode(self, reader: StreamReader,
+                     writer: StreamWriter) -> Stats:
+        """
+        Decode the reader into the writer up to the end of the reader. The
+        blocks are counted by decode status in the returned stats, and
+        blocks with a double error are written as decoded. The writer is
+        left open.
+        """
+        stats = Stats()
+        batch_size = self._hamming.get_encoded_size(
+            self._blocks_per_batch * self._hamming.get_buffer_size())
+
+        while data := await self._read(reader, batch_size, stats):
+            (decoded_data, statuses) = await self._code(
+                self._hamming.decode_many, data, stats)
+            stats.add_statuses(statuses)
+            await self._write(writer, decoded_data, stats)
+        return stats
+
+    @staticmethod
+    async def _read(reader: StreamReader, size: int, stats: Stats) -> bytes:
+        """
+        Read size bytes, or what is left before the end of the reader.
+        """
+        start = perf_counter()
+        try:
+            data = await reader.readexactly(size)
+        except IncompleteReadError as error:
+            data = error.partial
+        stats.read_time += perf_counter() - start
+        stats.bytes_in += len(data)
+        return data
+
+    async def _code(self, code: Callable[[bytes], Any], data: bytes,
+                    stats: Stats) -> Any:
+        start = perf_counter()
+        if (self._executor is not None
+                and len(data) >= self._executor_threshold):
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, code, data)
+        else:
+            result = code(data)
+        stats.code_time += perf_counter() - start
+        return result
+
+    @staticmethod
+    async def _write(writer: StreamWriter, data: bytes, stats: Stats) -> None:
+        start = perf_counter()
+        writer.write(data)
+        await writer.drain()
+        stats.write_time += perf_counter() - start
+        stats.bytes_out += len(data)
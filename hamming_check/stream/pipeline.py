@@ -0,0 +1,167 @@
+from io import BufferedIOBase
+from math import ceil
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+
+from hamming_check.hamming import Hamming
+from hamming_check.utils import ErrorInjector, Stats
+
+# approximate number of bytes handed to the hamming code per call
+CHUNK_SIZE = 1 << 20
+
+# Every stage of the pipeline is a generator over byte chunks, so stages
+# compose by nesting and only a few chunks are in memory at once:
+#
+#   write_stream(encode_stream(read_stream(input_file), hamming),
+#                output_file)
+#
+# The stages taking a Stats count their part of the run in it.
+
+
+def read_stream(input_file: BufferedIOBase,
+                chunk_size: int = CHUNK_SIZE,
+                stats: Optional[Stats] = None) -> Iterator[bytes]:
+    """
+    Read a file chunk_size bytes at a time, up to its end.
+    """
+    while True:
+        start = perf_counter()
+        data = input_file.read(chunk_size)
+        if stats is not None:
+            stats.read_time += perf_counter() - start
+            stats.bytes_in += len(data)
+        if not data:
+            return
+        yield data
+
+
+def write_stream(chunks: Iterable[bytes],
+                 output_file: BufferedIOBase,
+                 stats: Optional[Stats] = None) -> int:
+    """
+    Write the chunks to a file, and get the number of bytes written.
+    """
+    number_of_bytes = 0
+    for data in chunks:
+        start = perf_counter()
+        output_file.write(data)
+        if stats is not None:
+            stats.write_time += perf_counter() - start
+            stats.bytes_out += len(data)
+        number_of_bytes += len(data)
+    return number_of_bytes
+
+
+def rechunk(chunks: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """
+    Re-block chunks of any size into chunks of chunk_size bytes, but the
+    last one, that holds what is left.
+    """
+    buffer = bytearray()
+    for data in chunks:
+        # chunks already of the right size are passed through
+        if not buffer and len(data) == chunk_size:
+            yield bytes(data)
+            continue
+
+        buffer += data
+        if len(buffer) >= chunk_size:
+            end = len(buffer) // chunk_size * chunk_size
+            with memoryview(buffer) as view:
+                for start in range(0, end, chunk_size):
+                    yield bytes(view[start:start + chunk_size])
+            del buffer[:end]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _get_blocks_per_chunk(hamming: Hamming, chunk_size: int) -> int:
+    """
+    Get the number of blocks of each chunk, a multiple of 8 blocks and of
+    the interleave depth, so a chunk never ends inside a packed byte or an
+    interleaved group.
+    """
+    blocks_per_group = 8 * hamming.get_interleave_depth()
+    return max(
+        blocks_per_group, chunk_size // hamming.get_number_of_output_bytes() //
+        blocks_per_group * blocks_per_group)
+
+
+def encode_stream(chunks: Iterable[bytes],
+                  hamming: Hamming,
+                  chunk_size: int = CHUNK_SIZE,
+                  stats: Optional[Stats] = None) -> Iterator[bytes]:
+    """
+    Encode chunks of any size, re-blocked into chunks of whole blocks of
+    about chunk_size encoded bytes. The last block is zero padded.
+    """
+    buffer_size = hamming.get_buffer_size()
+    for data in rechunk(chunks,
+                        _get_blocks_per_chunk(hamming, chunk_size) *
+                        buffer_size):
+        start = perf_counter()
+        encoded_data = hamming.encode_many(data)
+        if stats is not None:
+            stats.code_time += perf_counter() - start
+            stats.blocks += ceil(len(data) / buffer_size)
+        yield encoded_data
+
+
+def decode_stream(chunks: Iterable[bytes],
+                  hamming: Hamming,
+                  chunk_size: int = CHUNK_SIZE,
+                  stats: Optional[Stats] = None,
+                  length: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Decode chunks of any size, re-blocked into chunks of whole hamming
+    words of about chunk_size bytes. The blocks are counted by decode
+    status in the stats, and blocks with a double error are yielded as
+    decoded. When the length of the original data is given, the padding
+    of the last block is trimmed.
+    """
+    encoded_chunk_size = hamming.get_encoded_size(
+        _get_blocks_per_chunk(hamming, chunk_size) *
+        hamming.get_buffer_size())
+    for data in rechunk(chunks, encoded_chunk_size):
+        start = perf_counter()
+        results = hamming.decode_many(data)
+        if stats is not None:
+            stats.code_time += perf_counter() - start
+            stats.add_statuses(results.get_statuses())
+
+        decoded_data = results.get_data()
+        if length is not None:
+            decoded_data = decoded_data[:length]
+            length -= len(decoded_data)
+        if decoded_data:
+            yield decoded_data
+
+
+def noise_stream(chunks: Iterable[bytes],
+                 bit_error_rate: float,
+                 seed: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Flip every bit of the chunks independently with a probability of
+    bit_error_rate, like a binary symmetric channel, with an ErrorInjector.
+    """
+    error_injector = ErrorInjector(seed, log=False)
+    for data in chunks:
+        noisy_data = bytearray(data)
+        if error_injector.inject_bsc(noisy_data, bit_error_rate):
+            data = bytes(noisy_data)
+        yield data
+
+
+def stats_stream(chunks: Iterable[bytes],
+                 stats: Stats,
+                 counter: str = "bytes_in") -> Iterator[bytes]:
+    """
+    Count the bytes of the chunks passing through in the bytes_in or
+    bytes_out counter of the stats, for the pipelines that are not read or
+    written by read_stream or write_stream.
+    """
+    if counter not in ("bytes_in", "bytes_out"):
+        raise ValueError(f"Unknown stats counter: {counter}")
+    for data in chunks:
+        setattr(stats, counter, getattr(stats, counter) + len(data))
+        yield data
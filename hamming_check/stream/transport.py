@@ -0,0 +1,255 @@
+import socket
+from io import BufferedIOBase
+from math import ceil
+from struct import Struct
+from time import perf_counter
+from typing import List, Tuple
+
+from hamming_check.hamming import DecodeResults, DecodeStatus, Hamming
+from hamming_check.types import FrameTypes, LayoutTypes
+from hamming_check.utils import Stats
+
+# frame type, first block index (or original data length for END frames)
+# and payload size
+FRAME_HEADER = Struct("<BQI")
+# a block index of the payload of a NACK frame
+BLOCK_INDEX = Struct("<Q")
+
+
+class _FramedSocket(object):
+    """
+    Sends and receives the frames of the framed transport over a socket.
+    """
+
+    # approximate number of encoded bytes of each data frame
+    FRAME_SIZE = 1 << 18
+
+    def __init__(self, sock: socket.socket, hamming: Hamming,
+                 frame_size: int, retransmit: bool):
+        self._socket = sock
+        self._hamming = hamming
+        self._buffer_size = hamming.get_buffer_size()
+        self._retransmit = retransmit
+
+        # the smallest run of blocks that can be coded on its own
+        self._blocks_per_group = (8 if hamming.get_layout()
+                                  == LayoutTypes.PACKED else
+                                  hamming.get_interleave_depth())
+        # frames hold a multiple of 8 blocks and of the interleave depth,
+        # so a frame never ends inside a packed byte or an interleaved group
+        blocks_per_group = 8 * hamming.get_interleave_depth()
+        self._blocks_per_frame = max(
+            blocks_per_group, frame_size //
+            hamming.get_number_of_output_bytes() // blocks_per_group *
+            blocks_per_group)
+
+    def get_blocks_per_frame(self) -> int:
+        return self._blocks_per_frame
+
+    def _send_frame(self,
+                    frame_type: FrameTypes,
+                    value: int,
+                    payload: bytes = b"") -> None:
+        self._socket.sendall(
+            FRAME_HEADER.pack(frame_type, value, len(payload)) + payload)
+
+    def _receive_exactly(self, size: int) -> bytearray:
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            number_of_bytes = self._socket.recv_into(view[received:])
+            if not number_of_bytes:
+                raise ConnectionError("The connection was closed inside a "
+                                      "frame")
+            received += number_of_bytes
+        return data
+
+    def _receive_frame(self) -> Tuple[FrameTypes, int, bytearray]:
+        (frame_type, value, size) = FRAME_HEADER.unpack(
+            self._receive_exactly(FRAME_HEADER.size))
+        return FrameTypes(frame_type), value, self._receive_exactly(size)
+
+
+class FramedSender(_FramedSocket):
+    """
+    Encodes a file into data frames of many hamming words sent over a
+    socket, each with a single sendall, followed by an end frame holding
+    the length of the original data.
+
+    With retransmit the sender then waits for NACK frames, and sends the
+    groups of blocks they list again, re-read from the seekable input
+    file, until a NACK frame lists none.
+    """
+
+    def __init__(self,
+                 sock: socket.socket,
+                 hamming: Hamming,
+                 frame_size: int = _FramedSocket.FRAME_SIZE,
+                 retransmit: bool = False):
+        super().__init__(sock, hamming, frame_size, retransmit)
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Encode the data of a frame. Subclasses may override it to alter
+        the hamming words sent, for example to simulate a noisy link.
+        """
+        return self._hamming.encode_many(data)
+
+    def _send_data(self, first_block: int, data: bytes, stats: Stats) -> None:
+        stats.blocks += ceil(len(data) / self._buffer_size)
+        start = perf_counter()
+        encoded_data = self.encode(data)
+        stats.code_time += perf_counter() - start
+        self._send_frame(FrameTypes.DATA, first_block, encoded_data)
+        stats.bytes_out += FRAME_HEADER.size + len(encoded_data)
+
+    def send(self, input_file: BufferedIOBase) -> Stats:
+        """
+        Send a file up to its end. The returned stats count the
+        retransmitted blocks too.
+        """
+        if self._retransmit and not input_file.seekable():
+            raise ValueError("Retransmission needs a seekable input file")
+
+        stats = Stats()
+        start = input_file.tell() if self._retransmit else 0
+        (length, block) = (0, 0)
+        while data := input_file.read(self._blocks_per_frame *
+                                      self._buffer_size):
+            self._send_data(block, data, stats)
+            length += len(data)
+            block += self._blocks_per_frame
+        stats.bytes_in = length
+        self._send_frame(FrameTypes.END, length)
+
+        group_size = self._blocks_per_group * self._buffer_size
+        while self._retransmit:
+            (frame_type, _, payload) = self._receive_frame()
+            if frame_type != FrameTypes.NACK:
+                raise ValueError(f"Expected a NACK frame, not a "
+                                 f"{frame_type.name} frame")
+            blocks = [block for (block, ) in BLOCK_INDEX.iter_unpack(payload)]
+            if not blocks:
+                break
+
+            for group in sorted({block // self._blocks_per_group
+                                 for block in blocks}):
+                input_file.seek(start + group * group_size)
+                self._send_data(group * self._blocks_per_group,
+                                input_file.read(group_size), stats)
+            self._send_frame(FrameTypes.END, length)
+        return stats
+
+
+class FramedReceiver(_FramedSocket):
+    """
+    Decodes the data frames received over a socket into a file up to the
+    end frame, trimming the padding of the last block.
+
+    With retransmit the receiver answers each end frame with a NACK frame
+    listing the blocks decoded with a double error, up to
+    max_retransmissions times, and writes them in place in the seekable
+    output file once they are received without one. The last NACK frame
+    lists no block.
+    """
+
+    MAX_RETRANSMISSIONS = 3
+
+    def __init__(self,
+                 sock: socket.socket,
+                 hamming: Hamming,
+                 frame_size: int = _FramedSocket.FRAME_SIZE,
+                 retransmit: bool = False,
+                 max_retransmissions: int = MAX_RETRANSMISSIONS):
+        super().__init__(sock, hamming, frame_size, retransmit)
+        self._max_retransmissions = max_retransmissions
+        self._double_error_blocks = set()
+
+    def get_double_error_blocks(self) -> List[int]:
+        """
+        Get the indexes of the blocks left with a double error by the
+        last receive.
+        """
+        return sorted(self._double_error_blocks)
+
+    def _write(self, output_file: BufferedIOBase, data: bytes,
+               stats: Stats) -> None:
+        output_file.write(data)
+        stats.bytes_out += len(data)
+
+    def _write_retransmitted(self, output_file: BufferedIOBase, start: int,
+                             first_block: int, results: DecodeResults,
+                             length: int, stats: Stats) -> None:
+        """
+        Write in place the asked blocks of a retransmitted frame that were
+        decoded without a double error.
+        """
+        data = results.get_data()
+        for (i, status) in enumerate(results.get_statuses()):
+            block = first_block + i
+            if (block not in self._double_error_blocks
+                    or status == DecodeStatus.DOUBLE_ERROR_DETECTED):
+                continue
+            self._double_error_blocks.discard(block)
+            offset = block * self._buffer_size
+            output_file.seek(start + offset)
+            self._write(
+                output_file,
+                data[i * self._buffer_size:min((i + 1) * self._buffer_size,
+                                               length - offset)], stats)
+        output_file.seek(start + length)
+
+    def receive(self, output_file: BufferedIOBase) -> Stats:
+        """
+        Receive a file up to its end. The returned stats count the
+        retransmitted blocks too.
+        """
+        if self._retransmit and not output_file.seekable():
+            raise ValueError("Retransmission needs a seekable output file")
+
+        stats = Stats()
+        self._double_error_blocks = set()
+        start = output_file.tell() if self._retransmit else 0
+        # the last decoded frame is written once the length is known
+        (pending, length, retransmissions) = (b"", None, 0)
+        while True:
+            (frame_type, value, payload) = self._receive_frame()
+            stats.bytes_in += FRAME_HEADER.size + len(payload)
+
+            if frame_type == FrameTypes.DATA:
+                time = perf_counter()
+                results = self._hamming.decode_many(payload)
+                stats.code_time += perf_counter() - time
+                stats.add_statuses(results.get_statuses())
+                if length is not None:
+                    self._write_retransmitted(output_file, start, value,
+                                              results, length, stats)
+                    continue
+                self._write(output_file, pending, stats)
+                pending = results.get_data()
+                self._double_error_blocks.update(
+                    value + i for i in results.double_error_indexes())
+
+            elif frame_type == FrameTypes.END:
+                if length is None:
+                    length = value
+                    self._write(output_file,
+                                pending[:max(0, length - stats.bytes_out)],
+                                stats)
+                    pending = b""
+                if not self._retransmit:
+                    return stats
+
+                blocks = b""
+                if retransmissions < self._max_retransmissions:
+                    blocks = b"".join(
+                        BLOCK_INDEX.pack(block)
+                        for block in sorted(self._double_error_blocks))
+                self._send_frame(FrameTypes.NACK, 0, blocks)
+                if not blocks:
+                    return stats
+                retransmissions += 1
+
+            else:
+                raise ValueError(f"Unexpected {frame_type.name} frame")
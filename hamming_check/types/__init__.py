@@ -5,9 +5,16 @@ types
 types - Enums and other related data types
 """
 
-__all__ = ["VerbosityTypes"]
+__all__ = [
+    "BackendTypes", "Buffer", "FrameTypes", "LayoutTypes", "VerbosityTypes",
+    "WritableBuffer"
+]
 
 __author__ = "Pablo Alessandro Santos Hugen"
 __doc__ = "cli - Command Line interface module"
 
+from .backend_types import BackendTypes
+from .buffer_types import Buffer, WritableBuffer
+from .frame_types import FrameTypes
+from .layout_types import LayoutTypes
 from .verbosity_types import VerbosityTypes
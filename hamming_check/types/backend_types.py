@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class BackendTypes(str, Enum):
+    """
+    Possible backends used for encoding/decoding many blocks at once.
+    """
+
+    AUTO = "auto"
+    PYTHON = "python"
+    NUMPY = "numpy"
+    TABLE = "table"
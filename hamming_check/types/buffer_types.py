@@ -0,0 +1,10 @@
+from mmap import mmap
+from typing import Union
+
+# buffers of bytes read by the hamming code, that are copied or viewed
+# through a memoryview, never resized. Any other object supporting the
+# buffer protocol, like a numpy array, works too
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+# preallocated buffers of bytes written by the hamming code in place
+WritableBuffer = Union[bytearray, memoryview, mmap]
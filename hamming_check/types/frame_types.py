@@ -0,0 +1,14 @@
+from enum import IntEnum
+
+
+class FrameTypes(IntEnum):
+    """
+    Possible types of the frames of the framed transport.
+    """
+
+    # many hamming words, starting at a block index
+    DATA = 0
+    # the end of the stream, with the length of the original data
+    END = 1
+    # the indexes of the blocks to send again, none when all were decoded
+    NACK = 2
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class LayoutTypes(str, Enum):
+    """
+    Possible layouts of the hamming words in an encoded stream.
+    """
+
+    # every hamming word is rounded up to whole bytes
+    PADDED = "padded"
+    # the hamming words are concatenated bit after bit
+    PACKED = "packed"
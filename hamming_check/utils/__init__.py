@@ -5,10 +5,12 @@ utils
 utils - Various utility functions.
 """
 
-__all__ = ["Utils"]
+__all__ = ["ErrorInjector", "Stats", "Utils"]
 
 __author__ = "Pablo Alessandro Santos Hugen"
 __doc__ = "utils - Various utility functions."
 # __import__ = ["Bytes", "File"]
 
 from .utils import Utils
+from .stats import Stats
+from .error_injector import ErrorInjector
@@ -0,0 +1,214 @@
+from array import array
+from math import log
+from random import Random
+from typing import Iterable, Optional, TextIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ErrorInjector(object):
+    """
+    Flips bits of a writable buffer, like a bytearray or a mmap of a file,
+    in bulk.
+
+    The errors follow a binary symmetric channel at a bit error rate, come
+    in bursts, or number exactly errors per codeword. The gaps between the
+    errors are drawn from a geometric distribution, so the cost is per
+    flipped bit rather than per bit of the buffer, and when numpy is
+    installed the errors are drawn and flipped as whole arrays. The errors
+    are reproducible for a seed and the same numpy availability, and the
+    index of every flipped bit is logged unless log is False.
+    """
+
+    # number of errors drawn at once by numpy, bounding the memory used
+    BATCH_SIZE = 1 << 20
+
+    def __init__(self, seed: Optional[int] = None, log: bool = True):
+        self._random = (Random(seed)
+                        if np is None else np.random.default_rng(seed))
+        self._log = array("Q") if log else None
+
+    def get_log(self) -> array:
+        """
+        Get the indexes of the bits flipped so far, in the order they were
+        flipped.
+        """
+        return self._log if self._log is not None else array("Q")
+
+    def write_log(self, log_file: TextIO, first_bit: int = 0) -> None:
+        """
+        Write the indexes of the bits flipped so far, one per line, shifted
+        by first_bit.
+        """
+        for start in range(0, len(self.get_log()), self.BATCH_SIZE):
+            log_file.write("".join(
+                f"{first_bit + bit}\n"
+                for bit in self.get_log()[start:start + self.BATCH_SIZE]))
+
+    def flip_bits(self, buffer, bits: Iterable[int]) -> int:
+        """
+        Flip the given bits of a buffer, and get their number.
+        """
+        if np is not None:
+            bits = (bits.astype(np.uint64, copy=False) if isinstance(
+                bits, np.ndarray) else np.fromiter(bits, dtype=np.uint64))
+            np.bitwise_xor.at(
+                np.frombuffer(buffer, dtype=np.uint8), bits >> np.uint64(3),
+                np.left_shift(1, bits & np.uint64(7)).astype(np.uint8))
+            if self._log is not None:
+                self._log.frombytes(bits.tobytes())
+            return len(bits)
+
+        bits = list(bits)
+        for bit in bits:
+            buffer[bit >> 3] ^= 1 << (bit & 7)
+        if self._log is not None:
+            self._log.extend(bits)
+        return len(bits)
+
+    def _get_gaps(self, probability: float, size: int):
+        """
+        Get size numbers of trials up to a success of the given probability.
+        """
+        if np is not None:
+            return self._random.geometric(probability, size)
+        log_failure = log(1 - probability)
+        return [
+            1 + int(log(1 - self._random.random()) / log_failure)
+            for _ in range(size)
+        ]
+
+    def _get_starts(self, number_of_bits: int, probability: float,
+                    length: int) -> Iterable:
+        """
+        Get the first bit of every run of length bits, separated by
+        geometric gaps, that starts before number_of_bits, in batches.
+        """
+        # a run starts length - 1 bits after the end of the gap following
+        # the last run, so the first run is counted from a run ending on
+        # the bit before the buffer, and can start on the bit 0
+        last = -length
+        while last < number_of_bits:
+            size = min(
+                self.BATCH_SIZE,
+                int((number_of_bits - last) * probability * 1.1) + 16)
+            if np is not None:
+                starts = last + np.cumsum(
+                    self._get_gaps(probability, size) + (length - 1))
+                (last, starts) = (int(starts[-1]),
+                                  starts[starts < number_of_bits])
+            else:
+                starts = []
+                for gap in self._get_gaps(probability, size):
+                    last += gap + length - 1
+                    if last >= number_of_bits:
+                        break
+                    starts.append(last)
+            yield starts
+
+    def inject_bsc(self, buffer, bit_error_rate: float) -> int:
+        """
+        Flip every bit of a buffer independently with a probability of
+        bit_error_rate, and get the number of flipped bits.
+        """
+        if not 0 <= bit_error_rate < 1:
+            raise ValueError("The bit error rate must be in [0, 1)")
+        if not bit_error_rate:
+            return 0
+        return sum(
+            self.flip_bits(buffer, bits)
+            for bits in self._get_starts(len(buffer) * 8, bit_error_rate, 1))
+
+    def inject_bursts(self, buffer, burst_rate: float,
+                      burst_length: int) -> int:
+        """
+        Flip bursts of burst_length consecutive bits of a buffer, starting
+        on every bit that is not in a burst with a probability of
+        burst_rate, and get the number of flipped bits. The last burst may
+        be cut by the end of the buffer.
+        """
+        if not 0 <= burst_rate < 1:
+            raise ValueError("The burst rate must be in [0, 1)")
+        if burst_length < 1:
+            raise ValueError("The burst length must be at least 1")
+        if not burst_rate:
+            return 0
+
+        number_of_bits = len(buffer) * 8
+        number_of_flipped_bits = 0
+        for starts in self._get_starts(number_of_bits, burst_rate,
+                                       burst_length):
+            if np is not None:
+                bits = (starts[:, None] +
+                        np.arange(burst_length)).ravel()
+                bits = bits[bits < number_of_bits]
+            else:
+                bits = [
+                    bit for start in starts
+                    for bit in range(start,
+                                     min(start + burst_length,
+                                         number_of_bits))
+                ]
+            number_of_flipped_bits += self.flip_bits(buffer, bits)
+        return number_of_flipped_bits
+
+    def inject_per_codeword(self,
+                            buffer,
+                            codeword_size: int,
+                            errors: int,
+                            codeword_bits: Optional[int] = None) -> int:
+        """
+        Flip exactly errors distinct bits of every whole codeword of
+        codeword_size bytes of a buffer, among its first codeword_bits bits
+        (by default all of them), and get the number of flipped bits.
+        """
+        codeword_bits = codeword_bits or codeword_size * 8
+        if not 0 <= errors <= codeword_bits <= codeword_size * 8:
+            raise ValueError(f"Can not flip {errors} bits of the first "
+                             f"{codeword_bits} bits of {codeword_size} bytes "
+                             f"codewords")
+        number_of_codewords = len(buffer) // codeword_size
+        if not errors or not number_of_codewords:
+            return 0
+
+        if np is None:
+            return self.flip_bits(buffer, [
+                8 * codeword_size * i + bit
+                for i in range(number_of_codewords)
+                for bit in self._random.sample(range(codeword_bits), errors)
+            ])
+
+        number_of_flipped_bits = 0
+        batch_size = max(1, self.BATCH_SIZE // max(errors, codeword_bits))
+        for first in range(0, number_of_codewords, batch_size):
+            size = min(batch_size, number_of_codewords - first)
+            bits = self._sample_bits(size, codeword_bits, errors)
+            bits += (8 * codeword_size *
+                     np.arange(first, first + size, dtype=np.uint64))[:, None]
+            number_of_flipped_bits += self.flip_bits(buffer, bits.ravel())
+        return number_of_flipped_bits
+
+    def _sample_bits(self, size: int, number_of_bits: int, errors: int):
+        """
+        Get a (size x errors) matrix of distinct bits in each row.
+        """
+        # few errors among many bits rarely collide, so the rows with a
+        # collision are drawn again, else the errors are the bits with the
+        # smallest random keys
+        if errors * errors >= number_of_bits:
+            return self._random.random((size, number_of_bits)).argpartition(
+                errors - 1, axis=1)[:, :errors].astype(np.uint64)
+
+        bits = self._random.integers(0, number_of_bits, (size, errors),
+                                     dtype=np.uint64)
+        while True:
+            bits.sort(axis=1)
+            collisions = (np.diff(bits, axis=1) == 0).any(axis=1)
+            if not collisions.any():
+                return bits
+            bits[collisions] = self._random.integers(
+                0, number_of_bits, (collisions.sum(), errors),
+                dtype=np.uint64)
@@ -0,0 +1,60 @@
+import json
+from array import array
+from time import perf_counter
+from typing import Dict
+
+from hamming_check.hamming.decode_status import DecodeStatus
+
+# iterating an IntFlag skips its zero member, NO_ERROR
+_STATUSES = (DecodeStatus.NO_ERROR, DecodeStatus.SINGLE_ERROR_CORRECTED,
+             DecodeStatus.DOUBLE_ERROR_DETECTED)
+
+
+class Stats(object):
+    """
+    Counters of an encoding/decoding run: blocks and their decode
+    statuses, bytes in and out, and the wall time spent reading, coding
+    and writing. Every counter is updated once per chunk, so they are
+    cheap enough to be always on.
+    """
+
+    def __init__(self):
+        self.blocks = 0
+        self.statuses = {status: 0 for status in _STATUSES}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.read_time = 0.0
+        self.code_time = 0.0
+        self.write_time = 0.0
+        self._start = perf_counter()
+
+    def add_statuses(self, statuses: array) -> None:
+        """
+        Count the blocks of a chunk by decode status.
+        """
+        self.blocks += len(statuses)
+        for status in _STATUSES:
+            self.statuses[status] += statuses.count(status)
+
+    def to_dict(self) -> Dict:
+        return {
+            "blocks": self.blocks,
+            **{
+                status.name.lower(): count
+                for (status, count) in self.statuses.items()
+            },
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "wall_time": perf_counter() - self._start,
+            "read_time": self.read_time,
+            "code_time": self.code_time,
+            "write_time": self.write_time,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def to_text(self) -> str:
+        return "\n".join(
+            f"{name}: {value:.6f}" if isinstance(value, float) else
+            f"{name}: {value}" for (name, value) in self.to_dict().items())
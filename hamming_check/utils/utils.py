@@ -1,5 +1,74 @@
+from math import ceil
+from typing import Dict, List, Tuple
+
+from hamming_check.types import Buffer
+
+
 class Utils(object):
 
     @staticmethod
     def is_power_of_two(x) -> bool:
         return x > 0 and (not (x & (x - 1)))
+
+    @staticmethod
+    def split_lanes(input_bytes: Buffer, lane_size: int) -> List[bytes]:
+        """
+        Split a buffer of blocks into one bytes object per byte position,
+        zero padding the last block when needed.
+        """
+        input_bytes = bytes(input_bytes)
+        number_of_blocks = ceil(len(input_bytes) / lane_size)
+        input_bytes += bytes(number_of_blocks * lane_size - len(input_bytes))
+        return [input_bytes[i::lane_size] for i in range(lane_size)]
+
+    @staticmethod
+    def xor_lanes(byte_strings: List[bytes], number_of_blocks: int) -> bytes:
+        """
+        Xor byte strings of the same size.
+        """
+        if len(byte_strings) == 1:
+            return byte_strings[0]
+
+        xored = 0
+        for byte_string in byte_strings:
+            xored ^= int.from_bytes(byte_string, byteorder="little")
+        return xored.to_bytes(number_of_blocks, byteorder="little")
+
+    @staticmethod
+    def join_lanes(lanes: List[bytes], lane_size: int,
+                   number_of_blocks: int) -> bytes:
+        """
+        Interleave one bytes object per byte position back into blocks.
+        """
+        output = bytearray(number_of_blocks * lane_size)
+        for (j, lane) in enumerate(lanes):
+            output[j::lane_size] = lane
+        return bytes(output)
+
+    @staticmethod
+    def join_lanes_into(lanes: List[bytes], lane_size: int,
+                        number_of_blocks: int, output: memoryview) -> None:
+        """
+        Interleave one bytes object per byte position back into blocks,
+        written to the start of a writable buffer. Strided copies to a
+        bytearray are much faster than to a memoryview, so the blocks are
+        joined in a bytearray and copied at once.
+        """
+        joined = bytearray(number_of_blocks * lane_size)
+        for (j, lane) in enumerate(lanes):
+            joined[j::lane_size] = lane
+        output[:len(joined)] = joined
+
+    @staticmethod
+    def translate_lanes(lanes: List[bytes], tables: Dict[int, List[Tuple]],
+                        lane_size: int) -> bytes:
+        """
+        Build every output lane as the xor of its (input lane, translate
+        table) pairs applied to the input lanes, and join them.
+        """
+        number_of_blocks = len(lanes[0])
+        return Utils.join_lanes([
+            Utils.xor_lanes([lanes[i].translate(table)
+                             for (i, table) in lane_tables], number_of_blocks)
+            for lane_tables in tables.values()
+        ], lane_size, number_of_blocks)
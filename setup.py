@@ -27,20 +27,27 @@ setup(
     url=about["__url__"],
         packages=find_packages(exclude=("tests", )),
     include_package_data=True,
-    python_requires=">=3.7.*",
+    python_requires=">=3.10",
     install_requires=["bitarray"],
+    extras_require={"numpy": ["numpy"]},
     license=about["__license__"],
     zip_safe=False,
     entry_points={
         "console_scripts": [
             "hamming_check=hamming_check.entry_points:cli",
             "hamming_flip=hamming_check.entry_points:flip_a_bit_in_file",
+            "hamming-bench=hamming_check.entry_points:bench",
+            "hamming-simulate=hamming_check.entry_points:simulate",
         ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
     ],
     keywords="hamming code sec dec",
 )
@@ -0,0 +1,69 @@
+"""
+tests.test_bench.py
+~~~~~~~~~~~~~~~~~~~
+
+Test suite for the Bench module.
+"""
+import json
+import sys
+
+from hamming_check.bench import Bench, Simulation
+from hamming_check.bench.bench import OPERATIONS
+from hamming_check.bench.simulation import RATES
+
+
+class TestBench:
+    """Test suite for the Bench module."""
+
+    def test_bench_json(self, monkeypatch, tmp_path):
+        """Test that every operation of every backend is measured."""
+
+        output = tmp_path / "bench.json"
+        monkeypatch.setattr(sys, "argv", [
+            "hamming-bench", "-b", "1", "16", "--backends", "python",
+            "table", "-s", "64", "-r", "1", "-o",
+            str(output)
+        ])
+
+        assert Bench().run() == 0
+
+        results = json.loads(output.read_text())["results"]
+        # the table backend can not code 16 bytes blocks
+        assert [(r["buffer_size"], r["backend"], r["operation"])
+                for r in results] == [
+                    (1, "python", operation) for operation in OPERATIONS
+                ] + [(1, "table", operation) for operation in OPERATIONS] + [
+                    (16, "python", operation) for operation in OPERATIONS
+                ]
+
+
+class TestSimulation:
+    """Test suite for the Simulation module."""
+
+    def test_simulation_json(self, monkeypatch, tmp_path):
+        """Test that the rates add up with their intervals, and that the
+        results of a seed do not depend on the number of jobs."""
+
+        results = []
+        for jobs in ("1", "2"):
+            output = tmp_path / f"simulation{jobs}.json"
+            monkeypatch.setattr(sys, "argv", [
+                "hamming-simulate", "-b", "1", "4", "--ber", "0", "0.02",
+                "-n", "3000", "-j", jobs, "-o",
+                str(output)
+            ])
+            assert Simulation().run() == 0
+            results.append(json.loads(output.read_text())["results"])
+
+        timings = ("seconds", "mb_per_s", "blocks_per_s", "code_mb_per_s")
+        for result in results[0]:
+            statuses = [result[rate]["count"] for rate in RATES[:3]]
+            assert (sum(statuses) == result["blocks"] == 3000 and all(
+                result[rate]["low"] <= result[rate]["rate"] <=
+                result[rate]["high"] for rate in RATES))
+            assert ((result["ber"] == 0) == (statuses[0] == 3000) ==
+                    (result["flipped_bits"] == 0))
+        assert ([{key: value for (key, value) in result.items()
+                  if key not in timings} for result in results[0]] ==
+                [{key: value for (key, value) in result.items()
+                  if key not in timings} for result in results[1]])
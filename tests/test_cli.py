@@ -0,0 +1,289 @@
+"""
+tests.test_cli.py
+~~~~~~~~~~~~~~~~~
+
+Test suite for the Cli module.
+"""
+import json
+import sys
+from io import BufferedReader, RawIOBase, StringIO
+from math import ceil
+from types import SimpleNamespace
+
+from hamming_check.cli import Cli, cli
+
+
+def run_cli(monkeypatch, *args: str) -> int:
+    """Run the command line interface with the given arguments."""
+
+    monkeypatch.setattr(sys, "argv", ["hamming_check", *args])
+    return Cli().run()
+
+
+class ShortReads(RawIOBase):
+    """A stream returning at most 5 bytes per read, like a slow pipe."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(5, len(buffer), len(self._data))
+        buffer[:size] = self._data[:size]
+        self._data = self._data[size:]
+        return size
+
+
+class TestCli:
+    """Test suite for the Cli module."""
+
+    def test_cli_encode_decode(self, monkeypatch, tmp_path, text_file: str):
+        """Test that a file survives an encode/decode round trip."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+
+        assert run_cli(monkeypatch, "-e", text_file, str(encoded)) == 0
+        assert run_cli(monkeypatch, "-d", str(encoded), str(decoded)) == 0
+
+        with open(text_file, "rb") as f:
+            assert decoded.read_bytes() == f.read()
+
+    def test_cli_encode_error(self, monkeypatch, tmp_path, text_file: str):
+        """Test that an i/o error while encoding is reported."""
+
+        def write(*args):
+            raise OSError("No space left on device")
+
+        stderr = StringIO()
+        monkeypatch.setattr(cli, "stderr", stderr)
+        monkeypatch.setattr(Cli, "_write", write)
+
+        assert (run_cli(monkeypatch, "-e", text_file,
+                        str(tmp_path / "encoded")) == 1
+                and stderr.getvalue() ==
+                "Error encoding data: No space left on device!\n")
+
+    def test_cli_decode_error(self, monkeypatch, tmp_path, text_file: str):
+        """Test that an i/o error while decoding is reported."""
+
+        encoded = tmp_path / "encoded"
+        run_cli(monkeypatch, "-e", text_file, str(encoded))
+
+        def write(*args):
+            raise OSError("No space left on device")
+
+        stderr = StringIO()
+        monkeypatch.setattr(cli, "stderr", stderr)
+        monkeypatch.setattr(Cli, "_write", write)
+
+        assert (run_cli(monkeypatch, "-d", str(encoded),
+                        str(tmp_path / "decoded")) == 1
+                and stderr.getvalue() ==
+                "Error decoding data: No space left on device!\n")
+
+    def test_cli_jobs(self, monkeypatch, tmp_path, bin_file: str):
+        """Test that --jobs gives the same output as a single process."""
+
+        encoded = tmp_path / "encoded"
+        encoded_jobs = tmp_path / "encoded_jobs"
+
+        run_cli(monkeypatch, "-e", "-b", "3", bin_file, str(encoded))
+        run_cli(monkeypatch, "-e", "-b", "3", "-j", "2", bin_file,
+                str(encoded_jobs))
+
+        assert encoded.read_bytes() == encoded_jobs.read_bytes()
+
+    def test_cli_packed_layout(self, monkeypatch, tmp_path, bin_file: str):
+        """Test a packed encode/decode round trip."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+
+        run_cli(monkeypatch, "-e", "--layout", "packed", bin_file,
+                str(encoded))
+        run_cli(monkeypatch, "-d", "--layout", "packed", str(encoded),
+                str(decoded))
+
+        with open(bin_file, "rb") as f:
+            data = f.read()
+        assert (decoded.read_bytes() == data
+                and encoded.stat().st_size == ceil(len(data) * 13 / 8))
+
+    def test_cli_header(self, monkeypatch, tmp_path, bin_file: str):
+        """Test that a header configures the decoder and trims padding."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+
+        run_cli(monkeypatch, "-e", "--header", "-b", "7", "--layout",
+                "packed", bin_file, str(encoded))
+        run_cli(monkeypatch, "-d", str(encoded), str(decoded))
+
+        with open(bin_file, "rb") as f:
+            assert decoded.read_bytes() == f.read()
+
+    def test_cli_header_short_reads(self, monkeypatch, tmp_path,
+                                    bin_file: str):
+        """Test that a header arriving in short reads of a pipe is read
+        whole, and that a stream only starting like one is kept whole."""
+
+        encoded = tmp_path / "encoded"
+        headerless = tmp_path / "headerless"
+        decoded = tmp_path / "decoded"
+        run_cli(monkeypatch, "-e", "--header", "-b", "3", bin_file,
+                str(encoded))
+        headerless.write_bytes(b"\x89H\x00\x01")
+        exit_values = [run_cli(monkeypatch, "-d", str(headerless),
+                               str(decoded))]
+        outputs = [decoded.read_bytes()]
+        for path in (encoded, headerless):
+            monkeypatch.setattr(sys, "stdin", SimpleNamespace(
+                buffer=BufferedReader(ShortReads(path.read_bytes()))))
+            exit_values.append(run_cli(monkeypatch, "-d", "-",
+                                       str(decoded)))
+            outputs.append(decoded.read_bytes())
+
+        with open(bin_file, "rb") as f:
+            assert (outputs[1] == f.read() and outputs[2] == outputs[0]
+                    and exit_values[1] == 0
+                    and exit_values[2] == exit_values[0])
+
+    def test_cli_offset_length(self, monkeypatch, tmp_path, text_file: str):
+        """Test decoding a byte range of the original data."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+
+        run_cli(monkeypatch, "-e", "--header", "-b", "2", text_file,
+                str(encoded))
+        run_cli(monkeypatch, "-d", "--offset", "1", "--length", "4",
+                str(encoded), str(decoded))
+
+        with open(text_file, "rb") as f:
+            assert decoded.read_bytes() == f.read()[1:5]
+
+    def test_cli_interleave(self, monkeypatch, tmp_path, bin_file: str):
+        """Test an interleaved encode/decode round trip through a header."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+
+        run_cli(monkeypatch, "-e", "--header", "-b", "3", "-i", "5",
+                bin_file, str(encoded))
+        run_cli(monkeypatch, "-d", str(encoded), str(decoded))
+
+        with open(bin_file, "rb") as f:
+            assert decoded.read_bytes() == f.read()
+
+    def test_cli_hamming_steps(self, monkeypatch, tmp_path, capsys):
+        """Test that -vvv prints the steps of each block right before its
+        result, with the bits covered by each parity bit."""
+
+        original = tmp_path / "original"
+        original.write_bytes(b"AB")
+        run_cli(monkeypatch, "-e", "-vvv", str(original),
+                str(tmp_path / "encoded"))
+        lines = capsys.readouterr().out.splitlines()
+
+        assert ([line for line in lines if "Encod" in line] == [
+            "\tEncoding b'A' -> 10000010", "0: Encoded b'A' -> b'\\t\\t'",
+            "\tEncoding b'B' -> 01000010", "1: Encoded b'B' -> b'5\\t'"
+        ] and lines[4:8] == [
+            "\t\tC1 -> 10001 -> 0", "\t\tC2 -> 10001 -> 0",
+            "\t\tC4 -> 0000 -> 0", "\t\tC8 -> 0010 -> 1"
+        ])
+
+    def test_cli_stats(self, monkeypatch, tmp_path, text_file: str):
+        """Test that --stats counts the blocks and bytes of a run."""
+
+        encoded = tmp_path / "encoded"
+        decoded = tmp_path / "decoded"
+        run_cli(monkeypatch, "-e", text_file, str(encoded))
+        data = bytearray(encoded.read_bytes())
+        data[0] ^= 1
+        encoded.write_bytes(data)
+        stderr = StringIO()
+        monkeypatch.setattr(cli, "stderr", stderr)
+
+        run_cli(monkeypatch, "-d", str(encoded), str(decoded), "--stats",
+                "json")
+        stats = json.loads(stderr.getvalue())
+
+        assert (stats["blocks"] == len(data) // 2
+                and stats["single_error_corrected"] == 1
+                and stats["no_error"] == stats["blocks"] - 1
+                and stats["bytes_in"] == len(data)
+                and stats["bytes_out"] == len(data) // 2)
+
+    def test_cli_trace(self, monkeypatch, tmp_path, text_file: str):
+        """Test that --trace writes the sampled blocks as JSON lines."""
+
+        encoded = tmp_path / "encoded"
+        trace = tmp_path / "trace"
+        run_cli(monkeypatch, "-e", text_file, str(encoded), "--trace",
+                str(trace), "--trace-every", "2")
+        events = [json.loads(line) for line in trace.read_text().splitlines()]
+
+        number_of_blocks = len(encoded.read_bytes()) // 2
+        assert (len(events) == ceil(number_of_blocks / 2)
+                and [event["block"] for event in events] == list(
+                    range(0, number_of_blocks, 2)))
+
+    def test_cli_verify(self, monkeypatch, tmp_path, capsys, text_file: str):
+        """Test that --verify exits with the worst damage found, writing
+        nothing but a summary."""
+
+        encoded = tmp_path / "encoded"
+        stderr = StringIO()
+        monkeypatch.setattr(cli, "stderr", stderr)
+        run_cli(monkeypatch, "-e", text_file, str(encoded), "--header")
+        exit_values = [run_cli(monkeypatch, "--verify", str(encoded))]
+        data = bytearray(encoded.read_bytes())
+        # a single error in the block 1 and a double error in the block 3,
+        # after the 22 bytes header
+        for (byte, bits) in ((22 + 2 * 1, 0b1), (22 + 2 * 3, 0b11)):
+            data[byte] ^= bits
+            encoded.write_bytes(data)
+            exit_values.append(
+                run_cli(monkeypatch, "--verify", "-v", str(encoded)))
+
+        number_of_blocks = ceil((len(data) - 22) / 2)
+        assert (exit_values == [0, 3, 2]
+                and capsys.readouterr().out == "3: Double Error Detected\n"
+                and stderr.getvalue().splitlines()[-1] ==
+                f"Verified {number_of_blocks} blocks: 1 with a single "
+                f"error, 1 with a double error")
+
+    def test_cli_repair(self, monkeypatch, tmp_path):
+        """Test that --repair flips back the single errors of an
+        interleaved file in place, leaving the double errors."""
+
+        original = tmp_path / "original"
+        encoded = tmp_path / "encoded"
+        original.write_bytes(bytes(range(60)))
+        monkeypatch.setattr(cli, "stderr", StringIO())
+        run_cli(monkeypatch, "-e", "-b", "3", "-i", "5", "--header",
+                str(original), str(encoded))
+        data = bytearray(encoded.read_bytes())
+        # the bit j of the word d of a group is at position j * 5 + d: a
+        # double error in the block 0, and a single error in the blocks 2
+        # and 3, after the 22 bytes header
+        data[22] ^= 0b100001
+        data[24] ^= 0b10000010
+        encoded.write_bytes(data)
+        exit_values = [
+            run_cli(monkeypatch, "--repair", str(encoded)),
+            run_cli(monkeypatch, "--verify", str(encoded))
+        ]
+        data[24] ^= 0b10000010
+
+        assert (exit_values == [2, 2] and encoded.read_bytes() == data
+                and cli.stderr.getvalue().splitlines() == [
+                    "Repaired 2 of 20 blocks, 1 with a double error could "
+                    "not be repaired",
+                    "Verified 20 blocks: 0 with a single error, 1 with a "
+                    "double error"
+                ])
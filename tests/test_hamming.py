@@ -4,8 +4,20 @@ tests.test_hamming.py
 
 Test suite for the Hamming module.
 """
-from hamming_check.hamming import DecodeResult, DecodeStatus, Hamming
-from hamming_check.io import Bytes, File
+import json
+import os
+from array import array
+from io import BytesIO, StringIO
+
+import pytest
+
+from hamming_check.hamming import (DecodeResult, DecodeResults, DecodeStatus,
+                                   EncodedFile, Hamming, Interleaver,
+                                   JsonTracer, PrintTracer)
+from hamming_check.hamming._hamming_tables import _HammingTables
+from hamming_check.hamming._table_backend import _TableBackend
+from hamming_check.io import Bytes, File, Header
+from hamming_check.types import BackendTypes, LayoutTypes
 
 
 class TestHamming:
@@ -66,3 +78,457 @@ class TestHamming:
 
         assert (decoded_t.get_status() == DecodeStatus.DOUBLE_ERROR_DETECTED
                 and decoded_t.get_data() != t_bytes)
+
+    def test_hamming_encode_pads_short_input(self, t_bytes: bytes):
+        """Test that a short input is zero padded to the buffer size."""
+
+        hamming = Hamming(2)
+
+        assert hamming.encode(t_bytes) == hamming.encode(t_bytes + b"\x00")
+
+    def test_hamming_encode_too_long_input(self, bytes_three_bytes: bytes):
+        """Test that an input bigger than the buffer size is rejected."""
+
+        hamming = Hamming(2)
+
+        with pytest.raises(ValueError):
+            hamming.encode(bytes_three_bytes)
+
+    def test_hamming_decode_t_global_parity_error(self, t_bytes: bytes,
+                                                  t_hammified: list[int]):
+        """Test that an error on the global parity bit is corrected."""
+
+        hamming = Hamming()
+        t_hammified[0] ^= 1
+        encoded_t = Bytes(t_hammified, endian="little").tobytes()
+
+        decoded_t = hamming.decode(encoded_t)
+
+        assert (decoded_t.get_status() == DecodeStatus.SINGLE_ERROR_CORRECTED
+                and decoded_t.get_data() == t_bytes)
+
+    def test_hamming_decode_every_single_error(self, bytes_three_bytes: bytes):
+        """Test that a single error on any bit of a hamming word is fixed."""
+
+        hamming = Hamming(3)
+        encoded = hamming.encode(bytes_three_bytes)
+
+        for i in range(hamming._number_of_output_bits):
+            corrupted = bytearray(encoded)
+            corrupted[i // 8] ^= 1 << (i % 8)
+
+            decoded = hamming.decode(corrupted)
+
+            assert (decoded.get_status() == DecodeStatus.SINGLE_ERROR_CORRECTED
+                    and decoded.get_data() == bytes_three_bytes)
+
+    def test_hamming_encode_many(self, bytes_three_bytes: bytes):
+        """Test that encode_many matches encoding each block."""
+
+        hamming = Hamming(2)
+        encoded = hamming.encode_many(bytes_three_bytes)
+
+        assert encoded == (hamming.encode(bytes_three_bytes[:2]) +
+                           hamming.encode(bytes_three_bytes[2:]))
+
+    def test_hamming_decode_many(self, t_bytes: bytes,
+                                 t_hammified_bit4_flipped: list[int],
+                                 t_hammified_bit4_bit11_flipped: list[int]):
+        """Test that decode_many reports the status of each block."""
+
+        hamming = Hamming()
+        encoded = (hamming.encode(t_bytes) +
+                   Bytes(t_hammified_bit4_flipped, endian="little").tobytes() +
+                   Bytes(t_hammified_bit4_bit11_flipped,
+                         endian="little").tobytes())
+
+        decoded, statuses = hamming.decode_many(encoded)
+
+        assert (decoded[:2] == t_bytes * 2 and list(statuses) == [
+            DecodeStatus.NO_ERROR, DecodeStatus.SINGLE_ERROR_CORRECTED,
+            DecodeStatus.DOUBLE_ERROR_DETECTED
+        ])
+
+    def test_hamming_numpy_backend(self, bytes_three_bytes: bytes):
+        """Test that the numpy backend matches the python backend."""
+
+        pytest.importorskip("numpy")
+        python_hamming = Hamming(2, backend=BackendTypes.PYTHON)
+        numpy_hamming = Hamming(2, backend=BackendTypes.NUMPY)
+
+        encoded = python_hamming.encode_many(bytes_three_bytes * 5)
+        corrupted = bytearray(encoded)
+        corrupted[0] ^= 1 << 3
+        corrupted[4] ^= 1 << 1
+        corrupted[5] ^= 1 << 2
+
+        assert (numpy_hamming.encode_many(bytes_three_bytes * 5) == encoded
+                and python_hamming.decode_many(corrupted)
+                == numpy_hamming.decode_many(corrupted))
+
+    def test_hamming_table_backend(self):
+        """Test the table backend against every possible hamming word."""
+
+        python_hamming = Hamming(backend=BackendTypes.PYTHON)
+        table_hamming = Hamming(backend=BackendTypes.TABLE)
+        every_word = b"".join(
+            i.to_bytes(2, byteorder="little") for i in range(2**16))
+
+        assert (table_hamming.encode_many(bytes(range(256)))
+                == python_hamming.encode_many(bytes(range(256)))
+                and table_hamming.decode_many(every_word)
+                == python_hamming.decode_many(every_word))
+
+    def test_hamming_auto_backend(self):
+        """Test that the table backend is picked for small buffer sizes."""
+
+        assert (Hamming(1).get_backend() == BackendTypes.TABLE
+                and Hamming(16).get_backend() != BackendTypes.TABLE)
+
+    def test_hamming_tables(self):
+        """Test the code tables against their definition, and that they
+        and the table and numpy backends are shared by the same buffer
+        sizes."""
+
+        for buffer_size in (1, 3, 127, 300):
+            hamming = Hamming(buffer_size)
+            number_of_output_bits = hamming.get_number_of_output_bits()
+            powers_of_two = {2**i for i in range(number_of_output_bits)}
+            masks = [
+                sum(1 << j for j in range(3, number_of_output_bits)
+                    if j & (2**i) and j not in powers_of_two)
+                for i in range(len(hamming._parity_masks))
+            ]
+            data_bits_indexes = [
+                j for j in range(1, number_of_output_bits)
+                if j not in powers_of_two
+            ]
+
+            # the python backend, used without numpy, is not shared
+            shared = hamming.get_backend() != BackendTypes.PYTHON
+            assert (hamming._parity_masks == masks
+                    and list(hamming._data_bits_indexes) == data_bits_indexes
+                    and Hamming(buffer_size)._tables is hamming._tables
+                    and (Hamming(buffer_size)._backend is hamming._backend
+                         or not shared))
+
+    def test_hamming_tables_cache_dir(self, monkeypatch, tmp_path,
+                                      bytes_three_bytes: bytes):
+        """Test that the tables and the table backend are loaded from the
+        cache directory instead of built."""
+
+        encoded = Hamming(3, cache_dir=str(tmp_path)).encode_many(
+            bytes_three_bytes)
+        _HammingTables.get.__func__.cache_clear()
+
+        def build(*args):
+            raise AssertionError("The tables were built again")
+
+        monkeypatch.setattr(_HammingTables, "__init__", build)
+        monkeypatch.setattr(_TableBackend, "__init__", build)
+        hamming = Hamming(3, cache_dir=str(tmp_path))
+
+        assert (len(list(tmp_path.iterdir())) == 1
+                and hamming.encode_many(bytes_three_bytes) == encoded)
+
+    def test_hamming_tables_cache_dir_corrupted(self, monkeypatch, tmp_path,
+                                                bytes_three_bytes: bytes):
+        """Test that a corrupted file of the cache directory is built
+        again, and that a failed save leaves no temporary file behind."""
+
+        encoded = Hamming(3).encode_many(bytes_three_bytes)
+        _HammingTables.get.__func__.cache_clear()
+        Hamming(3, cache_dir=str(tmp_path))
+        (path, ) = tmp_path.iterdir()
+        state = json.loads(path.read_text())
+        state["backends"]["_TableBackend"]["encode_tables"][0][0][1] = "00"
+        path.write_text(json.dumps(state))
+        _HammingTables.get.__func__.cache_clear()
+
+        def replace(*args):
+            raise OSError("Read-only file system")
+
+        monkeypatch.setattr(os, "replace", replace)
+        hamming = Hamming(3, cache_dir=str(tmp_path))
+        _HammingTables.get.__func__.cache_clear()
+
+        assert (hamming.encode_many(bytes_three_bytes) == encoded
+                and list(tmp_path.iterdir()) == [path])
+
+    def test_hamming_packed_layout(self, bytes_three_bytes: bytes):
+        """Test that the packed layout drops the padding of every block."""
+
+        padded_hamming = Hamming()
+        packed_hamming = Hamming(layout=LayoutTypes.PACKED)
+        data = bytes_three_bytes * 7
+
+        packed = packed_hamming.encode_many(data)
+        corrupted = bytearray(packed)
+        corrupted[5] ^= 1 << 6
+
+        assert (len(packed) == packed_hamming.get_encoded_size(len(data))
+                == 35 and packed_hamming.decode_many(corrupted)[0] == data
+                and packed_hamming.decode_many(packed)
+                == padded_hamming.decode_many(
+                    padded_hamming.encode_many(data)))
+
+    def test_hamming_interleave_burst(self, bytes_three_bytes: bytes):
+        """Test that a burst of depth bits is corrected when interleaved."""
+
+        hamming = Hamming(interleave_depth=8)
+        data = bytes_three_bytes * 6
+        encoded = bytearray(hamming.encode_many(data))
+        # an 8 bits burst across bytes 4 and 5
+        encoded[4] ^= 0xF0
+        encoded[5] ^= 0x0F
+
+        decoded, statuses = hamming.decode_many(encoded)
+
+        assert (decoded == data and DecodeStatus.DOUBLE_ERROR_DETECTED
+                not in statuses
+                and list(statuses).count(DecodeStatus.SINGLE_ERROR_CORRECTED)
+                == 8)
+
+    @pytest.mark.parametrize(
+        "backend",
+        [BackendTypes.PYTHON, BackendTypes.TABLE, BackendTypes.NUMPY])
+    def test_hamming_encode_decode_into(self, bytes_three_bytes: bytes,
+                                        backend: BackendTypes):
+        """Test that encode_into and decode_into write to the given
+        buffers what encode_many and decode_many return."""
+
+        if backend == BackendTypes.NUMPY:
+            pytest.importorskip("numpy")
+        hamming = Hamming(3, backend=backend)
+        data = bytes_three_bytes * 10
+        encoded = bytearray(hamming.get_encoded_size(len(data)) + 1)
+
+        size = hamming.encode_into(memoryview(data), encoded)
+        assert (size == len(encoded) - 1
+                and encoded[:size] == hamming.encode_many(data))
+
+        encoded[0] ^= 1 << 5
+        decoded = bytearray(len(data))
+        statuses = bytearray(10)
+        hamming.decode_into(encoded[:size], decoded, statuses)
+
+        assert (decoded == data
+                and statuses[0] == DecodeStatus.SINGLE_ERROR_CORRECTED
+                and statuses[1:] == bytes(9))
+
+    @pytest.mark.parametrize(
+        "backend",
+        [BackendTypes.PYTHON, BackendTypes.TABLE, BackendTypes.NUMPY])
+    def test_hamming_backend_syndromes(self, bytes_three_bytes: bytes,
+                                       backend: BackendTypes):
+        """Test that every backend gives the syndromes as an array('I'),
+        from decode_many, verify_many and decode_into alike."""
+
+        if backend == BackendTypes.NUMPY:
+            pytest.importorskip("numpy")
+        hamming = Hamming(3, backend=backend)
+        encoded = bytearray(hamming.encode_many(bytes_three_bytes * 10))
+        encoded[4] ^= 1 << 3
+        syndromes = array("I", bytes(4 * 10))
+        hamming._backend.decode_into(memoryview(encoded),
+                                     memoryview(bytearray(30)),
+                                     memoryview(bytearray(10)),
+                                     memoryview(syndromes))
+        results = [
+            hamming.decode_many(encoded).get_syndromes(),
+            hamming.verify_many(encoded).get_syndromes(), syndromes
+        ]
+
+        assert all(
+            isinstance(result, array) and result.typecode == "I"
+            and result[1] == 3 for result in results)
+
+    @pytest.mark.parametrize(
+        "backend",
+        [BackendTypes.PYTHON, BackendTypes.TABLE, BackendTypes.NUMPY])
+    def test_hamming_verify_many(self, bytes_three_bytes: bytes,
+                                 backend: BackendTypes):
+        """Test that verify_many gives the statuses and syndromes of
+        decode_many, without the data."""
+
+        if backend == BackendTypes.NUMPY:
+            pytest.importorskip("numpy")
+        hamming = Hamming(3, backend=backend, interleave_depth=2)
+        encoded = bytearray(hamming.encode_many(bytes_three_bytes * 10))
+        encoded[3] ^= 1 << 2
+        encoded[12] ^= 0b101
+        decoded = hamming.decode_many(encoded)
+        verified = hamming.verify_many(encoded)
+
+        assert (verified.get_data() == b""
+                and verified.get_statuses() == decoded.get_statuses()
+                and verified.get_corrected_bits()
+                == decoded.get_corrected_bits()
+                and verified.double_error_indexes()
+                == decoded.double_error_indexes() != [])
+
+    @pytest.mark.parametrize("layout, interleave_depth",
+                             [(LayoutTypes.PADDED, 1),
+                              (LayoutTypes.PACKED, 1),
+                              (LayoutTypes.PADDED, 4)])
+    def test_hamming_get_bit_offset(self, bytes_three_bytes: bytes,
+                                    layout: LayoutTypes,
+                                    interleave_depth: int):
+        """Test that flipping the bit at get_bit_offset of every block,
+        with a short last interleaved group, gives single errors on that
+        bit of that block."""
+
+        hamming = Hamming(3,
+                          layout=layout,
+                          interleave_depth=interleave_depth)
+        encoded = bytearray(hamming.encode_many(bytes_three_bytes * 10))
+        for block in range(10):
+            offset = hamming.get_bit_offset(block, 3 + block, 10)
+            encoded[offset // 8] ^= 1 << (offset % 8)
+
+        assert hamming.verify_many(encoded).get_corrected_bits() == [
+            (block, 3 + block) for block in range(10)
+        ]
+
+    def test_hamming_into_small_buffer(self, bytes_three_bytes: bytes):
+        """Test that too small or read-only output buffers are refused."""
+
+        hamming = Hamming(3)
+
+        with pytest.raises(ValueError):
+            hamming.encode_into(bytes_three_bytes, bytearray(3))
+        with pytest.raises(ValueError):
+            hamming.decode_into(hamming.encode_many(bytes_three_bytes),
+                                bytes(3))
+
+
+class TestDecodeResults:
+    """Test suite for DecodeResult and DecodeResults classes."""
+
+    def test_decode_result_slots(self, t_bytes: bytes):
+        """Test that a DecodeResult has no instance dict, and holds the
+        corrected bit."""
+        hamming = Hamming()
+        encoded = bytearray(hamming.encode(t_bytes))
+        encoded[0] ^= 1 << 6
+
+        result = hamming.decode(bytes(encoded))
+
+        assert not hasattr(result, "__dict__")
+        assert (result.get_data() == t_bytes
+                and result.get_status() == DecodeStatus.SINGLE_ERROR_CORRECTED
+                and result.get_corrected_bit() == 6)
+
+    def test_decode_results_queries(self, bytes_three_bytes: bytes):
+        """Test the queries of the results of many blocks."""
+        hamming = Hamming()
+        encoded = bytearray(hamming.encode_many(bytes_three_bytes * 4))
+        encoded[2] ^= 1 << 3
+        encoded[10] ^= 0b11
+        encoded[20] ^= 0b101
+
+        results = hamming.decode_many(bytes(encoded))
+        (data, statuses) = results
+
+        assert isinstance(results, DecodeResults)
+        assert (data == results.get_data()
+                and statuses == results.get_statuses()
+                and results.get_number_of_blocks() == 12)
+        assert (results.double_error_indexes() == [5, 10]
+                and results.single_error_indexes() == [1]
+                and results.get_corrected_bits() == [(1, 3)]
+                and results.count(DecodeStatus.NO_ERROR) == 9)
+        assert results.slice(4, 6).double_error_indexes() == [1]
+
+
+class TestInterleaver:
+    """Test suite for the Interleaver module."""
+
+    def test_interleaver_bits(self):
+        """Test that the bit j of the word d is sent at j * depth + d."""
+
+        interleaver = Interleaver(2, 1)
+
+        assert (interleaver.interleave(b"\xff\x00") == b"\x55\x55"
+                and interleaver.deinterleave(b"\x55\x55") == b"\xff\x00")
+
+    def test_interleaver_last_group(self, bytes_three_bytes: bytes):
+        """Test that a last short group is interleaved on its own."""
+
+        interleaver = Interleaver(4, 3)
+        words = bytes_three_bytes * 6
+
+        assert (interleaver.interleave(words)[12:] == Interleaver(
+            2, 3).interleave(words[12:])
+                and interleaver.deinterleave(interleaver.interleave(words))
+                == words)
+
+
+class TestTracer:
+    """Test suite for the tracers of the hamming steps."""
+
+    def test_tracer_json_events(self, t_bytes: bytes):
+        """Test that a JsonTracer writes one event per encoded/decoded
+        block."""
+        trace = StringIO()
+        hamming = Hamming(tracer=JsonTracer(trace))
+        encoded = bytearray(hamming.encode(t_bytes))
+        encoded[0] ^= 1 << 3
+        hamming.decode(bytes(encoded))
+
+        (encode_event, decode_event) = [
+            json.loads(line) for line in trace.getvalue().splitlines()
+        ]
+        assert (encode_event["event"] == "encode"
+                and encode_event["input"] == t_bytes.hex()
+                and len(encode_event["parity"]) == 4)
+        assert (decode_event["event"] == "decode"
+                and decode_event["block"] == 1
+                and decode_event["syndrome"] == 3
+                and decode_event["status"] == "SINGLE_ERROR_CORRECTED"
+                and decode_event["output_bits"] == encode_event["output_bits"])
+
+    def test_tracer_sampling(self, bytes_three_bytes: bytes):
+        """Test that only 1 in every blocks is traced, and that quiet
+        hamming codes have no tracer."""
+        trace = StringIO()
+        hamming = Hamming(tracer=PrintTracer(every=2, file=trace))
+        (data, _) = hamming.decode_many(hamming.encode_many(bytes_three_bytes))
+
+        assert data == bytes_three_bytes
+        assert (trace.getvalue().count("Encoding") == 2
+                and trace.getvalue().count("Decoding") == 1)
+        assert Hamming().get_tracer() is None
+
+
+class TestEncodedFile:
+    """Test suite for the EncodedFile module."""
+
+    def test_encoded_file_decode_range(self, bytes_three_bytes: bytes):
+        """Test decoding a byte range straight from its blocks."""
+
+        data = bytes_three_bytes * 11
+        hamming = Hamming(2, layout=LayoutTypes.PACKED)
+        encoded_file = EncodedFile(BytesIO(
+            Header(2, LayoutTypes.PACKED, len(data)).to_bytes() +
+            hamming.encode_many(data)))
+
+        decoded, statuses = encoded_file.decode_range(19, 9)
+
+        assert (encoded_file.get_size() == 33 and decoded == data[19:28]
+                and list(statuses) == [DecodeStatus.NO_ERROR] * 5
+                and encoded_file.decode_range(30)[0] == data[30:])
+
+    def test_encoded_file_double_error(self, bytes_three_bytes: bytes):
+        """Test that only the blocks covering the range are checked."""
+
+        hamming = Hamming(3)
+        encoded = bytearray(hamming.encode_many(bytes_three_bytes * 4))
+        encoded[hamming.get_number_of_output_bytes()] ^= 0b11
+        encoded_file = EncodedFile(BytesIO(encoded), buffer_size=3)
+
+        assert (list(encoded_file.decode_range(0, 3)[1]) == [
+            DecodeStatus.NO_ERROR
+        ] and list(encoded_file.decode_range(2, 2)[1]) == [
+            DecodeStatus.NO_ERROR, DecodeStatus.DOUBLE_ERROR_DETECTED
+        ])
@@ -4,10 +4,15 @@ tests.test_io.py
 
 Test suite for the io module
 """
+from io import RawIOBase
+
+import pytest
+
 from hamming_check.hamming import DecodeResult, DecodeStatus, Hamming
-from hamming_check.io import Bytes, File
+from hamming_check.io import BitPacker, Bytes, File, Header, MappedFile
 from hamming_check.io._bytes_bit_iterator import _BytesBitIterator
 from hamming_check.io._file_byte_iterator import _FileByteIterator
+from hamming_check.types import LayoutTypes
 
 
 class TestBytes:
@@ -106,3 +111,138 @@ class TestFile:
         bytes.frombytes(bytes_generated[0])
 
         assert bytes_generated[0] == bytes.tobytes()
+
+    def test_file_small_chunks(self, text_file: str,
+                               text_file_four_bytes: list[bytes]):
+        """Test reading a file in chunks smaller than the file."""
+
+        with open(text_file, "rb") as f:
+            file = File(f, bytes_per_read=4, chunk_size=4)
+            bytes_generated = [bytes(i) for i in file]
+
+        assert bytes_generated == text_file_four_bytes
+
+    def test_file_short_reads(self, text_file: str,
+                              text_file_four_bytes: list[bytes]):
+        """Test that short reads, as from pipes, still give whole blocks."""
+
+        class ShortReader(RawIOBase):
+
+            def __init__(self, data: bytes):
+                self._data = data
+
+            def readinto(self, b) -> int:
+                if not self._data:
+                    return 0
+                b[0], self._data = self._data[0], self._data[1:]
+                return 1
+
+        with open(text_file, "rb") as f:
+            file = File(ShortReader(f.read()), bytes_per_read=4)
+            bytes_generated = [bytes(i) for i in file]
+
+        assert bytes_generated == text_file_four_bytes
+
+
+class TestMappedFile:
+    """
+    Test Suite for the MappedFile class
+    """
+
+    def test_mapped_file_four_bytes(self, text_file: str,
+                                    text_file_four_bytes: list[bytes]):
+        """Test reading a mapped file four bytes at a time."""
+
+        with open(text_file, "rb") as f:
+            assert MappedFile.can_map(f)
+
+            file = MappedFile(f, bytes_per_read=4)
+            bytes_generated = [i for i in file]
+            file.close()
+
+        assert bytes_generated == text_file_four_bytes
+
+    def test_mapped_file_write(self, tmp_path, text_file_four_bytes):
+        """Test writing a mapped file preallocated to its final size."""
+
+        path = tmp_path / "mapped"
+
+        file = MappedFile(open(path, "wb"), size=6)
+        for data in text_file_four_bytes:
+            file.write(data)
+        file.close()
+
+        assert path.read_bytes() == b"".join(text_file_four_bytes)
+
+
+class TestBitPacker:
+    """
+    Test Suite for the BitPacker class
+    """
+
+    def test_bit_packer_pack(self):
+        """Test packing 13 bits words stored in 2 bytes."""
+
+        packer = BitPacker(13, 2)
+        words = b"".join(
+            word.to_bytes(2, byteorder="little")
+            for word in (0x1FFF, 0x0001, 0x1000))
+
+        assert (packer.pack(words) == (0x1000 << 26 | 0x0001 << 13
+                                       | 0x1FFF).to_bytes(5, "little")
+                and packer.unpack(packer.pack(words)) == words)
+
+    def test_bit_packer_big_words(self, bytes_three_bytes: bytes):
+        """Test that words too big for the tables survive a round trip."""
+
+        packer = BitPacker(8 * 20 - 3, 20)
+        words = bytes_three_bytes * 20
+        words = bytes(b & (0x1F if i % 20 == 19 else 0xFF)
+                      for (i, b) in enumerate(words))
+
+        assert (len(packer.pack(words)) == packer.get_packed_size(3) == 59
+                and packer.unpack(packer.pack(words)) == words)
+
+
+class TestHeader:
+    """
+    Test Suite for the Header class
+    """
+
+    def test_header_round_trip(self):
+        """Test that a header survives being written and parsed."""
+
+        header = Header.from_bytes(
+            Header(4096, LayoutTypes.PACKED, 300001).to_bytes())
+
+        assert (header.buffer_size == 4096
+                and header.layout == LayoutTypes.PACKED
+                and header.length == 300001)
+
+    def test_header_unknown_length(self):
+        """Test that an unknown length is written as all ones."""
+
+        data = Header(3).to_bytes()
+
+        assert (len(data) == Header.SIZE and Header.is_header(data)
+                and data[Header.LENGTH_OFFSET:Header.LENGTH_OFFSET + 8]
+                == b"\xff" * 8
+                and Header.from_bytes(data).length is None)
+
+    def test_header_version_1(self):
+        """Test that a version 1 header, without depth, is still read."""
+
+        header = Header.from_bytes(
+            Header(3, length=7, version=1).to_bytes() + b"data")
+
+        assert (header.get_size() == 18 and header.depth == 1
+                and header.length == 7)
+
+    def test_header_unsupported_version(self):
+        """Test that a header of an unknown version is rejected."""
+
+        data = bytearray(Header(3).to_bytes())
+        data[len(Header.MAGIC)] = Header.VERSION + 1
+
+        with pytest.raises(ValueError):
+            Header.from_bytes(data)
@@ -0,0 +1,190 @@
+"""
+tests.test_stream.py
+~~~~~~~~~~~~~~~~~~~~
+
+Test suite for the stream module.
+"""
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from math import ceil
+from threading import Thread
+
+from hamming_check.hamming import DecodeStatus, Hamming
+from hamming_check.stream import (AsyncCodec, FramedReceiver, FramedSender,
+                                  decode_stream, encode_stream, noise_stream,
+                                  read_stream, rechunk, stats_stream,
+                                  write_stream)
+from hamming_check.types import LayoutTypes
+from hamming_check.utils import Stats
+
+
+async def code_stream(codec: AsyncCodec, method: str, data: bytes):
+    """Code data through a reader and a writer over a socket pair."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+
+    (left, right) = socket.socketpair()
+    (_, writer) = await asyncio.open_connection(sock=left)
+    (output, _) = await asyncio.open_connection(sock=right)
+
+    stats = await getattr(codec, method)(reader, writer)
+    writer.close()
+    await writer.wait_closed()
+    return await output.read(), stats
+
+
+class TestAsyncCodec:
+    """Test suite for AsyncCodec class."""
+
+    def test_async_codec_round_trip(self, bytes_three_bytes: bytes):
+        """Test that a stream is encoded and decoded back in many batches,
+        correcting a single error."""
+        data = bytes_three_bytes * 1000
+        codec = AsyncCodec(Hamming(3, layout=LayoutTypes.PACKED),
+                           batch_size=64)
+
+        (encoded, encode_stats) = asyncio.run(
+            code_stream(codec, "encode", data))
+        corrupted = bytearray(encoded)
+        corrupted[100] ^= 1 << 4
+        (decoded, decode_stats) = asyncio.run(
+            code_stream(codec, "decode", bytes(corrupted)))
+
+        assert len(data) > 10 * codec.get_blocks_per_batch() * 3
+        assert decoded[:len(data)] == data
+        assert (encode_stats.blocks == 1000
+                and encode_stats.bytes_out == len(encoded))
+        assert decode_stats.statuses[
+            DecodeStatus.SINGLE_ERROR_CORRECTED] == 1
+
+    def test_async_codec_executor(self, bytes_three_bytes: bytes):
+        """Test that the batches are coded in an executor."""
+        data = bytes_three_bytes * 100
+        with ThreadPoolExecutor(1) as executor:
+            codec = AsyncCodec(Hamming(3), executor=executor,
+                               executor_threshold=0)
+            (encoded, _) = asyncio.run(code_stream(codec, "encode", data))
+            (decoded, stats) = asyncio.run(
+                code_stream(codec, "decode", encoded))
+
+        assert decoded == data
+        assert stats.statuses[DecodeStatus.NO_ERROR] == 100
+
+
+class CorruptingSender(FramedSender):
+    """Sender flipping two bits of some hamming words the first time they
+    are sent, interleaved with a depth of 4."""
+
+    def __init__(self, *args, blocks=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blocks = set(blocks)
+        self.sent = 0
+
+    def encode(self, data: bytes) -> bytes:
+        encoded = bytearray(super().encode(data))
+        number_of_output_bytes = self._hamming.get_number_of_output_bytes()
+        for i in range(len(data) // self._hamming.get_buffer_size()):
+            if self.sent + i in self.blocks:
+                encoded[i // 4 * 4 * number_of_output_bytes] ^= (
+                    0b10001 << i % 4)
+                self.blocks.discard(self.sent + i)
+        self.sent += len(data) // self._hamming.get_buffer_size()
+        return bytes(encoded)
+
+
+def transfer(sender: FramedSender, receiver: FramedReceiver, data: bytes):
+    """Send data from a sender to a receiver in another thread."""
+    output = BytesIO()
+    thread = Thread(target=sender.send, args=(BytesIO(data), ))
+    thread.start()
+    stats = receiver.receive(output)
+    thread.join()
+    return output.getvalue(), stats
+
+
+class TestFramedTransport:
+    """Test suite for FramedSender and FramedReceiver classes."""
+
+    def test_framed_transport_trims_padding(self, bytes_three_bytes: bytes):
+        """Test that the original data is received over many frames, without
+        the padding of the last block."""
+        data = bytes_three_bytes * 1000 + b"x"
+        (left, right) = socket.socketpair()
+        hamming = Hamming(4)
+
+        (received, stats) = transfer(FramedSender(left, hamming, 256),
+                                     FramedReceiver(right, hamming, 256), data)
+
+        assert received == data
+        assert stats.blocks == ceil(len(data) / 4)
+
+    def test_framed_transport_retransmit(self, bytes_three_bytes: bytes):
+        """Test that the blocks with a double error are sent again."""
+        data = bytes_three_bytes * 100
+        (left, right) = socket.socketpair()
+        hamming = Hamming(3, interleave_depth=4)
+        sender = CorruptingSender(left, hamming, retransmit=True,
+                                  blocks=(0, 57, 99))
+        receiver = FramedReceiver(right, hamming, retransmit=True)
+
+        (received, stats) = transfer(sender, receiver, data)
+
+        assert received == data
+        assert receiver.get_double_error_blocks() == []
+        assert stats.statuses[DecodeStatus.DOUBLE_ERROR_DETECTED] == 3
+
+
+class TestPipeline:
+    """Test suite for the pipeline stages."""
+
+    def test_pipeline_round_trip(self, bytes_three_bytes: bytes):
+        """Test that chunks of any size are re-blocked, encoded and decoded
+        back, trimming the padding of the last block."""
+
+        hamming = Hamming(2, interleave_depth=2)
+        data = bytes_three_bytes * 1001
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        (stats, encoded, decoded) = (Stats(), BytesIO(), BytesIO())
+
+        write_stream(encode_stream(chunks, hamming, chunk_size=100), encoded)
+        write_stream(
+            decode_stream(read_stream(BytesIO(encoded.getvalue()), 33, stats),
+                          hamming,
+                          chunk_size=100,
+                          stats=stats,
+                          length=len(data)), decoded, stats)
+
+        assert (encoded.getvalue() == hamming.encode_many(data)
+                and decoded.getvalue() == data
+                and stats.bytes_in == len(encoded.getvalue())
+                and stats.bytes_out == len(data) and stats.blocks ==
+                stats.statuses[DecodeStatus.NO_ERROR] == ceil(len(data) / 2)
+                and [len(chunk) for chunk in rechunk(chunks, 10)][-2:]
+                == [10, len(data) % 10])
+
+    def test_pipeline_noise(self, bytes_three_bytes: bytes):
+        """Test that the noise stage is seeded and flips about the bit
+        error rate of the bits, which the decoder corrects."""
+
+        hamming = Hamming(16)
+        data = bytes_three_bytes * 10000
+        encoded = hamming.encode_many(data)
+        chunks = [encoded[i:i + 1000] for i in range(0, len(encoded), 1000)]
+        noisy = b"".join(noise_stream(chunks, 1e-4, seed=1))
+        flipped = int.from_bytes(bytes(
+            a ^ b for (a, b) in zip(noisy, encoded)), "little").bit_count()
+        stats = Stats()
+        decoded = b"".join(
+            decode_stream(stats_stream([noisy], stats), hamming,
+                          stats=stats))
+
+        assert (noisy == b"".join(noise_stream(chunks, 1e-4, seed=1))
+                and abs(flipped - len(encoded) * 8e-4) < 5 * 8
+                and b"".join(noise_stream(chunks, 0)) == encoded
+                and stats.bytes_in == len(encoded)
+                and stats.statuses[DecodeStatus.SINGLE_ERROR_CORRECTED] > 0
+                and (decoded == data) ==
+                (stats.statuses[DecodeStatus.DOUBLE_ERROR_DETECTED] == 0))
@@ -5,7 +5,7 @@ tests.test_utils.py
 Test suite for the Utils Module
 """
 
-from hamming_check.utils import Utils
+from hamming_check.utils import ErrorInjector, Utils
 
 
 class TestUitls:
@@ -31,3 +31,63 @@ class TestUitls:
         """Test Utils class."""
 
         assert not Utils.is_power_of_two(non_power_of_two_zero) is True
+
+
+def flipped_bits(data: bytes) -> list[int]:
+    """Get the indexes of the bits set in data."""
+    return [
+        8 * i + bit for (i, byte) in enumerate(data) if byte
+        for bit in range(8) if byte >> bit & 1
+    ]
+
+
+class TestErrorInjector:
+    """Test suite for ErrorInjector class."""
+
+    def test_error_injector_channels(self):
+        """Test that the channels flip about the expected number of bits,
+        logging them, and are reproducible for a seed."""
+
+        buffers = [bytearray(1 << 16) for _ in range(3)]
+        error_injector = ErrorInjector(seed=7)
+        flips = [
+            error_injector.inject_bsc(buffers[0], 1e-3),
+            error_injector.inject_bursts(buffers[1], 1e-4, 4)
+        ]
+        log = list(error_injector.get_log())
+        ErrorInjector(seed=7).inject_bsc(buffers[2], 1e-3)
+
+        assert (abs(flips[0] - 2**19 * 1e-3) < 5 * 23
+                and flips[1] % 4 == 0 and 4 * 20 < flips[1] < 4 * 100
+                and sorted(log[:flips[0]]) == flipped_bits(buffers[0])
+                and sorted(log[flips[0]:]) == flipped_bits(buffers[1])
+                and buffers[2] == buffers[0])
+
+    def test_error_injector_bursts_start(self):
+        """Test that a burst can start on the first bit of the buffer."""
+
+        first_bits = []
+        for seed in range(20):
+            error_injector = ErrorInjector(seed)
+            error_injector.inject_bursts(bytearray(4), 0.9, 8)
+            first_bits.append(error_injector.get_log()[0])
+
+        assert min(first_bits) == 0
+
+    def test_error_injector_per_codeword(self, tmp_path):
+        """Test that exactly the asked number of bits of every codeword is
+        flipped, among its first bits."""
+
+        buffer = bytearray(3 * 1000 + 2)
+        error_injector = ErrorInjector(seed=1)
+        flips = error_injector.inject_per_codeword(buffer, 3, 2, 22)
+        log_path = tmp_path / "log"
+        with open(log_path, "w") as log_file:
+            error_injector.write_log(log_file, first_bit=8)
+        bits = flipped_bits(buffer)
+
+        assert (flips == 2000 and len(bits) == 2000
+                and all(bit % 24 < 22 for bit in bits)
+                and {bit // 24 for bit in bits} == set(range(1000))
+                and sorted(int(line) - 8 for line in
+                           log_path.read_text().splitlines()) == bits)